@@ -0,0 +1,118 @@
+"""In-process caches for derived signing accounts and authenticated user records"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import redis
+
+from config import config
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after `ttl_seconds`"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class VersionedTTLCache(TTLCache):
+    """
+    TTLCache whose entries are also checked against a per-key version counter in Redis.
+
+    invalidate() bumps the counter, so an invalidation in one API worker makes every
+    other worker drop its copy on the next read. A hit costs one Redis GET instead of
+    the lookup the cache saves. Callers read version() before loading a value and pass
+    it to set(), so an invalidation that lands during the load is not lost. If Redis is
+    unavailable nothing is cached.
+    """
+
+    def __init__(
+        self, max_entries: int, ttl_seconds: float, name: str, redis_client=None
+    ):
+        super().__init__(max_entries, ttl_seconds)
+        self.key_prefix = f"cache_version:{name}"
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+
+    def version(self, key):
+        """Current version of `key`, or None if Redis cannot be read"""
+        try:
+            return int(self.redis.get(f"{self.key_prefix}:{key}") or 0)
+        except redis.RedisError as e:
+            print(f"⚠️  Cache version read failed for {key}: {e}")
+            return None
+
+    def get(self, key):
+        entry = super().get(key)
+        if entry is None:
+            return None
+        version, value = entry
+        if version != self.version(key):
+            super().invalidate(key)
+            return None
+        return value
+
+    def set(self, key, value, version=None):
+        if version is not None:
+            super().set(key, (version, value))
+
+    def invalidate(self, key):
+        super().invalidate(key)
+        try:
+            self.redis.incr(f"{self.key_prefix}:{key}")
+        except redis.RedisError as e:
+            print(f"⚠️  Cache version bump failed for {key}: {e}")
+
+
+# LocalAccount objects keyed by user id - skips secp256k1/keccak key derivation
+signing_account_cache = TTLCache(
+    config.ACCOUNT_CACHE_MAX_ENTRIES, config.ACCOUNT_CACHE_TTL_SECONDS
+)
+
+# Authenticated user records keyed by user id - skips the Postgres lookup per request.
+# Versioned through Redis so a role or credential change reaches every worker.
+user_credentials_cache = VersionedTTLCache(
+    config.ACCOUNT_CACHE_MAX_ENTRIES, config.USER_CACHE_TTL_SECONDS, "user"
+)
+
+
+def invalidate_user(user_id: int):
+    """Drop everything cached for a user after their roles, credentials or sessions change"""
+    signing_account_cache.invalidate(user_id)
+    user_credentials_cache.invalidate(user_id)
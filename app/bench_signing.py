@@ -0,0 +1,110 @@
+"""
+Benchmark inline vs process-pool transaction signing.
+
+Signs the same set of legacy transactions (like the ones build_transaction produces)
+three ways and prints the throughput of each:
+  - inline: one after another on a single thread
+  - threads: from a thread pool, like concurrent request threads would
+  - pool: through SigningExecutor with SIGNING_POOL_WORKERS-style worker processes
+
+Usage: python bench_signing.py --transactions 2000 --workers 4 --threads 32
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_account import Account
+
+from signing_pool import SigningExecutor
+
+
+def make_transactions(count: int, accounts):
+    transactions = []
+    for i in range(count):
+        account = accounts[i % len(accounts)]
+        transactions.append(
+            (
+                account,
+                {
+                    "from": account.address,
+                    "to": accounts[(i + 1) % len(accounts)].address,
+                    "value": 10**15,
+                    "gas": 300000,
+                    "gasPrice": 10 * 10**9,
+                    "nonce": i // len(accounts),
+                    "chainId": 31337,
+                    "data": "0x" + "ab" * 68,
+                },
+            )
+        )
+    return transactions
+
+
+def timed(label: str, count: int, func):
+    start = time.perf_counter()
+    signed = func()
+    elapsed = time.perf_counter() - start
+    assert len(signed) == count
+    print(f"{label:<28} {elapsed:8.3f}s  {count / elapsed:10.1f} tx/s")
+    return signed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    accounts = [Account.create() for _ in range(args.accounts)]
+    transactions = make_transactions(args.transactions, accounts)
+    print(
+        f"🔐 Signing {args.transactions} transactions from {args.accounts} accounts "
+        f"({os.cpu_count()} CPUs)"
+    )
+
+    inline = timed(
+        "inline",
+        args.transactions,
+        lambda: [account.sign_transaction(txn) for account, txn in transactions],
+    )
+
+    with ThreadPoolExecutor(max_workers=args.threads) as threads:
+        timed(
+            f"threads ({args.threads})",
+            args.transactions,
+            lambda: list(
+                threads.map(
+                    lambda item: item[0].sign_transaction(item[1]), transactions
+                )
+            ),
+        )
+
+        executor = SigningExecutor(workers=args.workers)
+        try:
+            # Start the workers before timing so process startup is not counted
+            executor.sign_many(transactions[: args.workers])
+            timed(
+                f"pool ({args.workers} workers, batch)",
+                args.transactions,
+                lambda: executor.sign_many(transactions),
+            )
+            pooled = timed(
+                f"pool ({args.workers} workers, {args.threads} threads)",
+                args.transactions,
+                lambda: list(
+                    threads.map(lambda item: executor.sign(*item), transactions)
+                ),
+            )
+        finally:
+            executor.shutdown()
+
+    assert [s.raw_transaction for s in inline] == [s.raw_transaction for s in pooled]
+    print("✅ Pooled signatures match inline signatures")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,17 @@ class Config:
 
     # Blockchain configuration
     RPC_URL = os.getenv("RPC_URL", "http://localhost:8545")
+    # Several nodes for latency-aware routing and failover (comma-separated, defaults to RPC_URL)
+    RPC_URLS = [
+        url.strip() for url in os.getenv("RPC_URLS", "").split(",") if url.strip()
+    ] or [RPC_URL]
     ORACLE_PRIVATE_KEY = os.getenv("ORACLE_PRIVATE_KEY")
+    # Extra oracle keys for the signer pool (comma-separated, authorised on EventManager)
+    ORACLE_PRIVATE_KEYS = [
+        key.strip()
+        for key in os.getenv("ORACLE_PRIVATE_KEYS", "").split(",")
+        if key.strip()
+    ]
     EVENT_MANAGER_ADDRESS = os.getenv("EVENT_MANAGER_ADDRESS")
     RESALE_MARKET_ADDRESS = os.getenv("RESALE_MARKET_ADDRESS")
     LOYALTY_POINT_ADDRESS = os.getenv("LOYALTY_POINT_ADDRESS")
@@ -27,6 +37,120 @@ class Config:
     # Blockchain settings
     DEFAULT_GAS = 300000
     DEFAULT_GAS_PRICE_GWEI = "10"
+    # Max number of view calls packed into one JSON-RPC batch request
+    RPC_BATCH_SIZE = int(os.getenv("RPC_BATCH_SIZE", "100"))
+
+    # Block-aware cache for contract view calls
+    READ_CACHE_MAX_ENTRIES = int(os.getenv("READ_CACHE_MAX_ENTRIES", "10000"))
+    READ_CACHE_BLOCK_REFRESH_SECONDS = float(
+        os.getenv("READ_CACHE_BLOCK_REFRESH_SECONDS", "1")
+    )
+    # Upper bound on how many blocks behind latest any cached read may be
+    READ_CACHE_MAX_STALENESS_BLOCKS = int(
+        os.getenv("READ_CACHE_MAX_STALENESS_BLOCKS", "5")
+    )
+    # Staleness accepted by the marketplace listing pages (0 = always latest block)
+    MARKET_LISTINGS_MAX_STALENESS_BLOCKS = int(
+        os.getenv("MARKET_LISTINGS_MAX_STALENESS_BLOCKS", "0")
+    )
+
+    # Oracle signer pool health checks
+    SIGNER_HEALTH_CHECK_SECONDS = float(os.getenv("SIGNER_HEALTH_CHECK_SECONDS", "2"))
+    ORACLE_MIN_BALANCE_ETH = os.getenv("ORACLE_MIN_BALANCE_ETH", "0.05")
+
+    # Per-process caches of derived signing accounts and authenticated users
+    ACCOUNT_CACHE_MAX_ENTRIES = int(os.getenv("ACCOUNT_CACHE_MAX_ENTRIES", "10000"))
+    ACCOUNT_CACHE_TTL_SECONDS = float(os.getenv("ACCOUNT_CACHE_TTL_SECONDS", "900"))
+    USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+    # Background transaction tracker (GET /tx/{hash})
+    TX_TRACKER_POLL_INTERVAL_SECONDS = float(
+        os.getenv("TX_TRACKER_POLL_INTERVAL_SECONDS", "1")
+    )
+    TX_TRACKER_TIMEOUT_SECONDS = int(os.getenv("TX_TRACKER_TIMEOUT_SECONDS", "600"))
+    TX_RESULT_TTL_SECONDS = int(os.getenv("TX_RESULT_TTL_SECONDS", "86400"))
+
+    # Batching window for oracle-signed purchases (0 sends each purchase on its own)
+    PURCHASE_BATCH_WINDOW_MS = int(os.getenv("PURCHASE_BATCH_WINDOW_MS", "0"))
+    PURCHASE_BATCH_MAX_SIZE = int(os.getenv("PURCHASE_BATCH_MAX_SIZE", "50"))
+
+    # Mismatched loyalty redemptions kept for review (loyalty_reconciler.py)
+    LOYALTY_DISCREPANCIES_KEPT = int(os.getenv("LOYALTY_DISCREPANCIES_KEPT", "1000"))
+
+    # Purchase job workers per API process (0 = purchases run inside the request)
+    PURCHASE_WORKERS = int(os.getenv("PURCHASE_WORKERS", "0"))
+    PURCHASE_JOB_TTL_SECONDS = int(os.getenv("PURCHASE_JOB_TTL_SECONDS", "86400"))
+    # Must exceed the longest purchase (it includes a loyalty redemption receipt wait)
+    PURCHASE_JOB_CLAIM_IDLE_SECONDS = float(
+        os.getenv("PURCHASE_JOB_CLAIM_IDLE_SECONDS", "300")
+    )
+    PURCHASE_JOB_BLOCK_MS = int(os.getenv("PURCHASE_JOB_BLOCK_MS", "5000"))
+
+    # Idempotency-Key replay window for purchase endpoints (middleware/idempotency.py)
+    IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    # Must exceed the longest purchase, like PURCHASE_JOB_CLAIM_IDLE_SECONDS
+    IDEMPOTENCY_IN_FLIGHT_TTL_SECONDS = int(
+        os.getenv("IDEMPOTENCY_IN_FLIGHT_TTL_SECONDS", "300")
+    )
+
+    # Seat reservations for primary-sale purchases (inventory.py)
+    INVENTORY_HOLD_TTL_SECONDS = int(
+        os.getenv("INVENTORY_HOLD_TTL_SECONDS", str(TX_TRACKER_TIMEOUT_SECONDS + 60))
+    )
+    INVENTORY_STATE_TTL_SECONDS = int(os.getenv("INVENTORY_STATE_TTL_SECONDS", "60"))
+
+    # RPC routing across RPC_URLS
+    RPC_REQUEST_TIMEOUT_SECONDS = float(os.getenv("RPC_REQUEST_TIMEOUT_SECONDS", "10"))
+    RPC_BREAKER_FAILURES = int(os.getenv("RPC_BREAKER_FAILURES", "3"))
+    RPC_BREAKER_COOLDOWN_SECONDS = float(
+        os.getenv("RPC_BREAKER_COOLDOWN_SECONDS", "15")
+    )
+    RPC_MAX_BLOCK_LAG = int(os.getenv("RPC_MAX_BLOCK_LAG", "3"))
+    RPC_LATENCY_EWMA_ALPHA = float(os.getenv("RPC_LATENCY_EWMA_ALPHA", "0.2"))
+
+    # Node heartbeat - routes read the cached connectivity instead of probing per request
+    HEARTBEAT_INTERVAL_SECONDS = float(os.getenv("HEARTBEAT_INTERVAL_SECONDS", "1"))
+    HEARTBEAT_FAILURE_THRESHOLD = int(os.getenv("HEARTBEAT_FAILURE_THRESHOLD", "2"))
+    HEARTBEAT_STALE_SECONDS = float(os.getenv("HEARTBEAT_STALE_SECONDS", "5"))
+    # Reject requests immediately while the heartbeat reports the node as down
+    RPC_FAST_FAIL = os.getenv("RPC_FAST_FAIL", "true").lower() == "true"
+
+    # Worker processes for transaction signing (0 = sign inline on the request thread)
+    SIGNING_POOL_WORKERS = int(os.getenv("SIGNING_POOL_WORKERS", "0"))
+
+    # Nonce allocation for oracle-signed transactions
+    NONCE_KEY_TTL_SECONDS = int(os.getenv("NONCE_KEY_TTL_SECONDS", "300"))
+
+    # Chain indexer (python -m indexer)
+    INDEXER_START_BLOCK = int(os.getenv("INDEXER_START_BLOCK", "0"))
+    INDEXER_BATCH_BLOCKS = int(os.getenv("INDEXER_BATCH_BLOCKS", "2000"))
+    INDEXER_POLL_INTERVAL_SECONDS = float(
+        os.getenv("INDEXER_POLL_INTERVAL_SECONDS", "2")
+    )
+    # Bulk event import (/events/import and import_events.py)
+    EVENT_IMPORT_MAX_ROWS = int(os.getenv("EVENT_IMPORT_MAX_ROWS", "500"))
+    EVENT_IMPORT_WAIT_SECONDS = int(os.getenv("EVENT_IMPORT_WAIT_SECONDS", "120"))
+    # Largest number of ticket pairs accepted by /events/tickets/swap/check-bulk
+    SWAP_CHECK_MAX_PAIRS = int(os.getenv("SWAP_CHECK_MAX_PAIRS", "1000"))
+    # Default page size of /events/all when it is filtered or paginated
+    EVENTS_PAGE_SIZE = int(os.getenv("EVENTS_PAGE_SIZE", "100"))
+
+    # Catch-up backfill run by the indexer before it follows new blocks
+    BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+    BACKFILL_CONFIRMATIONS = int(os.getenv("BACKFILL_CONFIRMATIONS", "12"))
+    BACKFILL_MAX_CHUNK_BLOCKS = int(os.getenv("BACKFILL_MAX_CHUNK_BLOCKS", "50000"))
+    BACKFILL_TARGET_LOGS_PER_CHUNK = int(
+        os.getenv("BACKFILL_TARGET_LOGS_PER_CHUNK", "5000")
+    )
+    BACKFILL_COMMIT_EVENTS = int(os.getenv("BACKFILL_COMMIT_EVENTS", "5000"))
+    BACKFILL_MAX_RETRIES = int(os.getenv("BACKFILL_MAX_RETRIES", "3"))
+    # Reads fall back to the chain while the index is more than this many blocks behind
+    # the confirmed head (head - BACKFILL_CONFIRMATIONS)
+    INDEX_MAX_LAG_BLOCKS = int(os.getenv("INDEX_MAX_LAG_BLOCKS", "5"))
+    # Per-seller cache of indexed listings (invalidated by the indexer)
+    SELLER_LISTINGS_CACHE_TTL_SECONDS = int(
+        os.getenv("SELLER_LISTINGS_CACHE_TTL_SECONDS", "300")
+    )
 
     # Database configuration
     DATABASE_URL = os.getenv(
@@ -0,0 +1,73 @@
+"""Helpers for packing many contract view calls into JSON-RPC batch requests"""
+
+import itertools
+
+from eth_utils.abi import get_abi_output_types
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+
+def chunked(items, size):
+    """Split a list into consecutive chunks of at most `size` items"""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def encode_call_request(function_call, block_identifier="latest"):
+    """Turn a bound contract function into an (`eth_call`, params) request tuple"""
+    if isinstance(block_identifier, int):
+        block_identifier = hex(block_identifier)
+    return (
+        "eth_call",
+        [
+            {
+                "to": function_call.address,
+                "data": function_call._encode_transaction_data(),
+            },
+            block_identifier,
+        ],
+    )
+
+
+def decode_call_response(codec, function_call, response, allow_failure=False):
+    """
+    Decode one `eth_call` response the same way ContractFunction.call() does.
+
+    Failed or undecodable calls raise ValueError, or return None when
+    `allow_failure` is set so one bad item does not sink the whole batch.
+    """
+    try:
+        if "error" in response:
+            error = response["error"]
+            message = error.get("message") if isinstance(error, dict) else error
+            raise ValueError(f"{function_call.fn_name} call failed: {message}")
+
+        return_data = bytes.fromhex(response["result"][2:])
+        if not return_data:
+            raise ValueError(f"{function_call.fn_name} returned no data")
+
+        output_types = get_abi_output_types(function_call.abi)
+        decoded = codec.decode(output_types, return_data)
+        normalized = map_abi_data(
+            itertools.chain(BASE_RETURN_NORMALIZERS), output_types, decoded
+        )
+    except Exception:
+        if allow_failure:
+            return None
+        raise
+
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
+
+
+def check_batch_response(responses, expected):
+    """Validate a raw provider batch response before decoding it"""
+    if not isinstance(responses, list):
+        # Providers answer a rejected batch with a single error object
+        error = responses.get("error") if isinstance(responses, dict) else responses
+        raise ValueError(f"Batch request failed: {error}")
+    if len(responses) != expected:
+        raise ValueError(
+            f"Batch request returned {len(responses)} responses, expected {expected}"
+        )
+    return responses
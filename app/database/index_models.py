@@ -0,0 +1,156 @@
+"""Tables materialised from contract events by the chain indexer"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    Boolean,
+    DateTime,
+    Numeric,
+    Index,
+)
+from sqlalchemy.sql import func
+from database.db import Base
+
+# uint256 values (wei amounts, ids) do not fit in BIGINT
+Uint256 = Numeric(78, 0)
+
+# Checkpoint of the contract log stream written by `python -m indexer`
+CONTRACTS_CHECKPOINT = "contracts"
+
+
+class IndexerCheckpoint(Base):
+    """Last block fully applied by an indexer stream"""
+
+    __tablename__ = "indexer_checkpoints"
+
+    name = Column(String(50), primary_key=True)
+    block_number = Column(BigInteger, nullable=False)
+    block_hash = Column(String(66), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<IndexerCheckpoint(name={self.name}, block={self.block_number})>"
+
+
+class IndexedEvent(Base):
+    """EventManager event (single or multi-day parent)"""
+
+    __tablename__ = "indexed_events"
+
+    event_id = Column(BigInteger, primary_key=True)
+    organiser = Column(String(42), index=True, nullable=False)
+    name = Column(String, nullable=False)
+    venue = Column(String, nullable=False)
+    date = Column(BigInteger, nullable=False)
+    ticket_price = Column(Uint256, nullable=False)
+    total_tickets = Column(BigInteger, nullable=False)
+    tickets_sold = Column(BigInteger, nullable=False, default=0)
+    is_active = Column(Boolean, nullable=False, default=True)
+    is_multi_day = Column(Boolean, nullable=False, default=False)
+    num_days = Column(Integer, nullable=True)
+    created_block = Column(BigInteger, nullable=False)
+    updated_block = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<IndexedEvent(id={self.event_id}, name={self.name})>"
+
+
+class IndexedSubEvent(Base):
+    """Day of a multi-day event"""
+
+    __tablename__ = "indexed_sub_events"
+
+    sub_event_id = Column(BigInteger, primary_key=True)
+    parent_event_id = Column(BigInteger, index=True, nullable=False)
+    day_index = Column(Integer, nullable=False)
+    date = Column(BigInteger, nullable=False)
+    venue = Column(String, nullable=False)
+    swappable = Column(Boolean, nullable=False)
+    total_tickets = Column(BigInteger, nullable=False)
+    tickets_sold = Column(BigInteger, nullable=False, default=0)
+    created_block = Column(BigInteger, nullable=False)
+    updated_block = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<IndexedSubEvent(id={self.sub_event_id}, parent={self.parent_event_id})>"
+        )
+
+
+class IndexedTicket(Base):
+    """Ticket NFT with its current owner (lowercase address)"""
+
+    __tablename__ = "indexed_tickets"
+
+    ticket_id = Column(BigInteger, primary_key=True)
+    owner = Column(String(42), index=True, nullable=False)
+    event_id = Column(BigInteger, index=True, nullable=False)
+    sub_event_id = Column(BigInteger, nullable=True)
+    is_used = Column(Boolean, nullable=False, default=False)
+    minted_block = Column(BigInteger, nullable=False)
+    updated_block = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<IndexedTicket(id={self.ticket_id}, owner={self.owner})>"
+
+
+class IndexedListing(Base):
+    """Latest ResaleMarket listing of a ticket (active until delisted or sold)"""
+
+    __tablename__ = "indexed_listings"
+
+    ticket_id = Column(BigInteger, primary_key=True)
+    seller = Column(String(42), nullable=False)
+    price = Column(Uint256, nullable=False)
+    event_id = Column(BigInteger, index=True, nullable=False)
+    active = Column(Boolean, nullable=False, default=True)
+    buyer = Column(String(42), nullable=True)
+    royalty = Column(Uint256, nullable=True)
+    listed_block = Column(BigInteger, nullable=False)
+    closed_block = Column(BigInteger, nullable=True)
+
+    __table_args__ = (
+        Index("ix_indexed_listings_active_price", "active", "price"),
+        Index("ix_indexed_listings_seller_active", "seller", "active"),
+    )
+
+    def __repr__(self):
+        return f"<IndexedListing(ticket={self.ticket_id}, active={self.active})>"
+
+
+class IndexedPurchase(Base):
+    """Primary-sale purchase (TicketsPurchased / SubEventTicketsPurchased)"""
+
+    __tablename__ = "indexed_purchases"
+
+    tx_hash = Column(String(66), primary_key=True)
+    log_index = Column(Integer, primary_key=True)
+    event_id = Column(BigInteger, index=True, nullable=False)
+    sub_event_id = Column(BigInteger, nullable=True)
+    buyer = Column(String(42), index=True, nullable=False)
+    quantity = Column(BigInteger, nullable=False)
+    block_number = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<IndexedPurchase(event={self.event_id}, buyer={self.buyer})>"
+
+
+class IndexedSwap(Base):
+    """TicketsSwapped between two holders"""
+
+    __tablename__ = "indexed_swaps"
+
+    tx_hash = Column(String(66), primary_key=True)
+    log_index = Column(Integer, primary_key=True)
+    ticket_id_1 = Column(BigInteger, nullable=False)
+    ticket_id_2 = Column(BigInteger, nullable=False)
+    user_1 = Column(String(42), nullable=False)
+    user_2 = Column(String(42), nullable=False)
+    block_number = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<IndexedSwap(tickets={self.ticket_id_1},{self.ticket_id_2})>"
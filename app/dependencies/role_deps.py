@@ -2,7 +2,10 @@
 
 from typing import List
 from fastapi import Depends, HTTPException, status, Request
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
 
+from account_cache import signing_account_cache
 from database.db import get_db
 from database.db_models import User
 
@@ -83,3 +86,20 @@ def get_user_wallet_credentials(user_info: dict) -> tuple[str, str]:
     wallet_address: str = user_info["wallet_address"]
     private_key: str = get_user_private_key(user_info["user_id"])
     return wallet_address, private_key
+
+
+def get_user_signing_account(user_info: dict) -> LocalAccount:
+    """
+    Get the user's signing account, reusing the cached one when available.
+    On a cache miss the key comes from user_info or the database and is derived once.
+    """
+    user_id = user_info["user_id"]
+    wallet_address: str = user_info["wallet_address"]
+    account = signing_account_cache.get(user_id)
+    if account is None or account.address.lower() != wallet_address.lower():
+        private_key = user_info.get("private_key") or get_user_private_key(user_id)
+        account = Account.from_key(private_key)
+        if account.address.lower() != wallet_address.lower():
+            raise ValueError("Private key does not match wallet address")
+        signing_account_cache.set(user_id, account)
+    return account
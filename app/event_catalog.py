@@ -0,0 +1,320 @@
+"""Incrementally maintained snapshot of every EventManager event, for /events/all"""
+
+import asyncio
+import base64
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+import redis
+
+from config import config
+from web3_manager import async_web3_manager
+
+# EventManager logs that create events or change their mutable fields
+CATALOG_EVENTS = (
+    "EventCreated",
+    "MultiDayEventCreated",
+    "TicketsPurchased",
+    "SubEventTicketsPurchased",
+    "EventClosed",
+)
+
+SNAPSHOT_KEY = "events:catalog"
+
+# Sortable fields of /events/all -> key of one catalog entry
+SORT_FIELDS = {
+    "id": lambda event: event["id"],
+    "date": lambda event: event["date"],
+    "price": lambda event: event["ticketPrice"],
+    "remaining": lambda event: event["totalTickets"] - event["ticketsSold"],
+}
+EVENT_SORTS = ("id",) + tuple(
+    f"{field}_{direction}"
+    for field in ("date", "price", "remaining")
+    for direction in ("asc", "desc")
+)
+
+
+def encode_cursor(sort: str, key: int, event_id: int) -> str:
+    """Opaque cursor pointing just after (key, event_id) in `sort` order"""
+    payload = json.dumps({"s": sort, "k": str(key), "i": event_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str):
+    """(key, event_id) from a cursor; raises ValueError if it is invalid"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, event_id = int(payload["k"]), int(payload["i"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if payload.get("s") != sort:
+        raise ValueError("Cursor was issued for a different sort order")
+    return key, event_id
+
+
+def _event_entry(ev) -> dict:
+    """/events/all representation of an events(i) tuple"""
+    return {
+        "id": int(ev[0]),
+        "organiser": ev[1],
+        "name": ev[2],
+        "venue": ev[3],
+        "date": int(ev[4]),
+        "ticketPrice": int(ev[5]),
+        "totalTickets": int(ev[6]),
+        "ticketsSold": int(ev[7]),
+        "isActive": bool(ev[8]),
+        "isMultiDay": bool(ev[9]),
+    }
+
+
+class EventCatalog:
+    """
+    In-memory copy of all events, kept current from EventManager logs.
+
+    Each event is read with events(i) once, when it first appears. After that only
+    the mutable fields move: ticketsSold from the purchase logs' quantities and
+    isActive from EventClosed. A refresh therefore costs one eth_getLogs for the
+    new blocks plus reads for new events only, and nothing at all while the head
+    block is unchanged. The state is mirrored to Redis so other workers and
+    restarts start from the latest snapshot instead of a full scan.
+    """
+
+    def __init__(self, manager, redis_client=None):
+        self.manager = manager
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.block = None
+        self.events = {}
+        self.sub_event_parents = {}
+        self.body = b"[]"
+        self.etag = None
+        self.orders = {field: ([], []) for field in SORT_FIELDS}
+        self._topics = None
+        self._lock = asyncio.Lock()
+
+    def _decoders(self):
+        if self._topics is None:
+            contract = self.manager.event_manager
+            self._topics = {}
+            for name in CATALOG_EVENTS:
+                event = contract.events[name]()
+                self._topics[event.topic.lower()] = event
+        return self._topics
+
+    def _render(self):
+        events = [self.events[event_id] for event_id in sorted(self.events)]
+        self.body = json.dumps(events, separators=(",", ":")).encode()
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+        # Every sort order precomputed as parallel (key, id) / entry lists
+        for field, key in SORT_FIELDS.items():
+            ranked = sorted(events, key=lambda event: (key(event), event["id"]))
+            self.orders[field] = (
+                [(key(event), event["id"]) for event in ranked],
+                ranked,
+            )
+
+    def _restore(self):
+        """Adopt the Redis snapshot if another worker got further than this one"""
+        try:
+            raw = self.redis.get(SNAPSHOT_KEY)
+        except redis.RedisError as e:
+            print(f"⚠️  Event catalog snapshot unavailable: {e}")
+            return
+        if raw is None:
+            return
+        snapshot = json.loads(raw)
+        if self.block is not None and snapshot["block"] <= self.block:
+            return
+        self.block = snapshot["block"]
+        self.events = {event["id"]: event for event in snapshot["events"]}
+        self.sub_event_parents = {
+            int(sub_id): parent_id
+            for sub_id, parent_id in snapshot["sub_event_parents"].items()
+        }
+        self._render()
+
+    def _save(self):
+        snapshot = {
+            "block": self.block,
+            "events": list(self.events.values()),
+            "sub_event_parents": self.sub_event_parents,
+        }
+        try:
+            self.redis.set(SNAPSHOT_KEY, json.dumps(snapshot))
+        except redis.RedisError as e:
+            print(f"⚠️  Failed to save event catalog snapshot: {e}")
+
+    async def _load_events(self, event_ids, block: int):
+        if not event_ids:
+            return
+        rows = await self.manager.batch_call(
+            [self.manager.event_manager.functions.events(i) for i in event_ids],
+            block_identifier=block,
+        )
+        for row in rows:
+            self.events[int(row[0])] = _event_entry(row)
+
+    async def _load_sub_event_parents(self, sub_event_ids, block: int):
+        if not sub_event_ids:
+            return
+        rows = await self.manager.batch_call(
+            [self.manager.event_manager.functions.subEvents(i) for i in sub_event_ids],
+            block_identifier=block,
+        )
+        for sub_event_id, row in zip(sub_event_ids, rows):
+            self.sub_event_parents[sub_event_id] = int(row[1])
+
+    async def _full_load(self, head: int):
+        count = await self.manager.event_manager.functions.eventCounter().call(
+            block_identifier=head
+        )
+        self.events = {}
+        await self._load_events(list(range(1, count + 1)), head)
+
+    async def _apply_logs(self, from_block: int, head: int):
+        decoders = self._decoders()
+        logs = await self.manager.w3.eth.get_logs(
+            {
+                "fromBlock": from_block,
+                "toBlock": head,
+                "address": self.manager.event_manager.address,
+                "topics": [list(decoders)],
+            }
+        )
+        decoded = []
+        for log in logs:
+            topic = log["topics"][0].to_0x_hex().lower()
+            decoded.append(decoders[topic].process_log(log))
+        decoded.sort(key=lambda event: (event["blockNumber"], event["logIndex"]))
+
+        # New events are read at `head`, which already includes every later change
+        created = {
+            event["args"]["eventId"]
+            for event in decoded
+            if event["event"] in ("EventCreated", "MultiDayEventCreated")
+            and event["args"]["eventId"] not in self.events
+        }
+        await self._load_events(sorted(created), head)
+        await self._load_sub_event_parents(
+            sorted(
+                {
+                    event["args"]["subEventId"]
+                    for event in decoded
+                    if event["event"] == "SubEventTicketsPurchased"
+                }
+                - self.sub_event_parents.keys()
+            ),
+            head,
+        )
+
+        for event in decoded:
+            name, args = event["event"], event["args"]
+            if name == "TicketsPurchased":
+                event_id = args["eventId"]
+            elif name == "SubEventTicketsPurchased":
+                # Sub-event sales also count towards the parent event
+                event_id = self.sub_event_parents[args["subEventId"]]
+            elif name == "EventClosed":
+                event_id = args["eventId"]
+            else:
+                continue
+            entry = self.events.get(event_id)
+            if entry is None or event_id in created:
+                continue
+            if name == "EventClosed":
+                entry["isActive"] = False
+            else:
+                entry["ticketsSold"] += args["quantity"]
+
+    async def refresh(self):
+        """Bring the catalog up to the latest block"""
+        head = await self.manager.latest_block()
+        if self.block is not None and head <= self.block:
+            return
+        async with self._lock:
+            if self.block is not None and head <= self.block:
+                return
+            self._restore()
+            # Deltas are applied in place; roll back if the range fails half-way
+            backup = {event_id: dict(entry) for event_id, entry in self.events.items()}
+            try:
+                if self.block is None:
+                    await self._full_load(head)
+                elif head > self.block:
+                    await self._apply_logs(self.block + 1, head)
+                else:
+                    return
+            except Exception:
+                self.events = backup
+                raise
+            self.block = head
+            self._render()
+            self._save()
+
+    async def query(
+        self,
+        active: Optional[bool] = None,
+        venue: Optional[str] = None,
+        date_from: Optional[int] = None,
+        date_to: Optional[int] = None,
+        organiser: Optional[str] = None,
+        multi_day: Optional[bool] = None,
+        sort: str = "id",
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ):
+        """One page of filtered events and the cursor for the next page (or None)"""
+        await self.refresh()
+        field, _, direction = sort.partition("_")
+        descending = direction == "desc"
+        keys, ranked = self.orders[field]
+
+        # Resume right after the cursor position in the precomputed order
+        if cursor:
+            position = decode_cursor(cursor, sort)
+            if descending:
+                candidates = reversed(ranked[: bisect_left(keys, position)])
+            else:
+                candidates = ranked[bisect_right(keys, position) :]
+        else:
+            candidates = reversed(ranked) if descending else ranked
+
+        venue = venue.lower() if venue else None
+        organiser = organiser.lower() if organiser else None
+        page = []
+        for event in candidates:
+            if (
+                (active is None or event["isActive"] == active)
+                and (venue is None or venue in event["venue"].lower())
+                and (date_from is None or event["date"] >= date_from)
+                and (date_to is None or event["date"] <= date_to)
+                and (organiser is None or event["organiser"].lower() == organiser)
+                and (multi_day is None or event["isMultiDay"] == multi_day)
+            ):
+                page.append(event)
+                # One extra match tells whether another page exists
+                if len(page) > limit:
+                    break
+
+        if len(page) <= limit:
+            return page, None
+        page = page[:limit]
+        last = page[-1]
+        return page, encode_cursor(sort, SORT_FIELDS[field](last), last["id"])
+
+    async def snapshot(self):
+        """(serialised event list, ETag) as of the latest block"""
+        await self.refresh()
+        return self.body, self.etag
+
+
+# Create singleton instance
+event_catalog = EventCatalog(async_web3_manager)
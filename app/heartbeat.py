@@ -0,0 +1,110 @@
+"""Background heartbeat that keeps the node's health, latest block and latency cached"""
+
+import threading
+import time
+
+from config import config
+from rpc_router import RoutingHTTPProvider
+
+
+class NodeHeartbeat:
+    """
+    Polls the node with eth_blockNumber every HEARTBEAT_INTERVAL_SECONDS.
+
+    Routes read the cached state instead of paying an RPC round trip per request.
+    The node is considered down after HEARTBEAT_FAILURE_THRESHOLD consecutive
+    failed beats. State older than HEARTBEAT_STALE_SECONDS (e.g. before the thread
+    has started) is reported as unknown, so callers fall back to a live check.
+    Every successful beat also feeds the latest block into the read cache. With
+    several RPC_URLS every node is probed, and the highest block is reported.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.interval = config.HEARTBEAT_INTERVAL_SECONDS
+        self.failure_threshold = max(config.HEARTBEAT_FAILURE_THRESHOLD, 1)
+        self.stale_after = config.HEARTBEAT_STALE_SECONDS
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._connected = None
+        self._checked_at = 0.0
+        self._latest_block = None
+        self._latency_ms = None
+        self._consecutive_failures = 0
+        self._last_error = None
+
+    def beat(self) -> bool:
+        """Probe the node once and record the outcome"""
+        provider = self.manager.w3.provider
+        start = time.monotonic()
+        try:
+            if isinstance(provider, RoutingHTTPProvider):
+                # Probing every node also refreshes their latency and breakers
+                block_number = provider.probe()
+            else:
+                block_number = self.manager.w3.eth.block_number
+        except Exception as e:
+            self.record_failure(e)
+            return False
+        self.record_success(block_number, (time.monotonic() - start) * 1000)
+        return True
+
+    def record_success(self, block_number: int, latency_ms: float):
+        with self._lock:
+            self._connected = True
+            self._checked_at = time.monotonic()
+            self._latest_block = block_number
+            self._latency_ms = round(latency_ms, 2)
+            self._consecutive_failures = 0
+            self._last_error = None
+        self.manager.read_cache.note_block(block_number)
+
+    def record_failure(self, error):
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._consecutive_failures += 1
+            self._last_error = str(error)
+            if self._consecutive_failures >= self.failure_threshold:
+                if self._connected is not False:
+                    print(f"❌ Blockchain node unreachable: {error}")
+                self._connected = False
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self._checked_at < self.stale_after
+
+    def connected(self):
+        """Cached connectivity: True/False, or None when there is no recent beat"""
+        if self._connected is None or not self.is_fresh():
+            return None
+        return self._connected
+
+    def status(self) -> dict:
+        with self._lock:
+            age = time.monotonic() - self._checked_at if self._checked_at else None
+            return {
+                "connected": self._connected,
+                "fresh": self.is_fresh(),
+                "latest_block": self._latest_block,
+                "latency_ms": self._latency_ms,
+                "consecutive_failures": self._consecutive_failures,
+                "last_checked_seconds_ago": round(age, 2) if age is not None else None,
+                "last_error": self._last_error,
+            }
+
+    def run(self):
+        """Heartbeat loop for the background thread"""
+        while not self._stop.is_set():
+            self.beat()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start the background heartbeat thread (once per process)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
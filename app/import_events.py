@@ -0,0 +1,57 @@
+"""
+Bulk-create events and multi-day events from a CSV or JSON file.
+
+Every row is validated with the checks of /events/create and /events/multi-day
+before anything is sent; the transactions then go out with pipelined nonces from
+one oracle signer and the created event ids are printed once they are mined.
+
+Usage: python import_events.py season.csv [--format csv|json] [--dry-run] [--no-wait]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from services.event_import import event_importer, parse_rows, summarize
+
+
+async def run(requests, wait: bool):
+    results = await event_importer.submit(requests)
+    if wait:
+        results = await event_importer.wait(results)
+    return summarize(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="CSV or JSON file of events")
+    parser.add_argument("--format", choices=("csv", "json"), default=None)
+    parser.add_argument("--dry-run", action="store_true", help="Only validate")
+    parser.add_argument(
+        "--no-wait", action="store_true", help="Do not wait for the receipts"
+    )
+    args = parser.parse_args()
+
+    fmt = args.format or ("json" if args.path.endswith(".json") else "csv")
+    with open(args.path, encoding="utf-8") as f:
+        rows = parse_rows(f.read(), fmt)
+
+    requests, errors = event_importer.validate(rows)
+    if errors:
+        print(f"❌ {len(errors)} invalid row(s), nothing was imported:")
+        for error in errors:
+            print(f"  row {error['row']} ({error['name']}): {error['error']}")
+        sys.exit(1)
+    print(f"✅ {len(requests)} event(s) valid")
+    if args.dry_run:
+        return
+
+    report = asyncio.run(run(requests, wait=not args.no_wait))
+    print(json.dumps(report, indent=2))
+    if report.get("failed") or report.get("not_submitted"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
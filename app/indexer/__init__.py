@@ -0,0 +1 @@
+"""Chain event indexer - materialises contract state into Postgres (run with `python -m indexer`)"""
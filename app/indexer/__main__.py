@@ -0,0 +1,19 @@
+"""Run the chain indexer: `python -m indexer` from the app directory"""
+
+from web3_manager import web3_manager
+from indexer.backfill import LogBackfill
+from indexer.service import ChainIndexer
+
+
+def main():
+    indexer = ChainIndexer(web3_manager)
+    try:
+        # Catch up concurrently to the confirmed head, then follow new blocks
+        LogBackfill(indexer).run()
+        indexer.run()
+    except KeyboardInterrupt:
+        print("⏹️ Chain indexer stopped")
+
+
+if __name__ == "__main__":
+    main()
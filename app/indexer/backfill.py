@@ -0,0 +1,156 @@
+"""Catch-up mode for the indexer: concurrent, adaptively chunked eth_getLogs"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
+from database.index_models import CONTRACTS_CHECKPOINT, IndexerCheckpoint
+
+
+class LogBackfill:
+    """
+    Replays contract logs from the checkpoint up to `confirmations` blocks below head.
+
+    Block ranges are fetched by a thread pool, several chunks ahead of the writer.
+    A chunk that fails (node timeout, "too many results", response size limits) is
+    split in half and retried, and the chunk size for new ranges shrinks with it;
+    ranges that come back small let it grow again up to BACKFILL_MAX_CHUNK_BLOCKS.
+    Chunks are applied strictly in block order through ChainIndexer.apply_events,
+    several per transaction, so the checkpoint only ever covers contiguous blocks.
+    """
+
+    def __init__(self, indexer, confirmations=None, concurrency=None):
+        self.indexer = indexer
+        self.w3 = indexer.w3
+        self.confirmations = (
+            config.BACKFILL_CONFIRMATIONS if confirmations is None else confirmations
+        )
+        self.concurrency = max(
+            config.BACKFILL_CONCURRENCY if concurrency is None else concurrency, 1
+        )
+        self.max_chunk = max(config.BACKFILL_MAX_CHUNK_BLOCKS, 1)
+        self.target_logs = max(config.BACKFILL_TARGET_LOGS_PER_CHUNK, 1)
+        self.commit_events = max(config.BACKFILL_COMMIT_EVENTS, 1)
+        self.max_retries = config.BACKFILL_MAX_RETRIES
+        self.chunk_blocks = min(indexer.batch_blocks, self.max_chunk)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def safe_head(self) -> int:
+        """Highest block considered final"""
+        return self.w3.eth.block_number - self.confirmations
+
+    def _adapt(self, blocks: int, log_count: int):
+        with self._lock:
+            if log_count > self.target_logs:
+                self.chunk_blocks = max(blocks // 2, 1)
+            elif log_count < self.target_logs // 4 and blocks >= self.chunk_blocks:
+                self.chunk_blocks = min(self.chunk_blocks * 2, self.max_chunk)
+
+    def _shrink(self, blocks: int):
+        with self._lock:
+            self.chunk_blocks = max(min(self.chunk_blocks, blocks // 2), 1)
+
+    def fetch_chunk(self, from_block: int, to_block: int, attempt: int = 0):
+        """[(from_block, to_block, events)] covering the range, splitting it on failure"""
+        try:
+            events = self.indexer.fetch_events(from_block, to_block)
+        except Exception as e:
+            if to_block > from_block:
+                middle = (from_block + to_block) // 2
+                self._shrink(to_block - from_block + 1)
+                return self.fetch_chunk(from_block, middle) + self.fetch_chunk(
+                    middle + 1, to_block
+                )
+            if attempt >= self.max_retries:
+                raise
+            print(f"⚠️  getLogs failed for block {from_block}, retrying: {e}")
+            time.sleep(0.5 * 2**attempt)
+            return self.fetch_chunk(from_block, to_block, attempt + 1)
+
+        self._adapt(to_block - from_block + 1, len(events))
+        return [(from_block, to_block, events)]
+
+    def _checkpoint(self):
+        db = self.indexer.session_factory()
+        try:
+            return db.get(IndexerCheckpoint, CONTRACTS_CHECKPOINT)
+        finally:
+            db.close()
+
+    def _verify_checkpoint(self, checkpoint):
+        """Refuse to resume on top of a block that is no longer canonical"""
+        if checkpoint is None or checkpoint.block_hash is None:
+            return
+        block = self.w3.eth.get_block(checkpoint.block_number)
+        if block["hash"].to_0x_hex().lower() != checkpoint.block_hash.lower():
+            raise RuntimeError(
+                f"Checkpoint block {checkpoint.block_number} was reorged out; "
+                "raise BACKFILL_CONFIRMATIONS and reindex from an earlier block"
+            )
+
+    def _commit(self, events, to_block: int) -> int:
+        return self.indexer.apply_events(
+            events, to_block, block_hash=self.indexer.block_hash(to_block)
+        )
+
+    def run(self) -> int:
+        """Backfill up to the safe head; returns the number of events applied"""
+        checkpoint = self._checkpoint()
+        self._verify_checkpoint(checkpoint)
+        start = (
+            checkpoint.block_number + 1
+            if checkpoint is not None
+            else config.INDEXER_START_BLOCK
+        )
+        end = self.safe_head()
+        if start > end:
+            return 0
+
+        print(f"⏪ Backfilling blocks {start}-{end} with {self.concurrency} workers")
+        started = time.time()
+        applied = 0
+        next_block = start
+        pending = deque()
+        buffered, buffered_chunks, buffered_to = [], 0, None
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="backfill"
+        ) as pool:
+            try:
+                while (next_block <= end or pending) and not self._stop.is_set():
+                    # Keep a window of chunk fetches in flight ahead of the writer
+                    while next_block <= end and len(pending) < self.concurrency * 2:
+                        to_block = min(end, next_block + self.chunk_blocks - 1)
+                        pending.append(
+                            pool.submit(self.fetch_chunk, next_block, to_block)
+                        )
+                        next_block = to_block + 1
+
+                    for _, to_block, events in pending.popleft().result():
+                        buffered.extend(events)
+                        buffered_to = to_block
+                    buffered_chunks += 1
+
+                    if (
+                        len(buffered) >= self.commit_events
+                        or buffered_chunks >= self.concurrency
+                        or not pending
+                    ):
+                        applied += self._commit(buffered, buffered_to)
+                        print(
+                            f"📇 Backfilled to block {buffered_to} "
+                            f"({applied} events, chunk {self.chunk_blocks} blocks)"
+                        )
+                        buffered, buffered_chunks = [], 0
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        print(f"✅ Backfill applied {applied} events in {time.time() - started:.1f}s")
+        return applied
+
+    def stop(self):
+        self._stop.set()
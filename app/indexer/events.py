@@ -0,0 +1,49 @@
+"""Decoding of the contract logs the indexer follows"""
+
+from web3.exceptions import MismatchedABI
+
+# Contract attribute on Web3Manager -> events the indexer applies
+WATCHED_EVENTS = {
+    "event_manager": [
+        "EventCreated",
+        "MultiDayEventCreated",
+        "SubEventCreated",
+        "TicketsPurchased",
+        "SubEventTicketsPurchased",
+        "TicketsSwapped",
+        "EventClosed",
+    ],
+    "market_manager": ["Listed", "Delisted", "Purchased"],
+    "ticket_nft": ["Transfer", "TicketUsed"],
+}
+
+ZERO_ADDRESS = "0x" + "0" * 40
+
+
+class LogDecoder:
+    """Maps raw logs to decoded events by emitting contract and topic"""
+
+    def __init__(self, manager):
+        self._events = {}
+        self.addresses = []
+        for contract_attr, event_names in WATCHED_EVENTS.items():
+            contract = getattr(manager, contract_attr)
+            self.addresses.append(contract.address)
+            for event_name in event_names:
+                event = contract.events[event_name]()
+                self._events[(contract.address.lower(), event.topic.lower())] = event
+
+    def decode(self, log):
+        """Decoded event data for a watched log, or None for anything else"""
+        if not log["topics"]:
+            return None
+        topic = log["topics"][0]
+        topic = topic.to_0x_hex() if hasattr(topic, "to_0x_hex") else topic
+        event = self._events.get((log["address"].lower(), topic.lower()))
+        if event is None:
+            return None
+        try:
+            return event.process_log(log)
+        except MismatchedABI:
+            # Same signature but different indexed layout (not one of our contracts)
+            return None
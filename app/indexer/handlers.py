@@ -0,0 +1,247 @@
+"""Apply decoded contract events to the index tables"""
+
+from database.index_models import (
+    IndexedEvent,
+    IndexedSubEvent,
+    IndexedTicket,
+    IndexedListing,
+    IndexedPurchase,
+    IndexedSwap,
+)
+from indexer.events import ZERO_ADDRESS
+
+
+def _tx_hash(event) -> str:
+    return event["transactionHash"].to_0x_hex().lower()
+
+
+def _address(value) -> str:
+    return value.lower()
+
+
+def on_event_created(db, event, reads, num_days=None):
+    args = event["args"]
+    details = reads[("event", args["eventId"])]
+    # Immutable fields come from the read; sold/active start at their creation values
+    _, organiser, name, venue, date, price, total, _, _, is_multi_day = details
+    db.merge(
+        IndexedEvent(
+            event_id=args["eventId"],
+            organiser=_address(organiser),
+            name=name,
+            venue=venue,
+            date=date,
+            ticket_price=price,
+            total_tickets=total,
+            tickets_sold=0,
+            is_active=True,
+            is_multi_day=is_multi_day,
+            num_days=num_days,
+            created_block=event["blockNumber"],
+            updated_block=event["blockNumber"],
+        )
+    )
+
+
+def on_multi_day_event_created(db, event, reads):
+    on_event_created(db, event, reads, num_days=event["args"]["numDays"])
+
+
+def on_sub_event_created(db, event, reads):
+    args = event["args"]
+    _, parent_id, day_index, date, venue, swappable, total, _ = reads[
+        ("sub_event", args["subEventId"])
+    ]
+    db.merge(
+        IndexedSubEvent(
+            sub_event_id=args["subEventId"],
+            parent_event_id=parent_id,
+            day_index=day_index,
+            date=date,
+            venue=venue,
+            swappable=swappable,
+            total_tickets=total,
+            tickets_sold=0,
+            created_block=event["blockNumber"],
+            updated_block=event["blockNumber"],
+        )
+    )
+
+
+def _add_sold(row, quantity, block_number):
+    if row is None:
+        return
+    row.tickets_sold += quantity
+    row.updated_block = block_number
+
+
+def on_tickets_purchased(db, event, reads):
+    args = event["args"]
+    _add_sold(
+        db.get(IndexedEvent, args["eventId"]), args["quantity"], event["blockNumber"]
+    )
+    db.merge(
+        IndexedPurchase(
+            tx_hash=_tx_hash(event),
+            log_index=event["logIndex"],
+            event_id=args["eventId"],
+            buyer=_address(args["buyer"]),
+            quantity=args["quantity"],
+            block_number=event["blockNumber"],
+        )
+    )
+
+
+def on_sub_event_tickets_purchased(db, event, reads):
+    args = event["args"]
+    sub_event = db.get(IndexedSubEvent, args["subEventId"])
+    _add_sold(sub_event, args["quantity"], event["blockNumber"])
+    parent_id = sub_event.parent_event_id if sub_event is not None else None
+    if parent_id is not None:
+        # The contract counts sub-event sales on the parent event as well
+        _add_sold(
+            db.get(IndexedEvent, parent_id), args["quantity"], event["blockNumber"]
+        )
+    db.merge(
+        IndexedPurchase(
+            tx_hash=_tx_hash(event),
+            log_index=event["logIndex"],
+            event_id=parent_id if parent_id is not None else 0,
+            sub_event_id=args["subEventId"],
+            buyer=_address(args["buyer"]),
+            quantity=args["quantity"],
+            block_number=event["blockNumber"],
+        )
+    )
+
+
+def on_tickets_swapped(db, event, reads):
+    # Ownership moves through the two Transfer logs of the same transaction
+    args = event["args"]
+    db.merge(
+        IndexedSwap(
+            tx_hash=_tx_hash(event),
+            log_index=event["logIndex"],
+            ticket_id_1=args["ticketId1"],
+            ticket_id_2=args["ticketId2"],
+            user_1=_address(args["user1"]),
+            user_2=_address(args["user2"]),
+            block_number=event["blockNumber"],
+        )
+    )
+
+
+def on_event_closed(db, event, reads):
+    row = db.get(IndexedEvent, event["args"]["eventId"])
+    if row is not None:
+        row.is_active = False
+        row.updated_block = event["blockNumber"]
+
+
+def on_transfer(db, event, reads):
+    args = event["args"]
+    ticket_id = args["tokenId"]
+    row = db.get(IndexedTicket, ticket_id)
+    if row is None:
+        event_id, sub_event_id = reads[("ticket", ticket_id)]
+        row = IndexedTicket(
+            ticket_id=ticket_id,
+            event_id=event_id,
+            sub_event_id=sub_event_id if sub_event_id != event_id else None,
+            is_used=False,
+            minted_block=event["blockNumber"],
+        )
+        db.add(row)
+    row.owner = _address(args["to"])
+    row.updated_block = event["blockNumber"]
+
+
+def on_ticket_used(db, event, reads):
+    row = db.get(IndexedTicket, event["args"]["ticketId"])
+    if row is not None:
+        row.is_used = True
+        row.updated_block = event["blockNumber"]
+
+
+def on_listed(db, event, reads):
+    args = event["args"]
+    db.merge(
+        IndexedListing(
+            ticket_id=args["ticketId"],
+            seller=_address(args["seller"]),
+            price=args["price"],
+            event_id=args["eventId"],
+            active=True,
+            buyer=None,
+            royalty=None,
+            listed_block=event["blockNumber"],
+            closed_block=None,
+        )
+    )
+
+
+def on_delisted(db, event, reads):
+    row = db.get(IndexedListing, event["args"]["ticketId"])
+    if row is not None:
+        row.active = False
+        row.closed_block = event["blockNumber"]
+
+
+def on_resale_purchased(db, event, reads):
+    args = event["args"]
+    row = db.get(IndexedListing, args["ticketId"])
+    if row is not None:
+        row.active = False
+        row.buyer = _address(args["buyer"])
+        row.price = args["price"]
+        row.royalty = args["royalty"]
+        row.closed_block = event["blockNumber"]
+
+
+HANDLERS = {
+    "EventCreated": on_event_created,
+    "MultiDayEventCreated": on_multi_day_event_created,
+    "SubEventCreated": on_sub_event_created,
+    "TicketsPurchased": on_tickets_purchased,
+    "SubEventTicketsPurchased": on_sub_event_tickets_purchased,
+    "TicketsSwapped": on_tickets_swapped,
+    "EventClosed": on_event_closed,
+    "Transfer": on_transfer,
+    "TicketUsed": on_ticket_used,
+    "Listed": on_listed,
+    "Delisted": on_delisted,
+    "Purchased": on_resale_purchased,
+}
+
+
+def apply_event(db, event, reads):
+    """Apply one decoded event inside the caller's transaction"""
+    HANDLERS[event["event"]](db, event, reads)
+
+
+def required_reads(db, events):
+    """Contract reads needed to apply `events`: new events, sub-events and tickets"""
+    reads = set()
+    transferred = set()
+    for event in events:
+        name, args = event["event"], event["args"]
+        if name in ("EventCreated", "MultiDayEventCreated"):
+            reads.add(("event", args["eventId"]))
+        elif name == "SubEventCreated":
+            reads.add(("sub_event", args["subEventId"]))
+        elif name == "Transfer":
+            if _address(args["from"]) == ZERO_ADDRESS:
+                reads.add(("ticket", args["tokenId"]))
+            else:
+                transferred.add(args["tokenId"])
+
+    # Tickets minted before the indexer's start block are looked up on first transfer
+    if transferred:
+        known = {
+            ticket_id
+            for (ticket_id,) in db.query(IndexedTicket.ticket_id).filter(
+                IndexedTicket.ticket_id.in_(transferred)
+            )
+        }
+        reads.update(("ticket", ticket_id) for ticket_id in transferred - known)
+    return sorted(reads)
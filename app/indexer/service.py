@@ -0,0 +1,163 @@
+"""Indexer loop: fetch logs block range by block range and apply them with a checkpoint"""
+
+import threading
+
+from config import config
+from database.db import Base, SessionLocal, engine
+from database.index_models import CONTRACTS_CHECKPOINT, IndexerCheckpoint
+from indexer.events import LogDecoder
+from indexer.handlers import apply_event, required_reads
+from services.market_index import market_index
+
+# ResaleMarket events that change a seller's listings
+SELLER_EVENTS = ("Listed", "Delisted", "Purchased")
+
+
+class ChainIndexer:
+    """
+    Follows the EventManager, ResaleMarket and TicketNFT logs into Postgres.
+
+    Each block range is fetched with a single eth_getLogs over all three contracts.
+    The contract reads the logs do not carry (full event details, a ticket's
+    event) are fetched in one batch at the end of the range. Everything is then
+    applied in one transaction, together with the checkpoint and its block hash, so
+    a restart resumes exactly after the last applied range. Live following stays
+    BACKFILL_CONFIRMATIONS blocks below head, like the catch-up backfill.
+    """
+
+    def __init__(self, manager, session_factory=SessionLocal):
+        self.manager = manager
+        self.w3 = manager.w3
+        self.session_factory = session_factory
+        self.decoder = LogDecoder(manager)
+        self.batch_blocks = max(config.INDEXER_BATCH_BLOCKS, 1)
+        self.poll_interval = config.INDEXER_POLL_INTERVAL_SECONDS
+        self.confirmations = config.BACKFILL_CONFIRMATIONS
+        self._stop = threading.Event()
+
+    def last_indexed_block(self, db) -> int:
+        checkpoint = db.get(IndexerCheckpoint, CONTRACTS_CHECKPOINT)
+        if checkpoint is None:
+            return config.INDEXER_START_BLOCK - 1
+        return checkpoint.block_number
+
+    def fetch_events(self, from_block: int, to_block: int):
+        """Decoded watched events in chain order"""
+        logs = self.w3.eth.get_logs(
+            {
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "address": self.decoder.addresses,
+            }
+        )
+        events = [
+            event for event in map(self.decoder.decode, logs) if event is not None
+        ]
+        events.sort(key=lambda event: (event["blockNumber"], event["logIndex"]))
+        return events
+
+    def fetch_reads(self, keys, block_number: int) -> dict:
+        """Contract state needed by the handlers, read at `block_number`"""
+        event_manager = self.manager.event_manager
+        ticket_nft = self.manager.ticket_nft
+        calls = []
+        for kind, item_id in keys:
+            if kind == "event":
+                calls.append(event_manager.functions.events(item_id))
+            elif kind == "sub_event":
+                calls.append(event_manager.functions.subEvents(item_id))
+            else:
+                calls.append(ticket_nft.functions.ticketToEvent(item_id))
+                calls.append(ticket_nft.functions.ticketToSubEvent(item_id))
+
+        results = iter(self.manager.batch_call(calls, block_identifier=block_number))
+        reads = {}
+        for key in keys:
+            if key[0] == "ticket":
+                reads[key] = (next(results), next(results))
+            else:
+                reads[key] = tuple(next(results))
+        return reads
+
+    def block_hash(self, block_number: int) -> str:
+        return self.w3.eth.get_block(block_number)["hash"].to_0x_hex()
+
+    def apply_range(self, from_block: int, to_block: int) -> int:
+        """Index one block range; returns the number of events applied"""
+        return self.apply_events(
+            self.fetch_events(from_block, to_block),
+            to_block,
+            block_hash=self.block_hash(to_block),
+        )
+
+    def apply_events(self, events, to_block: int, block_hash=None) -> int:
+        """Apply events in chain order and move the checkpoint to `to_block`, atomically"""
+        db = self.session_factory()
+        try:
+            reads = self.fetch_reads(required_reads(db, events), to_block)
+            for event in events:
+                apply_event(db, event, reads)
+                # Later logs in the range look up rows created by earlier ones
+                db.flush()
+            db.merge(
+                IndexerCheckpoint(
+                    name=CONTRACTS_CHECKPOINT,
+                    block_number=to_block,
+                    block_hash=block_hash,
+                )
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        self.invalidate_caches(events)
+        return len(events)
+
+    def invalidate_caches(self, events):
+        """Drop API caches derived from rows this range changed (after the commit)"""
+        sellers = {
+            event["args"]["seller"]
+            for event in events
+            if event["event"] in SELLER_EVENTS
+        }
+        try:
+            market_index.invalidate_sellers(sellers)
+        except Exception as e:
+            # Cached entries still expire after SELLER_LISTINGS_CACHE_TTL_SECONDS
+            print(f"⚠️  Failed to invalidate seller listing caches: {e}")
+
+    def run_once(self) -> int:
+        """Index up to one batch of new blocks; returns the number of blocks covered"""
+        db = self.session_factory()
+        try:
+            from_block = self.last_indexed_block(db) + 1
+        finally:
+            db.close()
+
+        # Blocks this close to head can still be reorged out
+        head = self.w3.eth.block_number - self.confirmations
+        if from_block > head:
+            return 0
+        to_block = min(head, from_block + self.batch_blocks - 1)
+        applied = self.apply_range(from_block, to_block)
+        if applied:
+            print(f"📇 Indexed {applied} events from blocks {from_block}-{to_block}")
+        return to_block - from_block + 1
+
+    def run(self):
+        """Index until stopped, sleeping only when caught up with the chain"""
+        Base.metadata.create_all(bind=engine)
+        print(f"🚀 Chain indexer following {', '.join(self.decoder.addresses)}")
+        while not self._stop.is_set():
+            try:
+                if self.run_once() >= self.batch_blocks:
+                    continue
+            except Exception as e:
+                print(f"❌ Indexer error: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,194 @@
+"""Redis seat reservations taken before a primary-sale purchase is sent on chain"""
+
+import time
+import uuid
+
+import redis
+
+from config import config
+
+# Shared by the scripts: drop holds whose TTL passed and return the seats they freed.
+# An expired hold is kept as a negative quantity so a late settle stays idempotent.
+_EXPIRE_HOLDS = """
+local function expire_holds(holds_key, expiry_key, now)
+    local freed = 0
+    for _, id in ipairs(redis.call('ZRANGEBYSCORE', expiry_key, '-inf', now)) do
+        local quantity = tonumber(redis.call('HGET', holds_key, id) or '0')
+        if quantity > 0 then
+            freed = freed + quantity
+            redis.call('HSET', holds_key, id, -quantity)
+        end
+        redis.call('ZREM', expiry_key, id)
+    end
+    return freed
+end
+"""
+
+# KEYS: state, holds, expiry
+# ARGV: quantity, reservation id, now, hold ttl, total, sold, block, state ttl
+# Seeds the counters from the caller's chain read if they are missing, then holds
+# `quantity` seats if that many are free. Returns {1|0, seats left}.
+_RESERVE_SCRIPT = _EXPIRE_HOLDS + """
+local now = tonumber(ARGV[3])
+local freed = expire_holds(KEYS[2], KEYS[3], now)
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    local held = 0
+    for _, quantity in ipairs(redis.call('HVALS', KEYS[2])) do
+        if tonumber(quantity) > 0 then held = held + tonumber(quantity) end
+    end
+    redis.call('HSET', KEYS[1], 'total', ARGV[5], 'sold', ARGV[6], 'held', held,
+        'block', ARGV[7])
+    redis.call('EXPIRE', KEYS[1], ARGV[8])
+elseif freed > 0 then
+    redis.call('HINCRBY', KEYS[1], 'held', -freed)
+end
+
+local state = redis.call('HMGET', KEYS[1], 'total', 'sold', 'held')
+local available = tonumber(state[1]) - tonumber(state[2]) - tonumber(state[3])
+local quantity = tonumber(ARGV[1])
+if quantity > available then
+    return {0, available}
+end
+redis.call('HINCRBY', KEYS[1], 'held', quantity)
+redis.call('HSET', KEYS[2], ARGV[2], quantity)
+redis.call('ZADD', KEYS[3], now + tonumber(ARGV[4]), ARGV[2])
+-- The hold keys outlive their longest hold; a shorter TTL never replaces a longer one
+local keep = 2 * tonumber(ARGV[4])
+for _, key in ipairs({KEYS[2], KEYS[3]}) do
+    if redis.call('TTL', key) < keep then redis.call('EXPIRE', key, keep) end
+end
+return {1, available - quantity}
+"""
+
+# KEYS: state, holds, expiry
+# ARGV: reservation id, now, confirmed (1/0), block of the purchase
+# Frees the hold; a confirmed purchase newer than the seed read is counted as sold.
+# Returns 0 if the reservation was already settled.
+_SETTLE_SCRIPT = _EXPIRE_HOLDS + """
+local exists = redis.call('EXISTS', KEYS[1]) == 1
+local freed = expire_holds(KEYS[2], KEYS[3], tonumber(ARGV[2]))
+if exists and freed > 0 then
+    redis.call('HINCRBY', KEYS[1], 'held', -freed)
+end
+
+local quantity = tonumber(redis.call('HGET', KEYS[2], ARGV[1]))
+if not quantity then
+    return 0
+end
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+if exists and quantity > 0 then
+    redis.call('HINCRBY', KEYS[1], 'held', -quantity)
+end
+if exists and ARGV[3] == '1'
+    and tonumber(ARGV[4]) > tonumber(redis.call('HGET', KEYS[1], 'block')) then
+    redis.call('HINCRBY', KEYS[1], 'sold', math.abs(quantity))
+end
+return 1
+"""
+
+
+class InventoryExhausted(Exception):
+    """Fewer seats are free than the purchase asks for"""
+
+    def __init__(self, available: int):
+        super().__init__(f"Only {available} tickets left")
+        self.available = available
+
+
+def event_scope(event_id: int) -> str:
+    return f"event:{event_id}"
+
+
+def sub_event_scope(sub_event_id: int) -> str:
+    return f"sub_event:{sub_event_id}"
+
+
+class InventoryManager:
+    """
+    Per-event and per-sub-event seat counters shared by all API workers.
+
+    Each counter holds the chain's totalTickets and ticketsSold as of a seed block,
+    plus the seats held by purchases that are signed but not yet mined. A purchase
+    reserves its seats with one Lua script before anything is sent, so concurrent
+    buyers beyond the remaining capacity are rejected without paying gas. The
+    transaction tracker settles each hold when the purchase is mined (counting a
+    confirmed TicketsPurchased/SubEventTicketsPurchased quantity as sold) or fails.
+    Holds that are never settled expire after INVENTORY_HOLD_TTL_SECONDS, and the
+    counters re-seed from the chain every INVENTORY_STATE_TTL_SECONDS so purchases
+    made outside the API are picked up. If Redis is unavailable, purchases go
+    through unreserved and the contract remains the final check.
+    """
+
+    def __init__(self, redis_client=None):
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.hold_ttl = config.INVENTORY_HOLD_TTL_SECONDS
+        self.state_ttl = config.INVENTORY_STATE_TTL_SECONDS
+        self._reserve_script = self.redis.register_script(_RESERVE_SCRIPT)
+        self._settle_script = self.redis.register_script(_SETTLE_SCRIPT)
+
+    def _keys(self, scope: str):
+        base = f"inventory:{scope}"
+        return [base, f"{base}:holds", f"{base}:expiry"]
+
+    def reserve(self, scope: str, quantity: int, total: int, sold: int, block: int):
+        """
+        Hold `quantity` seats; `total`/`sold` are the chain values read at `block`.
+        Returns the reservation id (None if Redis is unavailable) or raises
+        InventoryExhausted.
+        """
+        reservation_id = uuid.uuid4().hex
+        try:
+            reserved, available = self._reserve_script(
+                keys=self._keys(scope),
+                args=[
+                    quantity,
+                    reservation_id,
+                    int(time.time()),
+                    self.hold_ttl,
+                    total,
+                    sold,
+                    block,
+                    self.state_ttl,
+                ],
+            )
+        except redis.RedisError as e:
+            print(f"⚠️  Inventory unavailable, purchase not reserved: {e}")
+            return None
+        if not reserved:
+            raise InventoryExhausted(max(int(available), 0))
+        return reservation_id
+
+    def settle(self, scope: str, reservation_id: str, confirmed=False, block=0):
+        """Free a hold, counting its seats as sold if the purchase was mined"""
+        try:
+            self._settle_script(
+                keys=self._keys(scope),
+                args=[reservation_id, int(time.time()), int(confirmed), block],
+            )
+        except redis.RedisError as e:
+            print(f"⚠️  Failed to settle inventory reservation {reservation_id}: {e}")
+
+    def release(self, scope: str, reservation_id: str):
+        """Give the seats back (the purchase was never sent)"""
+        self.settle(scope, reservation_id)
+
+    def on_tx_settled(self, meta: dict, status: str, block_number, events=None):
+        """Transaction tracker listener for purchases that carry a reservation"""
+        reservation = meta.get("reservation")
+        if not reservation:
+            return
+        self.settle(
+            reservation["scope"],
+            reservation["id"],
+            confirmed=status == "confirmed",
+            block=block_number or 0,
+        )
+
+
+# Create singleton instance
+inventory = InventoryManager()
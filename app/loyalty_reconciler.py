@@ -0,0 +1,87 @@
+"""Checks pipelined loyalty redemptions against what the chain actually redeemed"""
+
+import json
+import time
+
+import redis
+
+from config import config
+
+DISCREPANCIES_KEY = "loyalty:redemption_discrepancies"
+
+
+class LoyaltyReconciler:
+    """
+    Compares each redeemPointsTicket transaction with the quote it was sent with.
+
+    Discounted purchases no longer wait for the redemption receipt: the discount is
+    quoted locally and the redemption and buyTicketsWithDiscount are sent back to
+    back. When the transaction tracker settles a redemption, its
+    PointsRedeemedTicket log is checked against the quoted points and discount. A
+    reverted redemption or a different amount (the user's points or the rate
+    changed in between) is logged and kept in the `loyalty:redemption_discrepancies`
+    Redis list, newest first, with the purchase transaction it paid for. A
+    redemption whose purchase was never sent (`orphaned`) is always recorded, since
+    its points were burned without a ticket.
+    """
+
+    def __init__(self, redis_client=None):
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.max_entries = config.LOYALTY_DISCREPANCIES_KEPT
+
+    def on_tx_settled(self, meta: dict, status: str, block_number, events=None):
+        """Transaction tracker listener for loyalty redemptions"""
+        quote = meta.get("loyalty_quote")
+        if not quote:
+            return
+
+        redeemed = ((events or {}).get("PointsRedeemedTicket") or [{}])[0]
+        points = redeemed.get("pointsBurned", 0) if status == "confirmed" else 0
+        discount = redeemed.get("weiDiscount", 0) if status == "confirmed" else 0
+        orphaned = meta.get("orphaned")
+        if (
+            not orphaned
+            and points == quote["points"]
+            and discount == quote["discount_wei"]
+        ):
+            return
+
+        discrepancy = {
+            "buyer": meta.get("buyer"),
+            "event_id": meta.get("event_id"),
+            "purchase_tx": meta.get("purchase_tx"),
+            "status": status,
+            "block_number": block_number,
+            "quoted_points": quote["points"],
+            "quoted_discount_wei": quote["discount_wei"],
+            "redeemed_points": points,
+            "redeemed_discount_wei": discount,
+            "orphaned": orphaned,
+            "recorded_at": int(time.time()),
+        }
+        if orphaned:
+            print(
+                f"❌ Loyalty redemption by {discrepancy['buyer']} burned {points} points "
+                f"but its purchase was not sent: {orphaned}"
+            )
+        else:
+            print(
+                f"❌ Loyalty redemption for purchase {discrepancy['purchase_tx']} "
+                f"redeemed {points} points ({discount} wei), quoted "
+                f"{quote['points']} points ({quote['discount_wei']} wei)"
+            )
+        try:
+            pipe = self.redis.pipeline()
+            pipe.lpush(DISCREPANCIES_KEY, json.dumps(discrepancy))
+            pipe.ltrim(DISCREPANCIES_KEY, 0, self.max_entries - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"⚠️  Failed to record loyalty discrepancy: {e}")
+
+
+# Create singleton instance
+loyalty_reconciler = LoyaltyReconciler()
@@ -15,8 +15,17 @@ from routes.auth_route import router as auth_router
 from ticket_queue.queue_routes import router as queue_router
 from ticket_queue.queue_manager import activate_next_users
 from routes.ticket_route import router as ticket_router
+from routes.tx_route import router as tx_router
+from tx_tracker import tx_tracker
+from loyalty_reconciler import loyalty_reconciler
+from inventory import inventory
+from purchase_jobs import purchase_jobs
+from signing_pool import signing_executor
+from web3_manager import web3_manager
 from middleware.auth import AuthMiddleware
+from middleware.idempotency import IdempotencyMiddleware
 from database.db import engine, Base
+from database import index_models  # noqa: F401 - registers the indexer tables
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -69,11 +78,28 @@ async def startup_event():
     thread.start()
     logger.info("✅ Background queue activation loop started.")
 
+    # Settle seat reservations and check loyalty redemptions as transactions are mined
+    tx_tracker.add_settle_listener(inventory.on_tx_settled)
+    tx_tracker.add_settle_listener(loyalty_reconciler.on_tx_settled)
+    tx_tracker.start()
+    logger.info("✅ Background transaction tracker started.")
+
+    web3_manager.heartbeat.start()
+    logger.info("✅ Blockchain node heartbeat started.")
+
+    if purchase_jobs.enabled:
+        await purchase_jobs.start()
+        logger.info(f"✅ {purchase_jobs.workers} purchase job worker(s) started.")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event"""
     logger.info("⏹️ Shutting down TicketChain API...")
+    tx_tracker.stop()
+    await purchase_jobs.stop()
+    web3_manager.heartbeat.stop()
+    signing_executor.shutdown()
 
 # Add CORS middleware
 app.add_middleware(
@@ -84,6 +110,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Replay retried purchases sent with an Idempotency-Key (runs inside AuthMiddleware)
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths={"/events/buy", "/events/sub-events/buy", "/market/buy"},
+)
+
 # Add authentication middleware (token verification only)
 app.add_middleware(
     AuthMiddleware,
@@ -92,6 +124,7 @@ app.add_middleware(
         "/market",
         "/loyalty",
         "/tickets",
+        "/tx",
         "/auth/profile",
         "/auth/me",
         "/auth/logout",
@@ -107,6 +140,7 @@ app.include_router(account_router)
 app.include_router(queue_router)
 app.include_router(loyalty_router)
 app.include_router(ticket_router)
+app.include_router(tx_router)
 
 
 @app.get("/")
@@ -114,6 +148,18 @@ async def root():
     return {"message": "TicketChain API is running"}
 
 
+@app.get("/health")
+async def health():
+    """Cached blockchain node health and oracle signer status"""
+    node = web3_manager.heartbeat.status()
+    return {
+        "status": "ok" if node["connected"] and node["fresh"] else "degraded",
+        "node": node,
+        "rpc_endpoints": web3_manager.rpc_endpoints.status(),
+        "signers": web3_manager.signer_pool.status(),
+    }
+
+
 @app.options("/{path:path}")
 async def handle_options(path: str):
     """Handle all OPTIONS requests for CORS preflight"""
@@ -0,0 +1,173 @@
+"""Idempotency-Key support for endpoints that sign and send transactions"""
+
+import hashlib
+import json
+from typing import Optional, Set
+
+import redis
+from fastapi import Request, status
+from fastapi.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from config import config
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """
+    Replays the stored response of a POST retried with the same Idempotency-Key.
+
+    The first request with a key stores an in-flight marker (SET NX) under
+    `idempotency:<user id>:<path>:<key>` and runs normally; a successful response is
+    then stored in its place for IDEMPOTENCY_TTL_SECONDS and returned to every
+    retry with an `Idempotent-Replayed: true` header, without touching the chain.
+    A retry while the first request is still running gets 409, and reusing a key
+    with a different body gets 422. Only 4xx responses, which the purchase routes
+    return before anything is signed, release the key so the request can be
+    retried; a 5xx or an unhandled error may come after a transaction went out, so
+    it is stored and replayed like a success. Keys are scoped per user, so the
+    middleware must run inside AuthMiddleware. Without Redis, requests go through
+    unprotected.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: Optional[Set[str]] = None,
+        redis_client=None,
+    ):
+        super().__init__(app)
+        self.paths = paths or set()
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.ttl = config.IDEMPOTENCY_TTL_SECONDS
+        self.in_flight_ttl = config.IDEMPOTENCY_IN_FLIGHT_TTL_SECONDS
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        key = request.headers.get("idempotency-key")
+        user_id = getattr(request.state, "user_id", None)
+        if (
+            not key
+            or user_id is None
+            or request.method != "POST"
+            or request.url.path not in self.paths
+        ):
+            return await call_next(request)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return self._error_response(
+                status.HTTP_400_BAD_REQUEST,
+                f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters",
+            )
+
+        fingerprint = hashlib.sha256(await request.body()).hexdigest()
+        redis_key = f"idempotency:{user_id}:{request.url.path}:{key}"
+        try:
+            acquired = await run_in_threadpool(
+                self.redis.set,
+                redis_key,
+                json.dumps({"state": "in_flight", "fingerprint": fingerprint}),
+                nx=True,
+                ex=self.in_flight_ttl,
+            )
+            stored = (
+                None if acquired else await run_in_threadpool(self.redis.get, redis_key)
+            )
+        except redis.RedisError as e:
+            print(f"⚠️  Idempotency store unavailable, request not protected: {e}")
+            return await call_next(request)
+
+        if not acquired:
+            return self._replay(stored, fingerprint)
+
+        try:
+            response = await call_next(request)
+            body = b"".join([chunk async for chunk in response.body_iterator])
+        except Exception:
+            # The handler may have failed after sending; never run it twice
+            await self._store(
+                redis_key,
+                fingerprint,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "application/json",
+                json.dumps({"detail": "Internal Server Error"}),
+            )
+            raise
+
+        if 400 <= response.status_code < 500:
+            await self._release(redis_key)
+        else:
+            await self._store(
+                redis_key,
+                fingerprint,
+                response.status_code,
+                response.headers.get("content-type"),
+                body.decode(),
+            )
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
+
+    def _replay(self, stored: Optional[str], fingerprint: str) -> Response:
+        # A key that vanished between SET NX and GET was just released; treat as busy
+        record = json.loads(stored) if stored else {"state": "in_flight"}
+        if record.get("fingerprint", fingerprint) != fingerprint:
+            return self._error_response(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "Idempotency-Key was already used with a different request body",
+            )
+        if record["state"] == "in_flight":
+            return self._error_response(
+                status.HTTP_409_CONFLICT,
+                "A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        return Response(
+            content=record["body"],
+            status_code=record["status_code"],
+            media_type=record["media_type"],
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    async def _store(
+        self,
+        redis_key: str,
+        fingerprint: str,
+        status_code: int,
+        media_type: Optional[str],
+        body: str,
+    ):
+        record = {
+            "state": "completed",
+            "fingerprint": fingerprint,
+            "status_code": status_code,
+            "media_type": media_type,
+            "body": body,
+        }
+        try:
+            await run_in_threadpool(
+                self.redis.set, redis_key, json.dumps(record), ex=self.ttl
+            )
+        except redis.RedisError as e:
+            print(f"⚠️  Failed to store idempotent response: {e}")
+
+    async def _release(self, redis_key: str):
+        try:
+            await run_in_threadpool(self.redis.delete, redis_key)
+        except redis.RedisError as e:
+            print(f"⚠️  Failed to release Idempotency-Key {redis_key}: {e}")
+
+    def _error_response(self, status_code: int, detail: str, headers=None) -> Response:
+        return Response(
+            content=json.dumps({"detail": detail}),
+            status_code=status_code,
+            headers={"content-type": "application/json", **(headers or {})},
+        )
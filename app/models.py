@@ -62,6 +62,10 @@ class CheckSwapEligibilityRequest(BaseModel):
     ticket_id_2: int
 
 
+class BulkSwapEligibilityRequest(BaseModel):
+    pairs: list[CheckSwapEligibilityRequest]
+
+
 class SetSubEventSwappableRequest(BaseModel):
     sub_event_id: int
     swappable: bool
@@ -96,6 +100,7 @@ class MarketListingsResponse(BaseModel):
     listings: list[ListingResponse]
     total: int
     message: str
+    next_cursor: Optional[str] = None
 
 
 # --- Approval Models ---
@@ -0,0 +1,166 @@
+"""Nonce allocation for server-side signer accounts"""
+
+import threading
+
+import redis
+
+from config import config
+
+# Nonce errors reported by Hardhat/geth when the local counter drifted from the chain
+NONCE_ERROR_MARKERS = (
+    "nonce too low",
+    "nonce too high",
+    "already known",
+    "invalid nonce",
+    "replacement transaction underpriced",
+)
+
+# Atomically seed the counter (if missing), reserve `count` nonces and refresh the TTL.
+# Returns the first reserved nonce.
+_ALLOCATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+local next_nonce = redis.call('INCRBY', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return next_nonce - tonumber(ARGV[2])
+"""
+
+# Give back the most recently allocated nonce if nothing was allocated after it.
+_RELEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and tonumber(current) == tonumber(ARGV[1]) + 1 then
+    redis.call('DECR', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check whether a send failure was caused by a stale or conflicting nonce"""
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_ERROR_MARKERS)
+
+
+class NonceManager:
+    """
+    Hands out nonces for signer accounts without an RPC round trip per transaction.
+
+    The next nonce for each address is kept in Redis so every API worker draws from
+    the same sequence. The counter is seeded from the node's pending transaction
+    count, expires after NONCE_KEY_TTL_SECONDS of inactivity (so an idle signer
+    re-seeds from the chain) and is resynced whenever a send fails. If Redis is
+    unavailable the manager falls back to a per-process counter guarded by a lock.
+    """
+
+    def __init__(self, w3, redis_client=None, key_prefix="nonce"):
+        self.w3 = w3
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.key_ttl = config.NONCE_KEY_TTL_SECONDS
+        self._lock = threading.Lock()
+        self._local_nonces = {}
+        self._allocate_script = None
+        self._release_script = None
+        if self.redis is not None:
+            self._allocate_script = self.redis.register_script(_ALLOCATE_SCRIPT)
+            self._release_script = self.redis.register_script(_RELEASE_SCRIPT)
+
+    def _key(self, address: str) -> str:
+        return f"{self.key_prefix}:{address.lower()}"
+
+    def chain_nonce(self, address: str) -> int:
+        """Next nonce according to the node, including transactions still in the mempool"""
+        return self.w3.eth.get_transaction_count(
+            self.w3.to_checksum_address(address), "pending"
+        )
+
+    def allocate(self, address: str, count: int = 1) -> int:
+        """Reserve `count` consecutive nonces for an address and return the first one"""
+        if count <= 0:
+            raise ValueError("count must be positive")
+
+        if self.redis is not None:
+            try:
+                return self._allocate_shared(address, count)
+            except redis.exceptions.RedisError as e:
+                print(
+                    f"⚠️  Nonce counter unavailable in Redis, using local counter: {e}"
+                )
+
+        return self._allocate_local(address, count)
+
+    def peek_many(self, addresses) -> dict:
+        """Next unallocated nonce per address, or None where no counter exists yet"""
+        if self.redis is not None:
+            try:
+                values = self.redis.mget([self._key(address) for address in addresses])
+                return {
+                    address: None if value is None else int(value)
+                    for address, value in zip(addresses, values)
+                }
+            except redis.exceptions.RedisError:
+                pass
+        with self._lock:
+            return {
+                address: self._local_nonces.get(address.lower())
+                for address in addresses
+            }
+
+    def _allocate_shared(self, address: str, count: int) -> int:
+        key = self._key(address)
+        seed = self.redis.get(key)
+        if seed is None:
+            # Only hit the node when the counter has to be (re)seeded
+            seed = self.chain_nonce(address)
+        return int(self._allocate_script(keys=[key], args=[seed, count, self.key_ttl]))
+
+    def _allocate_local(self, address: str, count: int) -> int:
+        key = address.lower()
+        with self._lock:
+            if key not in self._local_nonces:
+                self._local_nonces[key] = self.chain_nonce(address)
+            nonce = self._local_nonces[key]
+            self._local_nonces[key] = nonce + count
+            return nonce
+
+    def release(self, address: str, nonce: int, error: Exception = None):
+        """
+        Return a nonce whose transaction was never accepted by the node.
+
+        The last allocated nonce is simply handed back. Anything else (a nonce
+        error, or a nonce that later allocations already built on) leaves a gap,
+        so the counter is resynced from the chain instead.
+        """
+        if error is not None and is_nonce_error(error):
+            self.resync(address)
+            return
+
+        if self.redis is not None:
+            try:
+                if self._release_script(keys=[self._key(address)], args=[nonce]):
+                    return
+                self.resync(address)
+                return
+            except redis.exceptions.RedisError:
+                pass
+
+        key = address.lower()
+        with self._lock:
+            if self._local_nonces.get(key) == nonce + 1:
+                self._local_nonces[key] = nonce
+                return
+        self.resync(address)
+
+    def resync(self, address: str) -> int:
+        """Reset the counter for an address to the node's pending transaction count"""
+        nonce = self.chain_nonce(address)
+        if self.redis is not None:
+            try:
+                self.redis.set(self._key(address), nonce, ex=self.key_ttl)
+            except redis.exceptions.RedisError as e:
+                print(f"⚠️  Failed to resync nonce counter in Redis: {e}")
+        with self._lock:
+            self._local_nonces[address.lower()] = nonce
+        return nonce
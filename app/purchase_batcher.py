@@ -0,0 +1,139 @@
+"""Optional batching window for oracle-signed ticket purchases"""
+
+import asyncio
+
+from config import config
+from web3_manager import async_web3_manager
+
+
+class PurchaseBatcher:
+    """
+    Collects oracle-submitted purchases of the same event for a short window.
+
+    When the window closes (or PURCHASE_BATCH_MAX_SIZE purchases are waiting) the
+    batch is sent with AsyncWeb3Manager.send_transaction_batch: one signer, one
+    nonce allocation, signatures produced together and a single batched
+    eth_sendRawTransaction request. Each purchase is still its own transaction, so
+    one revert does not affect the others. A purchase made of several steps (loyalty
+    redemption, then the discounted buy) sends each step in its own batch after the
+    previous one, so a rejected step is never followed by the next. A step queued
+    behind a rejected nonce that could not be filled is not followed either. With
+    PURCHASE_BATCH_WINDOW_MS=0 every purchase is sent on its own, as before.
+    """
+
+    def __init__(self, manager, window_ms=None, max_size=None):
+        self.manager = manager
+        window_ms = config.PURCHASE_BATCH_WINDOW_MS if window_ms is None else window_ms
+        self.window = window_ms / 1000
+        self.max_size = max(
+            config.PURCHASE_BATCH_MAX_SIZE if max_size is None else max_size, 1
+        )
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    async def submit(self, key, function_call, value: int, gas=None):
+        """Send an oracle transaction, batched with others under `key`; returns its hash"""
+        (result,) = await self.submit_chain(key, [(function_call, value)], gas=gas)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def submit_chain(self, key, items, gas=None):
+        """
+        Send dependent (function_call, value) oracle transactions in order.
+
+        Every item goes from the same signer with a higher nonce than the one before,
+        and is only sent once the previous one was accepted by the node, so none of
+        them waits for an earlier receipt. Returns a hash per item, an exception for
+        the item that was rejected or held back, and None for the items after it.
+        """
+        if not self.enabled:
+            return await self._send_chain(items, gas)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((list(items), gas, future))
+        if len(batch) >= self.max_size:
+            self._schedule(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._schedule, key)
+        return await future
+
+    async def _send_chain(self, items, gas):
+        signer = await self.manager.acquire_signer()
+        results = [None] * len(items)
+        for position, (function_call, value) in enumerate(items):
+            try:
+                txn = await self.manager.build_transaction(
+                    function_call, gas=gas, signer=signer
+                )
+                txn["value"] = value
+                results[position] = await self.manager.sign_and_send_transaction(txn)
+            except Exception as e:
+                results[position] = e
+                break
+        return results
+
+    def _schedule(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch):
+        gas = max((gas or config.DEFAULT_GAS) for _, gas, _ in batch)
+        results = [[None] * len(items) for items, _, _ in batch]
+        signer = None
+        live = list(range(len(batch)))
+        # Step n of every chain goes out in one batched send, after all steps n-1
+        for step in range(max(len(items) for items, _, _ in batch)):
+            live = [position for position in live if step < len(batch[position][0])]
+            if not live:
+                break
+            try:
+                signer = signer or await self.manager.acquire_signer()
+                sent = await self.manager.send_transaction_batch(
+                    [batch[position][0][step] for position in live],
+                    gas=gas,
+                    signer=signer,
+                )
+            except Exception as e:
+                sent = [e] * len(live)
+            stranded = set(getattr(sent, "stranded", ()))
+
+            next_live = []
+            for offset, (position, result) in enumerate(zip(live, sent)):
+                results[position][step] = result
+                if isinstance(result, Exception):
+                    continue
+                if offset in stranded:
+                    # Queued above a nonce gap that could not be filled; nonces handed
+                    # out after the resync are lower, so its next step would run first
+                    if step + 1 < len(batch[position][0]):
+                        results[position][step + 1] = RuntimeError(
+                            "Not sent: an earlier transaction of the batch was rejected"
+                        )
+                else:
+                    next_live.append(position)
+            live = next_live
+        if len(batch) > 1:
+            print(f"📦 Sent {len(batch)} batched purchases")
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Create singleton instance
+purchase_batcher = PurchaseBatcher(async_web3_manager)
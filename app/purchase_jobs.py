@@ -0,0 +1,216 @@
+"""Purchase jobs: requests queued on a Redis stream and run by background workers"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+
+import redis
+from fastapi import HTTPException
+
+from config import config
+
+STREAM_KEY = "purchases:jobs"
+GROUP = "purchase-workers"
+
+
+def _job_key(job_id: str) -> str:
+    return f"purchase_job:{job_id}"
+
+
+class PurchaseJobs:
+    """
+    Runs ticket purchases outside the HTTP request.
+
+    With PURCHASE_WORKERS > 0 the buy endpoints only validate the request, add a job
+    to the `purchases:jobs` stream and answer 202 with its id. Each API process runs
+    that many worker tasks in one consumer group; a worker performs the chain steps
+    (reads, loyalty redemption, signing and sending) with the handler registered for
+    the job kind and stores the handler's response, or the error, in the
+    `purchase_job:<id>` hash served by GET /events/jobs/{job_id}. A job left
+    unacknowledged by a crashed worker is claimed by another one after
+    PURCHASE_JOB_CLAIM_IDLE_SECONDS; if it had already started it is marked failed
+    rather than run again, since its purchase may have been sent.
+    """
+
+    def __init__(self, redis_client=None):
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.workers = config.PURCHASE_WORKERS
+        self.job_ttl = config.PURCHASE_JOB_TTL_SECONDS
+        self.claim_idle_ms = int(config.PURCHASE_JOB_CLAIM_IDLE_SECONDS * 1000)
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._handlers = {}
+        self._tasks = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def register(self, kind: str, handler):
+        """`handler(payload, user_info)` is awaited by a worker and returns the result"""
+        self._handlers[kind] = handler
+
+    def enqueue(self, kind: str, payload: dict, user_info: dict) -> str:
+        """Queue a job and return its id"""
+        job_id = uuid.uuid4().hex
+        # Workers load the signing key themselves; it never goes into Redis
+        user = {
+            "user_id": user_info["user_id"],
+            "wallet_address": user_info["wallet_address"],
+        }
+        pipe = self.redis.pipeline()
+        pipe.hset(
+            _job_key(job_id),
+            mapping={
+                "job_id": job_id,
+                "kind": kind,
+                "status": "queued",
+                "owner": user["wallet_address"].lower(),
+                "submitted_at": str(int(time.time())),
+            },
+        )
+        pipe.expire(_job_key(job_id), self.job_ttl)
+        pipe.xadd(
+            STREAM_KEY,
+            {
+                "job_id": job_id,
+                "kind": kind,
+                "payload": json.dumps(payload),
+                "user": json.dumps(user),
+            },
+        )
+        pipe.execute()
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        """Current record of a job, or None if it is unknown or expired"""
+        record = self.redis.hgetall(_job_key(job_id))
+        if not record:
+            return None
+        job = {
+            "job_id": record["job_id"],
+            "kind": record.get("kind"),
+            "status": record.get("status"),
+            "owner": record.get("owner"),
+        }
+        for field in ("submitted_at", "started_at", "finished_at", "status_code"):
+            if field in record:
+                job[field] = int(record[field])
+        if "result" in record:
+            job["result"] = json.loads(record["result"])
+        if "error" in record:
+            job["error"] = record["error"]
+        return job
+
+    def _update(self, job_id: str, **fields):
+        pipe = self.redis.pipeline()
+        pipe.hset(_job_key(job_id), mapping=fields)
+        pipe.expire(_job_key(job_id), self.job_ttl)
+        pipe.execute()
+
+    async def _run(self, entry_id: str, fields: dict, claimed=False):
+        job_id = fields["job_id"]
+        status = await asyncio.to_thread(self.redis.hget, _job_key(job_id), "status")
+        if status == "queued":
+            await asyncio.to_thread(
+                self._update, job_id, status="running", started_at=int(time.time())
+            )
+            outcome = await self._execute(fields)
+            await asyncio.to_thread(
+                self._update, job_id, finished_at=int(time.time()), **outcome
+            )
+        elif claimed and status == "running":
+            await asyncio.to_thread(
+                self._update,
+                job_id,
+                status="failed",
+                status_code=500,
+                error="Purchase worker stopped mid-job; check your tickets before retrying",
+                finished_at=int(time.time()),
+            )
+
+        pipe = self.redis.pipeline()
+        pipe.xack(STREAM_KEY, GROUP, entry_id)
+        pipe.xdel(STREAM_KEY, entry_id)
+        await asyncio.to_thread(pipe.execute)
+
+    async def _execute(self, fields: dict) -> dict:
+        handler = self._handlers.get(fields["kind"])
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown purchase job kind: {fields['kind']}")
+            result = await handler(
+                json.loads(fields["payload"]), json.loads(fields["user"])
+            )
+            # Decimal ETH amounts are kept as strings
+            return {"status": "succeeded", "result": json.dumps(result, default=str)}
+        except HTTPException as e:
+            return {"status": "failed", "status_code": e.status_code, "error": e.detail}
+        except Exception as e:
+            print(f"❌ Purchase job {fields['job_id']} failed: {e}")
+            return {"status": "failed", "status_code": 500, "error": str(e)}
+
+    def _ensure_group(self):
+        try:
+            self.redis.xgroup_create(STREAM_KEY, GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _worker(self):
+        while True:
+            try:
+                _, claimed, _ = await asyncio.to_thread(
+                    self.redis.xautoclaim,
+                    STREAM_KEY,
+                    GROUP,
+                    self.consumer,
+                    self.claim_idle_ms,
+                    count=1,
+                )
+                for entry_id, fields in claimed:
+                    if fields:
+                        await self._run(entry_id, fields, claimed=True)
+
+                response = await asyncio.to_thread(
+                    self.redis.xreadgroup,
+                    GROUP,
+                    self.consumer,
+                    {STREAM_KEY: ">"},
+                    count=1,
+                    block=config.PURCHASE_JOB_BLOCK_MS,
+                )
+                for _, entries in response or []:
+                    for entry_id, fields in entries:
+                        await self._run(entry_id, fields)
+            except asyncio.CancelledError:
+                raise
+            except redis.exceptions.ConnectionError:
+                print("⚠️  Purchase worker: Redis not ready, retrying...")
+                await asyncio.sleep(1)
+            except Exception as e:
+                print(f"❌ Purchase worker error: {e}")
+                await asyncio.sleep(1)
+
+    async def start(self):
+        """Start the worker tasks on the running event loop (once per process)"""
+        if not self.enabled or self._tasks:
+            return
+        await asyncio.to_thread(self._ensure_group)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+# Create singleton instance
+purchase_jobs = PurchaseJobs()
@@ -0,0 +1,159 @@
+"""Block-aware LRU cache for contract view call results"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from config import config
+
+
+def _freeze(value):
+    """Make call arguments hashable so they can be part of a cache key"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, str) and value.startswith("0x") and len(value) == 42:
+        # Checksummed and lowercase addresses refer to the same account
+        return value.lower()
+    return value
+
+
+def call_cache_key(function_call):
+    """(contract, function, args) identity of a bound contract function"""
+    return (
+        function_call.address.lower(),
+        function_call.fn_name,
+        _freeze(function_call.args or ()),
+        _freeze(function_call.kwargs or {}),
+    )
+
+
+class BlockReadCache:
+    """
+    Caches view call results together with the block they were read at.
+
+    A view call cannot change within a block, so an entry read at the latest block is
+    served until a new block arrives. Callers may opt into `max_staleness` N to accept
+    an entry read at any block >= latest - N. The latest block number is re-read from
+    the node at most every READ_CACHE_BLOCK_REFRESH_SECONDS; entries older than
+    READ_CACHE_MAX_STALENESS_BLOCKS are purged as the chain advances, and the cache
+    is bounded to READ_CACHE_MAX_ENTRIES with LRU eviction.
+    """
+
+    def __init__(
+        self, max_entries=None, block_refresh_seconds=None, max_staleness=None
+    ):
+        self.max_entries = max_entries or config.READ_CACHE_MAX_ENTRIES
+        self.block_refresh_seconds = (
+            config.READ_CACHE_BLOCK_REFRESH_SECONDS
+            if block_refresh_seconds is None
+            else block_refresh_seconds
+        )
+        self.max_staleness = (
+            config.READ_CACHE_MAX_STALENESS_BLOCKS
+            if max_staleness is None
+            else max_staleness
+        )
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._latest_block = None
+        self._block_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def latest_block(self):
+        return self._latest_block
+
+    def block_is_fresh(self) -> bool:
+        """Whether the known latest block was checked recently enough to trust"""
+        return (
+            self._latest_block is not None
+            and time.monotonic() - self._block_checked_at < self.block_refresh_seconds
+        )
+
+    def note_block(self, block_number: int):
+        """Record the node's latest block, purging entries that fell out of range"""
+        with self._lock:
+            self._block_checked_at = time.monotonic()
+            if self._latest_block == block_number:
+                return
+            if self._latest_block is not None and block_number < self._latest_block:
+                # The chain went backwards (reorg or a restarted dev node)
+                self._entries.clear()
+            self._latest_block = block_number
+            oldest_allowed = block_number - self.max_staleness
+            for key in [
+                k for k, (block, _) in self._entries.items() if block < oldest_allowed
+            ]:
+                del self._entries[key]
+
+    def observe_block(self, block_number: int):
+        """Move forward to a block seen elsewhere (e.g. a receipt) so reads see our own writes"""
+        if self._latest_block is None or block_number > self._latest_block:
+            self.note_block(block_number)
+
+    def target_block(self, latest_block: int, max_staleness: int = 0) -> int:
+        """Oldest block a read may come from under the given staleness allowance"""
+        max_staleness = min(max(max_staleness, 0), self.max_staleness)
+        return max(latest_block - max_staleness, 0)
+
+    def get(self, key, min_block: int):
+        """Return (True, value) for an entry read at or after `min_block`"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < min_block:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key, block_number: int, value):
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current[0] > block_number:
+                return
+            self._entries[key] = (block_number, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup_many(self, calls, latest_block: int, max_staleness: int = 0):
+        """
+        Look up a list of bound contract functions.
+
+        Returns (results, keys, misses): results holds cached values in call order
+        (None where missing) and misses lists the indexes that still need reading.
+        """
+        min_block = self.target_block(latest_block, max_staleness)
+        results, keys, misses = [], [], []
+        for index, function_call in enumerate(calls):
+            key = call_cache_key(function_call)
+            hit, value = self.get(key, min_block)
+            keys.append(key)
+            results.append(value)
+            if not hit:
+                misses.append(index)
+        return results, keys, misses
+
+    def store_many(self, results, keys, misses, fetched, block_number: int):
+        """Fill the missed slots of `results` and cache every successful read"""
+        for index, value in zip(misses, fetched):
+            results[index] = value
+            if value is not None:
+                self.set(keys[index], block_number, value)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "latest_block": self._latest_block,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
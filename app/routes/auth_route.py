@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from account_cache import invalidate_user, user_credentials_cache
 from database.db import get_db
 from services.auth_service import auth_service
 from database.db_models import User
@@ -322,12 +323,28 @@ async def require_authenticated_user(
     db: Session = Depends(get_db),
 ) -> dict:
     """Get authenticated user info with wallet details for market endpoints"""
+    # The token is always verified and the user must still be active; only the user
+    # and roles load is cached. The private key is loaded by get_user_signing_account.
+    payload = auth_service.verify_token(credentials.credentials, "access")
+    user_id = version = None
+    if payload is not None and payload.get("sub") is not None:
+        user_id = int(payload["sub"])
+        cached = user_credentials_cache.get(user_id)
+        if cached is not None:
+            if auth_service.is_user_active(db, user_id):
+                return dict(cached)
+            invalidate_user(user_id)
+        # Read before loading so an invalidation during the load is not overwritten
+        version = user_credentials_cache.version(user_id)
+
     user = await get_current_user(credentials, db)
 
-    return {
+    user_info = {
         "user_id": user.id,
         "username": user.username,
         "wallet_address": user.wallet_address,
-        "private_key": user.private_key,
         "roles": [role.name for role in user.roles],
     }
+    if user.id == user_id:
+        user_credentials_cache.set(user.id, user_info, version)
+    return dict(user_info)
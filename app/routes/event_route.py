@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from typing import Optional
 from models import (
     CreateEventRequest,
     CreateMultiDayEventRequest,
@@ -6,11 +9,28 @@ from models import (
     BuySubEventTicketsRequest,
     SwapTicketsRequest,
     CheckSwapEligibilityRequest,
+    BulkSwapEligibilityRequest,
     SetSubEventSwappableRequest,
     SubEventDetails,
 )
-from web3_manager import web3_manager
-from dependencies.role_deps import require_roles
+from web3_manager import web3_manager, async_web3_manager
+from event_catalog import EVENT_SORTS, event_catalog
+from services.sub_events import sub_events as sub_events_service
+from services.swap_eligibility import swap_eligibility
+from services.event_import import (
+    event_importer,
+    multi_day_gas,
+    parse_rows,
+    summarize,
+    validate_event,
+    validate_multi_day_event,
+)
+from config import config
+from tx_tracker import tx_tracker
+from inventory import InventoryExhausted, event_scope, inventory, sub_event_scope
+from purchase_batcher import purchase_batcher
+from purchase_jobs import purchase_jobs
+from dependencies.role_deps import require_roles, get_user_signing_account
 from routes.auth_route import require_authenticated_user
 
 # Initialize router
@@ -30,31 +50,20 @@ async def create_event(
     """Create a new event - requires admin or organiser role"""
     try:
         # Check Web3 connection
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
 
-        # Validate inputs
-        if not request.name.strip():
-            raise HTTPException(status_code=400, detail="Event name cannot be empty")
-
-        if not request.venue.strip():
-            raise HTTPException(status_code=400, detail="Venue cannot be empty")
-
-        if request.date <= 0:
-            raise HTTPException(status_code=400, detail="Invalid date")
-
-        if request.price <= 0:
-            raise HTTPException(status_code=400, detail="Price must be greater than 0")
-
-        if request.total_tickets <= 0:
-            raise HTTPException(
-                status_code=400, detail="Total tickets must be greater than 0"
-            )
+        # Validate inputs (shared with the bulk import)
+        try:
+            validate_event(request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Build transaction using web3_manager oracle account (only oracle can create events)
-        function_call = web3_manager.event_manager.functions.createEvent(
+        # Build transaction using the primary oracle account (only oracle can create events).
+        # Creation is pinned to it so every event has the same on-chain organiser.
+        function_call = async_web3_manager.event_manager.functions.createEvent(
             request.name,
             request.venue,
             request.date,
@@ -62,8 +71,10 @@ async def create_event(
             request.total_tickets,
         )
 
-        txn = web3_manager.build_transaction(function_call)
-        tx_hash = web3_manager.sign_and_send_transaction(txn)
+        txn = await async_web3_manager.build_transaction(
+            function_call, signer=async_web3_manager.oracle_account
+        )
+        tx_hash = await async_web3_manager.sign_and_send_transaction(txn)
 
         return {
             "success": True,
@@ -71,6 +82,8 @@ async def create_event(
             "message": f"Event '{request.name}' created successfully",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create event: {str(e)}")
 
@@ -87,59 +100,19 @@ async def create_multi_day_event(
     """Create a multi-day event - requires admin or organiser role"""
     try:
         # Check Web3 connection
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
 
-        # Validate inputs
-        if not request.name.strip():
-            raise HTTPException(status_code=400, detail="Event name cannot be empty")
-
-        if len(request.dates) < 2:
-            raise HTTPException(
-                status_code=400, detail="Multi-day event requires at least 2 days"
-            )
-
-        if len(request.dates) != len(request.venues):
-            raise HTTPException(
-                status_code=400, detail="Dates and venues length mismatch"
-            )
-
-        if len(request.dates) != len(request.tickets_per_day):
-            raise HTTPException(
-                status_code=400, detail="Dates and tickets per day length mismatch"
-            )
-
-        if len(request.dates) != len(request.swappable_flags):
-            raise HTTPException(
-                status_code=400, detail="Dates and swappable flags length mismatch"
-            )
-
-        for i, date in enumerate(request.dates):
-            if date <= 0:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid date for day {i+1}"
-                )
-
-        for i, venue in enumerate(request.venues):
-            if not venue.strip():
-                raise HTTPException(
-                    status_code=400, detail=f"Venue cannot be empty for day {i+1}"
-                )
-
-        if request.price <= 0:
-            raise HTTPException(status_code=400, detail="Price must be greater than 0")
-
-        for i, tickets in enumerate(request.tickets_per_day):
-            if tickets <= 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Tickets per day must be greater than 0 for day {i+1}",
-                )
+        # Validate inputs (shared with the bulk import)
+        try:
+            validate_multi_day_event(request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Build transaction using web3_manager oracle account
-        function_call = web3_manager.event_manager.functions.createMultiDayEvent(
+        # Build transaction using the primary oracle account, like single-day events
+        function_call = async_web3_manager.event_manager.functions.createMultiDayEvent(
             request.name,
             request.dates,
             request.venues,
@@ -149,9 +122,11 @@ async def create_multi_day_event(
         )
 
         # Multi-day events require higher gas limit due to multiple storage operations
-        gas_limit = 800000 + (len(request.dates) * 200000)  # Base + per-day costs
-        txn = web3_manager.build_transaction(function_call, gas=gas_limit)
-        tx_hash = web3_manager.sign_and_send_transaction(txn)
+        gas_limit = multi_day_gas(len(request.dates))
+        txn = await async_web3_manager.build_transaction(
+            function_call, gas=gas_limit, signer=async_web3_manager.oracle_account
+        )
+        tx_hash = await async_web3_manager.sign_and_send_transaction(txn)
 
         return {
             "success": True,
@@ -159,49 +134,146 @@ async def create_multi_day_event(
             "message": f"Multi-day event '{request.name}' created successfully with {len(request.dates)} days",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to create multi-day event: {str(e)}"
         )
 
 
+@router.post("/import", summary="Create many events and multi-day events at once")
+async def import_events(
+    request: Request,
+    dry_run: bool = Query(False, description="Only validate the rows"),
+    wait: bool = Query(True, description="Wait for the receipts and report event ids"),
+    user_info: dict = Depends(
+        require_roles(
+            ["admin", "organiser"]
+        ),  # Authorization: admin or organiser roles required
+    ),
+):
+    """
+    Bulk import from a JSON body, or CSV with Content-Type text/csv - requires admin
+    or organiser role. Every row is validated before any transaction is sent.
+    """
+    try:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "json"
+        try:
+            rows = parse_rows((await request.body()).decode(), fmt)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if not rows:
+            raise HTTPException(status_code=400, detail="No events to import")
+        if len(rows) > config.EVENT_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {config.EVENT_IMPORT_MAX_ROWS} events per import",
+            )
+
+        requests, errors = event_importer.validate(rows)
+        if errors:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "Invalid rows, nothing was imported",
+                    "errors": errors,
+                },
+            )
+        if dry_run:
+            return {"success": True, "dry_run": True, "valid_rows": len(requests)}
+
+        if not await async_web3_manager.is_connected():
+            raise HTTPException(
+                status_code=503, detail="Blockchain connection unavailable"
+            )
+
+        results = await event_importer.submit(requests)
+        if wait:
+            results = await event_importer.wait(results)
+        return {"success": True, **summarize(results)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to import events: {str(e)}"
+        )
+
+
 @router.get("/all", summary="List all events")
-async def fetch_all_events():
+async def fetch_all_events(
+    request: Request,
+    active: Optional[bool] = Query(None, description="Only open (or closed) events"),
+    venue: Optional[str] = Query(None, description="Venue contains this text"),
+    date_from: Optional[int] = Query(None, description="Earliest date (Unix time)"),
+    date_to: Optional[int] = Query(None, description="Latest date (Unix time)"),
+    organiser: Optional[str] = Query(None, description="Organiser address"),
+    multi_day: Optional[bool] = Query(None, description="Only multi-day events"),
+    sort: Optional[str] = Query(None, description=", ".join(EVENT_SORTS)),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size"),
+):
+    """All events, or a filtered page of them when any query parameter is given"""
+    if sort is not None and sort not in EVENT_SORTS:
+        raise HTTPException(
+            status_code=400, detail=f"sort must be one of {', '.join(EVENT_SORTS)}"
+        )
+    filters = dict(
+        active=active,
+        venue=venue,
+        date_from=date_from,
+        date_to=date_to,
+        organiser=organiser,
+        multi_day=multi_day,
+        sort=sort,
+        cursor=cursor,
+        limit=limit,
+    )
+
     try:
         # Check Web3 connection
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
-        total_num_of_events = web3_manager.event_manager.functions.eventCounter().call()
-        event_holder = []
-        for i in range(1, total_num_of_events + 1):
-            try:
-                ev = web3_manager.event_manager.functions.events(i).call()
-                event_holder.append(
-                    {
-                        "id": int(ev[0]),
-                        "organiser": ev[1],
-                        "name": ev[2],
-                        "venue": ev[3],
-                        "date": int(ev[4]),
-                        "ticketPrice": int(ev[5]),
-                        "totalTickets": int(ev[6]),
-                        "ticketsSold": int(ev[7]),
-                        "isActive": bool(ev[8]),
-                        "isMultiDay": bool(ev[9]),
-                    }
-                )
-            except Exception:
-                continue
-        return event_holder
 
+        # Paginated envelope only when asked for; plain requests keep the full array
+        if any(value is not None for value in filters.values()):
+            filters["sort"] = sort or "id"
+            filters["limit"] = limit or config.EVENTS_PAGE_SIZE
+            events, next_cursor = await event_catalog.query(**filters)
+            return {
+                "events": events,
+                "count": len(events),
+                "next_cursor": next_cursor,
+            }
+
+        # Pre-serialised catalog, caught up from new logs only
+        body, etag = await event_catalog.snapshot()
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in _parse_if_none_match(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to list ongoing events: {str(e)}"
         )
 
 
+def _parse_if_none_match(header):
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
 @router.post("/{event_id}/close", summary="Close event (organiser/admin only)")
 def close_event(
     event_id: int, user_info: dict = Depends(require_roles(["admin", "organiser"]))
@@ -225,15 +297,6 @@ def close_event(
                 "event_id": event_id,
             }
 
-        # ensure oracle signer is available in web3_manager
-        signer = getattr(web3_manager, "oracle_account", None) or getattr(
-            web3_manager, "oracle_private_key", None
-        )
-        if signer is None:
-            raise HTTPException(
-                status_code=500, detail="oracle signer not configured on server"
-            )
-
         # build, sign and send tx
         try:
             fn_call = web3_manager.event_manager.functions.closeEvent(event_id)
@@ -256,7 +319,7 @@ def close_event(
 async def get_event_details(event_id: int):
     """Get details of a specific event (handles both regular and multi-day events)"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -266,7 +329,9 @@ async def get_event_details(event_id: int):
 
         # Get event details
         try:
-            event = web3_manager.event_manager.functions.events(event_id).call()
+            event = await async_web3_manager.cached_call(
+                async_web3_manager.event_manager.functions.events(event_id)
+            )
             (
                 event_id_ret,
                 organiser,
@@ -287,44 +352,21 @@ async def get_event_details(event_id: int):
         is_multi_day = is_multi_day_flag
         if is_multi_day:
             try:
-                sub_event_ids = web3_manager.event_manager.functions.getSubEvents(
-                    event_id
-                ).call()
-                for sub_event_id in sub_event_ids:
-                    try:
-                        sub_event = (
-                            web3_manager.event_manager.functions.getSubEventDetails(
-                                sub_event_id
-                            ).call()
-                        )
-                        (
-                            se_id,
-                            parent_id,
-                            day_index,
-                            se_date,
-                            se_venue,
-                            se_swappable,
-                            se_total_tickets,
-                            se_tickets_sold,
-                        ) = sub_event
-
-                        sub_events.append(
-                            {
-                                "sub_event_id": se_id,
-                                "day_index": day_index,
-                                "date": se_date,
-                                "venue": se_venue,
-                                "tickets_sold": se_tickets_sold,
-                                "tickets_available": se_total_tickets,
-                                "tickets_remaining": se_total_tickets - se_tickets_sold,
-                                "swappable": se_swappable,
-                            }
-                        )
-                    except Exception as e:
-                        print(
-                            f"Warning: Could not get details for sub-event {sub_event_id}: {e}"
-                        )
-                        continue
+                # All days in one batched read; immutable fields cached per sub-event
+                for sub_event in await sub_events_service.fetch(event_id):
+                    sub_events.append(
+                        {
+                            "sub_event_id": sub_event["sub_event_id"],
+                            "day_index": sub_event["day_index"],
+                            "date": sub_event["date"],
+                            "venue": sub_event["venue"],
+                            "tickets_sold": sub_event["tickets_sold"],
+                            "tickets_available": sub_event["total_tickets"],
+                            "tickets_remaining": sub_event["total_tickets"]
+                            - sub_event["tickets_sold"],
+                            "swappable": sub_event["swappable"],
+                        }
+                    )
             except Exception:
                 # Error getting sub-events
                 print(f"Warning: Could not get sub-events for event {event_id}")
@@ -336,7 +378,7 @@ async def get_event_details(event_id: int):
             "name": name,
             "is_multi_day": is_multi_day,
             "ticket_price_wei": ticket_price,
-            "ticket_price_eth": web3_manager.w3.from_wei(ticket_price, "ether"),
+            "ticket_price_eth": async_web3_manager.w3.from_wei(ticket_price, "ether"),
             "total_tickets": total_tickets,
             "tickets_sold": tickets_sold,
             "tickets_available": total_tickets - tickets_sold,
@@ -374,10 +416,8 @@ async def buy_tickets(
     ),  # Authentication required, any role
 ):
     """Buy tickets - requires authentication and active in queue but any role is allowed"""
-
     try:
         user_address = user_info["wallet_address"]
-        user_private_key = user_info["private_key"]
         if not is_allowed_purchased(user_address.lower()):
             raise HTTPException(
                 status_code=403, detail="Please wait in the queue, not your turn yet"
@@ -387,11 +427,6 @@ async def buy_tickets(
 
         leave_result = leave_queue(user_address.lower())
 
-        if not web3_manager.is_connected():
-            raise HTTPException(
-                status_code=503, detail="Blockchain connection unavailable"
-            )
-
         if request.event_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid event ID")
 
@@ -400,9 +435,39 @@ async def buy_tickets(
                 status_code=400, detail="Quantity must be greater than 0"
             )
 
+        if purchase_jobs.enabled:
+            return _queue_purchase(
+                "ticket_purchase",
+                {"request": request.model_dump(), "leave_result": leave_result},
+                user_info,
+            )
+
+        return await _buy_tickets(request, user_info, leave_result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to buy tickets: {str(e)}")
+
+
+async def _buy_tickets(request, user_info, leave_result):
+    """Chain steps of /events/buy, run inside the request or by a purchase worker"""
+    reservation = None
+
+    try:
+        user_address = user_info["wallet_address"]
+
+        if not await async_web3_manager.is_connected():
+            raise HTTPException(
+                status_code=503, detail="Blockchain connection unavailable"
+            )
+
         # Get event details to calculate total price
         try:
-            event = web3_manager.event_manager.functions.events(request.event_id).call()
+            block = await async_web3_manager.latest_block()
+            event = await async_web3_manager.event_manager.functions.events(
+                request.event_id
+            ).call(block_identifier=block)
             (
                 event_id,
                 organiser,
@@ -428,114 +493,154 @@ async def buy_tickets(
                 detail=f"Not enough tickets available. Only {total_tickets - tickets_sold} tickets left",
             )
 
+        # Hold the seats before anything is signed; concurrent oversells stop here
+        reservation = _reserve_seats(
+            event_scope(request.event_id),
+            request.quantity,
+            total_tickets,
+            tickets_sold,
+            block,
+            "Not enough tickets available",
+        )
+
         # Calculate total price
         total_price = ticket_price * request.quantity
 
-        # Handle loyalty points redemption if requested
+        # Quote the loyalty discount locally; redeemPointsTicket is sent with the purchase
         loyalty_discount = 0
         points_redeemed = 0
         if request.use_loyalty_points:
             try:
-                # Check if user has approved loyalty system
-                allowance = web3_manager.get_points_allowance(user_address)
-                points_available = web3_manager.preview_points_available(
-                    user_address, total_price
-                )
-
-                if points_available > 0:
-                    if allowance < points_available:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Insufficient loyalty points allowance. Please approve LoyaltySystem first.",
-                        )
-
-                    # Redeem loyalty points for discount
-                    oracle_account = web3_manager.get_user_account_by_index(0)
-                    function_call = (
-                        web3_manager.loyalty_system.functions.redeemPointsTicket(
-                            web3_manager.w3.to_checksum_address(user_address),
-                            int(total_price),
-                        )
-                    )
-
-                    txn = web3_manager.build_user_transaction(
-                        function_call, oracle_account, gas=200000
-                    )
-                    redeem_tx_hash = web3_manager.sign_and_send_user_transaction(
-                        txn, oracle_account
-                    )
-
-                    # Get transaction receipt to parse events
-                    receipt = web3_manager.w3.eth.wait_for_transaction_receipt(
-                        redeem_tx_hash
+                allowance, points_available, discount = (
+                    await async_web3_manager.quote_ticket_redemption(
+                        user_address, total_price
                     )
-                    redeem_events = web3_manager.loyalty_system.events.PointsRedeemedTicket().process_receipt(
-                        receipt
-                    )
-
-                    if redeem_events:
-                        points_redeemed = redeem_events[0]["args"]["pointsBurned"]
-                        loyalty_discount = redeem_events[0]["args"]["weiDiscount"]
-
-            except HTTPException:
-                raise
+                )
             except Exception as e:
                 raise HTTPException(
                     status_code=400, detail=f"Failed to redeem loyalty points: {str(e)}"
                 )
 
+            if points_available > 0:
+                if allowance < points_available:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Insufficient loyalty points allowance. Please approve LoyaltySystem first.",
+                    )
+                points_redeemed = points_available
+                loyalty_discount = discount
+
         # Calculate final price after loyalty discount
         final_price = total_price - loyalty_discount
 
-        # Get user account for this purchase
-        user_account_obj = web3_manager.get_user_account(user_address, user_private_key)
+        # Get user account for this purchase; a cache miss reads the key from Postgres,
+        # so keep it off the event loop (this also runs in the purchase job workers)
+        user_account_obj = await run_in_threadpool(get_user_signing_account, user_info)
         user_address = user_account_obj.address
 
         # Check user has enough ETH for the final price (after discount if applicable)
         required_balance = final_price if loyalty_discount > 0 else total_price
-        user_balance = web3_manager.get_account_balance(user_address)
+        user_balance = await async_web3_manager.get_account_balance(user_address)
         if user_balance < required_balance:
             discount_msg = (
-                f" (after {web3_manager.w3.from_wei(loyalty_discount, 'ether')} ETH loyalty discount)"
+                f" (after {async_web3_manager.w3.from_wei(loyalty_discount, 'ether')} ETH loyalty discount)"
                 if loyalty_discount > 0
                 else ""
             )
             raise HTTPException(
                 status_code=400,
-                detail=f"Insufficient balance. Need {web3_manager.w3.from_wei(required_balance, 'ether')} ETH for ticket purchase{discount_msg}, have {web3_manager.w3.from_wei(user_balance, 'ether')} ETH.",
+                detail=f"Insufficient balance. Need {async_web3_manager.w3.from_wei(required_balance, 'ether')} ETH for ticket purchase{discount_msg}, have {async_web3_manager.w3.from_wei(user_balance, 'ether')} ETH.",
             )
 
         # Choose the appropriate function based on whether loyalty discount is applied
         if loyalty_discount > 0:
             # Use buyTicketsWithDiscount function (oracle only) - no loyalty points awarded
-            oracle_account = web3_manager.get_user_account_by_index(0)
-            function_call = web3_manager.event_manager.functions.buyTicketsWithDiscount(
-                request.event_id, request.quantity, user_address, total_price
+            function_call = (
+                async_web3_manager.event_manager.functions.buyTicketsWithDiscount(
+                    request.event_id, request.quantity, user_address, total_price
+                )
+            )
+            redeem_call = (
+                async_web3_manager.loyalty_system.functions.redeemPointsTicket(
+                    async_web3_manager.w3.to_checksum_address(user_address),
+                    int(total_price),
+                )
             )
 
-            # Build and send the transaction from oracle account with discounted price
-            txn = web3_manager.build_user_transaction(
-                function_call, oracle_account, gas=500000
+            # Redemption and purchase go out back to back from one oracle signer, the
+            # purchase with the next nonce, without waiting for the redemption receipt;
+            # batched with other discounted purchases when PURCHASE_BATCH_WINDOW_MS is set
+            redeem_tx_hash, tx_hash = await purchase_batcher.submit_chain(
+                request.event_id,
+                [(redeem_call, 0), (function_call, final_price)],
+                gas=500000,
             )
-            txn["value"] = final_price  # Pay only the discounted amount
+            if isinstance(redeem_tx_hash, Exception):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to redeem loyalty points: {str(redeem_tx_hash)}",
+                )
 
-            tx_hash = web3_manager.sign_and_send_user_transaction(txn, oracle_account)
+            # The redemption log is checked against this quote once it is mined; a
+            # redemption whose purchase was not sent is recorded as orphaned
+            purchase_failed = isinstance(tx_hash, Exception)
+            redemption_meta = {
+                "event_id": request.event_id,
+                "buyer": user_address,
+                "purchase_tx": None if purchase_failed else tx_hash,
+                "loyalty_quote": {
+                    "points": points_redeemed,
+                    "discount_wei": loyalty_discount,
+                },
+            }
+            if purchase_failed:
+                redemption_meta["orphaned"] = str(tx_hash)
+            await run_in_threadpool(
+                tx_tracker.track_sent,
+                redeem_tx_hash,
+                "loyalty_redemption",
+                events=["loyalty_system.PointsRedeemedTicket"],
+                meta=redemption_meta,
+            )
+            if purchase_failed:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Loyalty points redemption {redeem_tx_hash.hex()} was sent but the purchase failed: {str(tx_hash)}",
+                )
         else:
             # Use regular buyTickets function - loyalty points will be awarded
-            function_call = web3_manager.event_manager.functions.buyTickets(
+            function_call = async_web3_manager.event_manager.functions.buyTickets(
                 request.event_id, request.quantity
             )
 
             # Build and send the transaction from user account
-            txn = web3_manager.build_user_transaction(
+            txn = await async_web3_manager.build_user_transaction(
                 function_call, user_account_obj, gas=500000
             )
             txn["value"] = total_price  # Pay full price
 
-            tx_hash = web3_manager.sign_and_send_user_transaction(txn, user_account_obj)
+            tx_hash = await async_web3_manager.sign_and_send_user_transaction(
+                txn, user_account_obj
+            )
 
         # No refund needed - payment was made at the correct discounted amount
 
+        # Mining is followed by the transaction tracker instead of blocking here
+        status_url = await run_in_threadpool(
+            tx_tracker.track_sent,
+            tx_hash,
+            "ticket_purchase",
+            events=["event_manager.TicketsPurchased"],
+            meta={
+                "event_id": request.event_id,
+                "quantity": request.quantity,
+                "buyer": user_address,
+                "reservation": reservation,
+            },
+        )
+        # The tracker settles the reservation once the purchase is mined
+        reservation = None
+
         # Loyalty points are awarded by EventManager only when no discount is used
         if loyalty_discount > 0:
             loyalty_points_awarded = 0  # No points awarded when discount is used
@@ -550,9 +655,9 @@ async def buy_tickets(
             "event_id": request.event_id,
             "quantity": request.quantity,
             "original_price_wei": total_price,
-            "original_price_eth": web3_manager.w3.from_wei(total_price, "ether"),
+            "original_price_eth": async_web3_manager.w3.from_wei(total_price, "ether"),
             "final_price_wei": final_price,
-            "final_price_eth": web3_manager.w3.from_wei(final_price, "ether"),
+            "final_price_eth": async_web3_manager.w3.from_wei(final_price, "ether"),
             "buyer_address": user_address,
             "loyalty_points_awarded": loyalty_points_awarded,
         }
@@ -563,23 +668,37 @@ async def buy_tickets(
                 {
                     "loyalty_points_redeemed": points_redeemed,
                     "loyalty_discount_wei": loyalty_discount,
-                    "loyalty_discount_eth": web3_manager.w3.from_wei(
+                    "loyalty_discount_eth": async_web3_manager.w3.from_wei(
                         loyalty_discount, "ether"
                     ),
-                    "message": f"Successfully purchased {request.quantity} ticket(s) for event {request.event_id}. Paid {web3_manager.w3.from_wei(final_price, 'ether')} ETH with loyalty discount. Redeemed {points_redeemed} loyalty points. No new loyalty points awarded (used existing points for discount).",
+                    "message": f"Successfully purchased {request.quantity} ticket(s) for event {request.event_id}. Paid {async_web3_manager.w3.from_wei(final_price, 'ether')} ETH with loyalty discount. Redeemed {points_redeemed} loyalty points. No new loyalty points awarded (used existing points for discount).",
                 }
             )
         else:
             response["message"] = (
-                f"Successfully purchased {request.quantity} ticket(s) for event {request.event_id}. User {user_address} paid {web3_manager.w3.from_wei(total_price, 'ether')} ETH and received NFTs. Loyalty points automatically awarded by EventManager contract."
+                f"Successfully purchased {request.quantity} ticket(s) for event {request.event_id}. User {user_address} paid {async_web3_manager.w3.from_wei(total_price, 'ether')} ETH and received NFTs. Loyalty points automatically awarded by EventManager contract."
             )
+        # Only when the tracker could record it; the purchase went out either way
+        if status_url:
+            response["status_url"] = status_url
 
         return response
+    finally:
+        if reservation:
+            inventory.release(reservation["scope"], reservation["id"])
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to buy tickets: {str(e)}")
+
+def _reserve_seats(scope, quantity, total, sold, block, message):
+    """Reservation record for the tracker meta (None when Redis is unavailable)"""
+    try:
+        reservation_id = inventory.reserve(scope, quantity, total, sold, block)
+    except InventoryExhausted as e:
+        raise HTTPException(
+            status_code=400, detail=f"{message}. Only {e.available} tickets left"
+        )
+    if reservation_id is None:
+        return None
+    return {"scope": scope, "id": reservation_id}
 
 
 @router.post("/sub-events/buy", summary="Buy tickets for a specific sub-event")
@@ -591,11 +710,6 @@ async def buy_sub_event_tickets(
 ):
     """Buy tickets for a specific sub-event (multi-day events) - requires authentication"""
     try:
-        if not web3_manager.is_connected():
-            raise HTTPException(
-                status_code=503, detail="Blockchain connection unavailable"
-            )
-
         if request.sub_event_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid sub-event ID")
 
@@ -604,14 +718,43 @@ async def buy_sub_event_tickets(
                 status_code=400, detail="Quantity must be greater than 0"
             )
 
+        if purchase_jobs.enabled:
+            return _queue_purchase(
+                "sub_event_ticket_purchase",
+                {"request": request.model_dump()},
+                user_info,
+            )
+
+        return await _buy_sub_event_tickets(request, user_info)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to buy sub-event tickets: {str(e)}"
+        )
+
+
+async def _buy_sub_event_tickets(request, user_info):
+    """Chain steps of /events/sub-events/buy, run inside the request or by a purchase worker"""
+    reservation = None
+
+    try:
+        if not await async_web3_manager.is_connected():
+            raise HTTPException(
+                status_code=503, detail="Blockchain connection unavailable"
+            )
+
         user_wallet_address = user_info["wallet_address"]
-        user_private_key = user_info["private_key"]
 
         # Get sub-event details
         try:
-            sub_event = web3_manager.event_manager.functions.getSubEventDetails(
-                request.sub_event_id
-            ).call()
+            block = await async_web3_manager.latest_block()
+            sub_event = (
+                await async_web3_manager.event_manager.functions.getSubEventDetails(
+                    request.sub_event_id
+                ).call(block_identifier=block)
+            )
             (
                 sub_event_id,
                 parent_event_id,
@@ -624,9 +767,9 @@ async def buy_sub_event_tickets(
             ) = sub_event
 
             # Get parent event for price
-            parent_event = web3_manager.event_manager.functions.events(
+            parent_event = await async_web3_manager.event_manager.functions.events(
                 parent_event_id
-            ).call()
+            ).call(block_identifier=block)
             (
                 event_id,
                 organiser,
@@ -634,9 +777,10 @@ async def buy_sub_event_tickets(
                 _,  # venue (not used for sub-events)
                 _,  # date (not used for sub-events)
                 ticket_price,
-                total_tickets,
+                _,  # totalTickets (checked at sub-event level)
                 _,  # tickets_sold (tracked at sub-event level)
                 is_active,
+                _,  # isMultiDay (not needed here)
             ) = parent_event
 
         except Exception as e:
@@ -654,41 +798,67 @@ async def buy_sub_event_tickets(
                 detail=f"Not enough tickets available for this day. Only {total_tickets - tickets_sold} tickets left",
             )
 
+        # Hold the seats before anything is signed; concurrent oversells stop here
+        reservation = _reserve_seats(
+            sub_event_scope(request.sub_event_id),
+            request.quantity,
+            total_tickets,
+            tickets_sold,
+            block,
+            "Not enough tickets available for this day",
+        )
+
         # Calculate total price
         total_price = ticket_price * request.quantity
 
-        # Get user account for this purchase
-        user_account_obj = web3_manager.get_user_account(
-            user_wallet_address, user_private_key
-        )
+        # Get user account for this purchase; a cache miss reads the key from Postgres,
+        # so keep it off the event loop (this also runs in the purchase job workers)
+        user_account_obj = await run_in_threadpool(get_user_signing_account, user_info)
         user_address = user_account_obj.address
 
         # Check user has enough ETH
-        user_balance = web3_manager.get_account_balance(user_address)
+        user_balance = await async_web3_manager.get_account_balance(user_address)
         if user_balance < total_price:
             raise HTTPException(
                 status_code=400,
-                detail=f"Insufficient balance. Need {web3_manager.w3.from_wei(total_price, 'ether')} ETH, have {web3_manager.w3.from_wei(user_balance, 'ether')} ETH",
+                detail=f"Insufficient balance. Need {async_web3_manager.w3.from_wei(total_price, 'ether')} ETH, have {async_web3_manager.w3.from_wei(user_balance, 'ether')} ETH",
             )
 
         # Use buySubEventTickets function
-        function_call = web3_manager.event_manager.functions.buySubEventTickets(
+        function_call = async_web3_manager.event_manager.functions.buySubEventTickets(
             request.sub_event_id, request.quantity
         )
 
         # Build and send the transaction from user account
-        txn = web3_manager.build_user_transaction(
+        txn = await async_web3_manager.build_user_transaction(
             function_call, user_account_obj, gas=500000
         )
         txn["value"] = total_price
 
-        tx_hash = web3_manager.sign_and_send_user_transaction(txn, user_account_obj)
+        tx_hash = await async_web3_manager.sign_and_send_user_transaction(
+            txn, user_account_obj
+        )
+
+        status_url = await run_in_threadpool(
+            tx_tracker.track_sent,
+            tx_hash,
+            "sub_event_ticket_purchase",
+            events=["event_manager.SubEventTicketsPurchased"],
+            meta={
+                "sub_event_id": request.sub_event_id,
+                "quantity": request.quantity,
+                "buyer": user_address,
+                "reservation": reservation,
+            },
+        )
+        # The tracker settles the reservation once the purchase is mined
+        reservation = None
 
         # Loyalty points are now automatically awarded by the EventManager contract
         # No need to manually award them here
         loyalty_points_awarded = "automatically_awarded_by_contract"
 
-        return {
+        response = {
             "success": True,
             "tx_hash": tx_hash.hex(),
             "sub_event_id": request.sub_event_id,
@@ -699,19 +869,68 @@ async def buy_sub_event_tickets(
             "date": date,
             "quantity": request.quantity,
             "total_price_wei": total_price,
-            "total_price_eth": web3_manager.w3.from_wei(total_price, "ether"),
+            "total_price_eth": async_web3_manager.w3.from_wei(total_price, "ether"),
             "buyer_address": user_address,
             "loyalty_points_awarded": loyalty_points_awarded,
             "message": f"Successfully purchased {request.quantity} ticket(s) for day {day_index + 1} of event '{name}'. Loyalty points automatically awarded by EventManager contract.",
         }
+        # Only when the tracker could record it; the purchase went out either way
+        if status_url:
+            response["status_url"] = status_url
+        return response
+    finally:
+        if reservation:
+            inventory.release(reservation["scope"], reservation["id"])
 
-    except HTTPException:
-        raise
+
+def _queue_purchase(kind, payload, user_info):
+    """Hand a validated purchase to the purchase workers and answer 202"""
+    job_id = purchase_jobs.enqueue(kind, payload, user_info)
+    return JSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/events/jobs/{job_id}",
+        },
+    )
+
+
+async def _run_ticket_purchase_job(payload, user_info):
+    return await _buy_tickets(
+        BuyTicketsRequest(**payload["request"]), user_info, payload["leave_result"]
+    )
+
+
+async def _run_sub_event_purchase_job(payload, user_info):
+    return await _buy_sub_event_tickets(
+        BuySubEventTicketsRequest(**payload["request"]), user_info
+    )
+
+
+purchase_jobs.register("ticket_purchase", _run_ticket_purchase_job)
+purchase_jobs.register("sub_event_ticket_purchase", _run_sub_event_purchase_job)
+
+
+@router.get("/jobs/{job_id}", summary="Get status of a queued purchase")
+def get_purchase_job(
+    job_id: str,
+    user_info: dict = Depends(require_authenticated_user),
+):
+    """Queued/running/succeeded/failed, with the purchase response once it succeeded"""
+    try:
+        job = purchase_jobs.get(job_id)
     except Exception as e:
         raise HTTPException(
-            status_code=500, detail=f"Failed to buy sub-event tickets: {str(e)}"
+            status_code=500, detail=f"Failed to get purchase job: {str(e)}"
         )
 
+    # Jobs are only visible to the user who queued them
+    if job is None or job["owner"] != user_info["wallet_address"].lower():
+        raise HTTPException(status_code=404, detail="Purchase job not found or expired")
+    return job
+
 
 @router.post("/tickets/swap/check", summary="Check if two tickets can be swapped")
 async def check_swap_eligibility(
@@ -720,31 +939,39 @@ async def check_swap_eligibility(
 ):
     """Check if two tickets are eligible for swapping"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
 
         # Check if tickets can be swapped
-        can_swap = web3_manager.event_manager.functions.canSwapTickets(
+        can_swap = await async_web3_manager.event_manager.functions.canSwapTickets(
             request.ticket_id_1, request.ticket_id_2
         ).call()
 
         # Get ticket details for additional info
         try:
-            ticket_1_sub_event = web3_manager.ticket_nft.functions.getSubEventId(
-                request.ticket_id_1
-            ).call()
-            ticket_2_sub_event = web3_manager.ticket_nft.functions.getSubEventId(
-                request.ticket_id_2
-            ).call()
+            ticket_1_sub_event = (
+                await async_web3_manager.ticket_nft.functions.getSubEventId(
+                    request.ticket_id_1
+                ).call()
+            )
+            ticket_2_sub_event = (
+                await async_web3_manager.ticket_nft.functions.getSubEventId(
+                    request.ticket_id_2
+                ).call()
+            )
 
-            parent_1 = web3_manager.event_manager.functions.getParentEventId(
-                ticket_1_sub_event
-            ).call()
-            parent_2 = web3_manager.event_manager.functions.getParentEventId(
-                ticket_2_sub_event
-            ).call()
+            parent_1 = (
+                await async_web3_manager.event_manager.functions.getParentEventId(
+                    ticket_1_sub_event
+                ).call()
+            )
+            parent_2 = (
+                await async_web3_manager.event_manager.functions.getParentEventId(
+                    ticket_2_sub_event
+                ).call()
+            )
 
         except Exception:
             # If we can't get details, just return the basic check
@@ -771,6 +998,46 @@ async def check_swap_eligibility(
         )
 
 
+@router.post(
+    "/tickets/swap/check-bulk", summary="Check swap eligibility of many ticket pairs"
+)
+async def check_swap_eligibility_bulk(
+    request: BulkSwapEligibilityRequest,
+    user_info: dict = Depends(require_authenticated_user),
+):
+    """Check many ticket pairs at once, with the rules of EventManager.canSwapTickets"""
+    try:
+        if not request.pairs:
+            raise HTTPException(status_code=400, detail="No ticket pairs given")
+        if len(request.pairs) > config.SWAP_CHECK_MAX_PAIRS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {config.SWAP_CHECK_MAX_PAIRS} ticket pairs per request",
+            )
+
+        if not await async_web3_manager.is_connected():
+            raise HTTPException(
+                status_code=503, detail="Blockchain connection unavailable"
+            )
+
+        block, results = await swap_eligibility.check_pairs(
+            [(pair.ticket_id_1, pair.ticket_id_2) for pair in request.pairs]
+        )
+        return {
+            "block_number": block,
+            "count": len(results),
+            "eligible_count": sum(1 for result in results if result["can_swap"]),
+            "results": results,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to check swap eligibility: {str(e)}"
+        )
+
+
 @router.post(
     "/tickets/swap/approve", summary="Approve EventManager for ticket swapping"
 )
@@ -779,30 +1046,29 @@ async def approve_for_swapping(
 ):
     """Approve the EventManager contract to manage user's tickets for swapping"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
 
         user_wallet_address = user_info["wallet_address"]
-        user_private_key = user_info["private_key"]
 
         # Get user account
-        user_account_obj = web3_manager.get_user_account(
-            user_wallet_address, user_private_key
-        )
+        user_account_obj = get_user_signing_account(user_info)
 
         # Approve EventManager for all tickets
-        function_call = web3_manager.ticket_nft.functions.setApprovalForAll(
-            web3_manager.event_manager.address, True
+        function_call = async_web3_manager.ticket_nft.functions.setApprovalForAll(
+            async_web3_manager.event_manager.address, True
         )
 
         # Build and send the transaction from user account
-        txn = web3_manager.build_user_transaction(
+        txn = await async_web3_manager.build_user_transaction(
             function_call, user_account_obj, gas=100000
         )
 
-        tx_hash = web3_manager.sign_and_send_user_transaction(txn, user_account_obj)
+        tx_hash = await async_web3_manager.sign_and_send_user_transaction(
+            txn, user_account_obj
+        )
 
         return {
             "success": True,
@@ -826,7 +1092,7 @@ async def check_approval_status(
 ):
     """Check if user has approved the EventManager for ticket operations"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -834,14 +1100,16 @@ async def check_approval_status(
         user_wallet_address = user_info["wallet_address"]
 
         # Check approval status
-        is_approved = web3_manager.event_manager.functions.isApprovedForSwapping(
-            user_wallet_address
-        ).call()
+        is_approved = (
+            await async_web3_manager.event_manager.functions.isApprovedForSwapping(
+                user_wallet_address
+            ).call()
+        )
 
         return {
             "is_approved": is_approved,
             "user_address": user_wallet_address,
-            "event_manager_address": web3_manager.event_manager.address,
+            "event_manager_address": async_web3_manager.event_manager.address,
         }
 
     except Exception as e:
@@ -857,16 +1125,15 @@ async def swap_tickets(
 ):
     """Swap two tickets - user must own one of the tickets and the other user must have approved the swap"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
 
         user_wallet_address = user_info["wallet_address"]
-        user_private_key = user_info["private_key"]
 
         # Validate that tickets can be swapped
-        can_swap = web3_manager.event_manager.functions.canSwapTickets(
+        can_swap = await async_web3_manager.event_manager.functions.canSwapTickets(
             request.ticket_id_1, request.ticket_id_2
         ).call()
 
@@ -876,13 +1143,15 @@ async def swap_tickets(
             )
 
         # Get user account
-        user_account_obj = web3_manager.get_user_account(
-            user_wallet_address, user_private_key
-        )
+        user_account_obj = get_user_signing_account(user_info)
 
         # Verify ownership of one of the tickets
-        owner_1 = web3_manager.ticket_nft.functions.ownerOf(request.ticket_id_1).call()
-        owner_2 = web3_manager.ticket_nft.functions.ownerOf(request.ticket_id_2).call()
+        owner_1 = await async_web3_manager.ticket_nft.functions.ownerOf(
+            request.ticket_id_1
+        ).call()
+        owner_2 = await async_web3_manager.ticket_nft.functions.ownerOf(
+            request.ticket_id_2
+        ).call()
 
         user_owns_ticket_1 = owner_1.lower() == user_account_obj.address.lower()
         user_owns_ticket_2 = owner_2.lower() == user_account_obj.address.lower()
@@ -903,16 +1172,18 @@ async def swap_tickets(
             )
 
         # Execute the swap
-        function_call = web3_manager.event_manager.functions.swapTickets(
+        function_call = async_web3_manager.event_manager.functions.swapTickets(
             request.ticket_id_1, request.ticket_id_2, owner_1, owner_2
         )
 
         # Build and send the transaction from user account
-        txn = web3_manager.build_user_transaction(
+        txn = await async_web3_manager.build_user_transaction(
             function_call, user_account_obj, gas=200000
         )
 
-        tx_hash = web3_manager.sign_and_send_user_transaction(txn, user_account_obj)
+        tx_hash = await async_web3_manager.sign_and_send_user_transaction(
+            txn, user_account_obj
+        )
 
         return {
             "success": True,
@@ -937,7 +1208,7 @@ async def swap_tickets(
 async def get_sub_events(event_id: int):
     """Get all sub-events for a multi-day event"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -945,57 +1216,35 @@ async def get_sub_events(event_id: int):
         if event_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid event ID")
 
-        # Get sub-events
+        # Get sub-events, all days in one batched read
         try:
-            sub_event_ids = web3_manager.event_manager.functions.getSubEvents(
-                event_id
-            ).call()
+            records = await sub_events_service.fetch(event_id)
         except Exception as e:
             raise HTTPException(
                 status_code=404,
                 detail=f"Event not found or has no sub-events: {str(e)}",
             )
 
-        if not sub_event_ids:
+        if not records:
             raise HTTPException(
                 status_code=404, detail="No sub-events found for this event"
             )
 
-        sub_events = []
-        for sub_event_id in sub_event_ids:
-            try:
-                sub_event = web3_manager.event_manager.functions.getSubEventDetails(
-                    sub_event_id
-                ).call()
-                (
-                    se_id,
-                    parent_id,
-                    day_index,
-                    se_date,
-                    se_venue,
-                    se_swappable,
-                    se_total_tickets,
-                    se_tickets_sold,
-                ) = sub_event
-
-                sub_events.append(
-                    {
-                        "sub_event_id": se_id,
-                        "parent_event_id": parent_id,
-                        "day_index": day_index,
-                        "date": se_date,
-                        "venue": se_venue,
-                        "tickets_sold": se_tickets_sold,
-                        "tickets_available": se_total_tickets,
-                        "tickets_remaining": se_total_tickets - se_tickets_sold,
-                        "swappable": se_swappable,
-                    }
-                )
-            except Exception as e:
-                print(
-                    f"Warning: Could not get details for sub-event {sub_event_id}: {e}"
-                )
-                continue
+        sub_events = [
+            {
+                "sub_event_id": sub_event["sub_event_id"],
+                "parent_event_id": sub_event["parent_event_id"],
+                "day_index": sub_event["day_index"],
+                "date": sub_event["date"],
+                "venue": sub_event["venue"],
+                "tickets_sold": sub_event["tickets_sold"],
+                "tickets_available": sub_event["total_tickets"],
+                "tickets_remaining": sub_event["total_tickets"]
+                - sub_event["tickets_sold"],
+                "swappable": sub_event["swappable"],
+            }
+            for sub_event in records
+        ]
 
         return {
             "event_id": event_id,
@@ -1017,7 +1266,7 @@ async def get_sub_events(event_id: int):
 async def get_sub_event_details(sub_event_id: int):
     """Get details of a specific sub-event"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -1027,9 +1276,11 @@ async def get_sub_event_details(sub_event_id: int):
 
         # Get sub-event details
         try:
-            sub_event = web3_manager.event_manager.functions.getSubEventDetails(
-                sub_event_id
-            ).call()
+            sub_event = await async_web3_manager.cached_call(
+                async_web3_manager.event_manager.functions.getSubEventDetails(
+                    sub_event_id
+                )
+            )
             (
                 se_id,
                 parent_id,
@@ -1042,7 +1293,9 @@ async def get_sub_event_details(sub_event_id: int):
             ) = sub_event
 
             # Get parent event for additional info
-            parent_event = web3_manager.event_manager.functions.events(parent_id).call()
+            parent_event = await async_web3_manager.cached_call(
+                async_web3_manager.event_manager.functions.events(parent_id)
+            )
             (
                 event_id,
                 organiser,
@@ -1075,7 +1328,7 @@ async def get_sub_event_details(sub_event_id: int):
             "tickets_remaining": se_total_tickets - se_tickets_sold,
             "swappable": se_swappable,
             "ticket_price_wei": ticket_price,
-            "ticket_price_eth": web3_manager.w3.from_wei(ticket_price, "ether"),
+            "ticket_price_eth": async_web3_manager.w3.from_wei(ticket_price, "ether"),
         }
 
     except HTTPException:
@@ -1097,7 +1350,7 @@ async def set_sub_event_swappable(
 ):
     """Set whether a sub-event's tickets are swappable - requires admin or organiser role"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -1110,19 +1363,21 @@ async def set_sub_event_swappable(
 
         # Verify sub-event exists
         try:
-            web3_manager.event_manager.functions.getSubEventDetails(sub_event_id).call()
+            await async_web3_manager.event_manager.functions.getSubEventDetails(
+                sub_event_id
+            ).call()
         except Exception as e:
             raise HTTPException(
                 status_code=404, detail=f"Sub-event not found: {str(e)}"
             )
 
         # Build transaction using web3_manager oracle account (only oracle can modify)
-        function_call = web3_manager.event_manager.functions.setSubEventSwappable(
+        function_call = async_web3_manager.event_manager.functions.setSubEventSwappable(
             sub_event_id, request.swappable
         )
 
-        txn = web3_manager.build_transaction(function_call)
-        tx_hash = web3_manager.sign_and_send_transaction(txn)
+        txn = await async_web3_manager.build_transaction(function_call)
+        tx_hash = await async_web3_manager.sign_and_send_transaction(txn)
 
         return {
             "success": True,
@@ -1147,7 +1402,7 @@ async def set_sub_event_swappable(
 async def get_ticket_parent_event(ticket_id: int):
     """Get the parent event ID for a given ticket"""
     try:
-        if not web3_manager.is_connected():
+        if not await async_web3_manager.is_connected():
             raise HTTPException(
                 status_code=503, detail="Blockchain connection unavailable"
             )
@@ -1157,15 +1412,17 @@ async def get_ticket_parent_event(ticket_id: int):
 
         # Get sub-event ID for the ticket
         try:
-            sub_event_id = web3_manager.ticket_nft.functions.getSubEventId(
-                ticket_id
-            ).call()
-            parent_event_id = web3_manager.event_manager.functions.getParentEventId(
-                sub_event_id
-            ).call()
-            is_sub_event = web3_manager.event_manager.functions.isSubEvent(
-                sub_event_id
-            ).call()
+            sub_event_id = await async_web3_manager.cached_call(
+                async_web3_manager.ticket_nft.functions.getSubEventId(ticket_id)
+            )
+            parent_event_id = await async_web3_manager.cached_call(
+                async_web3_manager.event_manager.functions.getParentEventId(
+                    sub_event_id
+                )
+            )
+            is_sub_event = await async_web3_manager.cached_call(
+                async_web3_manager.event_manager.functions.isSubEvent(sub_event_id)
+            )
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"Ticket not found: {str(e)}")
 
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel
 from web3_manager import web3_manager as wm
+from tx_tracker import normalize_tx_hash, tx_tracker
 from dependencies.role_deps import (
     require_authenticated_user,
-    get_user_wallet_credentials,
+    get_user_signing_account,
 )
 
 router = APIRouter(prefix="/loyalty", tags=["loyalty"])
@@ -26,7 +27,7 @@ def balance(user_info: dict = Depends(require_authenticated_user)):
     try:
         wallet_address = user_info["wallet_address"]
         bal = wm.get_points_balance(wallet_address)
-        decimals = wm.loyalty_point.functions.decimals().call()
+        decimals = wm.cached_call(wm.loyalty_point.functions.decimals())
         return {
             "success": True,
             "address": wallet_address,
@@ -110,11 +111,8 @@ def approve_loyalty_system(user_info: dict = Depends(require_authenticated_user)
                 "message": "LoyaltySystem is already approved to spend your loyalty points",
             }
 
-        # Get wallet credentials securely only when needed for transaction
-        wallet_address, private_key = get_user_wallet_credentials(user_info)
-
-        # Get user account for signing
-        user_account = wm.get_user_account(wallet_address, private_key)
+        # Get user account for signing (cached after the first derivation)
+        user_account = get_user_signing_account(user_info)
 
         # Approve LoyaltySystem to spend loyalty points
         function_call = wm.loyalty_point.functions.approve(
@@ -175,14 +173,23 @@ def award_points(
     """
     try:
         wallet_address = user_info["wallet_address"]
-        points_awarded = wm.award_loyalty_points(wallet_address, request.wei_amount)
+        tx_hash = wm.award_loyalty_points(wallet_address, request.wei_amount)
+        tx_hash = normalize_tx_hash(tx_hash)
+        status_url = tx_tracker.track_sent(
+            tx_hash,
+            "loyalty_award",
+            events=["loyalty_system.PointsAwarded"],
+            meta={"to_address": wallet_address, "wei_amount": request.wei_amount},
+        )
 
         return {
             "success": True,
+            "tx_hash": tx_hash,
+            "status": "pending",
+            "status_url": status_url,
             "to_address": wallet_address,
             "wei_amount": request.wei_amount,
-            "points_awarded": str(points_awarded),
-            "message": f"Successfully awarded {points_awarded} loyalty points to {wallet_address}",
+            "message": f"Award of loyalty points to {wallet_address} submitted; check /tx/{tx_hash} for the points minted",
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to award points: {e}")
@@ -224,30 +231,24 @@ def redeem_points(
                 detail=f"Insufficient allowance. Please approve LoyaltySystem first. Need {points_available}, have {allowance}",
             )
 
-        # Use oracle account to call redemption (oracle is authorized spender)
-        oracle_account = wm.get_user_account_by_index(0)
-
+        # Oracle account calls redemption (oracle is authorized spender)
         function_call = wm.loyalty_system.functions.redeemPointsTicket(
             wm.w3.to_checksum_address(wallet_address), int(request.ticket_wei)
         )
 
-        txn = wm.build_user_transaction(function_call, oracle_account, gas=200000)
-        tx_hash = wm.sign_and_send_user_transaction(txn, oracle_account)
-
-        # Get transaction receipt to parse events
-        receipt = wm.w3.eth.wait_for_transaction_receipt(tx_hash)
-
-        # Parse the PointsRedeemedTicket event
-        redeem_events = wm.loyalty_system.events.PointsRedeemedTicket().process_receipt(
-            receipt
+        txn = wm.build_transaction(function_call, gas=200000)
+        tx_hash = wm.sign_and_send_transaction(txn)
+        tx_hash = normalize_tx_hash(tx_hash)
+        status_url = tx_tracker.track_sent(
+            tx_hash,
+            "loyalty_redeem_ticket",
+            events=["loyalty_system.PointsRedeemedTicket"],
+            meta={"user_address": wallet_address, "ticket_wei": request.ticket_wei},
         )
 
-        points_redeemed = 0
-        wei_discount = 0
-        if redeem_events:
-            points_redeemed = redeem_events[0]["args"]["pointsBurned"]
-            wei_discount = redeem_events[0]["args"]["weiDiscount"]
-
+        # Expected outcome at submission time; the mined PointsRedeemedTicket
+        # event (pointsBurned, weiDiscount) is reported by /tx/{hash}
+        wei_discount = wm.quote_wei_from_points(points_available)
         wei_due = request.ticket_wei - wei_discount
         discount_pct = (
             round((wei_discount / request.ticket_wei) * 100, 2)
@@ -257,15 +258,19 @@ def redeem_points(
 
         return {
             "success": True,
-            "tx_hash": tx_hash.hex(),
+            "tx_hash": tx_hash,
+            "status": "pending",
+            "status_url": status_url,
             "user_address": wallet_address,
             "ticket_wei": str(request.ticket_wei),
-            "points_redeemed": str(points_redeemed),
+            "points_redeemed": str(points_available),
             "wei_discount": str(wei_discount),
             "wei_due": str(wei_due),
             "discount_percentage": discount_pct,
-            "message": f"Successfully redeemed {points_redeemed} points for {wei_discount} wei discount ({discount_pct}%)",
+            "message": f"Redemption of {points_available} points for {wei_discount} wei discount ({discount_pct}%) submitted",
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to redeem points: {str(e)}"
@@ -305,42 +310,34 @@ def redeem_points(
                 detail=f"Insufficient allowance. Please approve LoyaltySystem first. Need {points_available}, have {allowance}",
             )
 
-        # Use oracle account to call redemption (oracle is authorized spender)
-        oracle_account = wm.get_user_account_by_index(0)
-
+        # Oracle account calls redemption (oracle is authorized spender)
         function_call = wm.loyalty_system.functions.redeemPointsQueue(
             wm.w3.to_checksum_address(wallet_address),
             # change to points
             int(request.ticket_wei),
         )
 
-        # changed here
-        # txn = wm.build_user_transaction(function_call, oracle_account, gas=200000)
-        txn = wm.build_user_transaction(function_call, oracle_account)
-        tx_hash = wm.sign_and_send_user_transaction(txn, oracle_account)
-
-        # Get transaction receipt to parse events
-        receipt = wm.w3.eth.wait_for_transaction_receipt(tx_hash)
-
-        # Parse the PointsRedeemedTicket event
-        redeem_queue = wm.loyalty_system.events.PointsRedeemedQueue().process_receipt(
-            receipt
+        txn = wm.build_transaction(function_call)
+        tx_hash = wm.sign_and_send_transaction(txn)
+        tx_hash = normalize_tx_hash(tx_hash)
+        status_url = tx_tracker.track_sent(
+            tx_hash,
+            "loyalty_redeem_queue",
+            events=["loyalty_system.PointsRedeemedQueue"],
+            meta={"user_address": wallet_address, "ticket_wei": request.ticket_wei},
         )
 
-        points_redeemed = 0
-
-        # check here
-        if redeem_queue:
-            points_redeemed = redeem_queue[0]["args"]["pointsBurned"]
-
         return {
             "success": True,
-            "tx_hash": tx_hash.hex(),
+            "tx_hash": tx_hash,
+            "status": "pending",
+            "status_url": status_url,
             "user_address": wallet_address,
             "ticket_wei": str(request.ticket_wei),
-            "points_redeemed": str(points_redeemed),
-            "message": f"Successfully redeemed {points_redeemed} points for queue priority",
+            "message": f"Redemption of loyalty points for queue priority submitted; check /tx/{tx_hash} for the points burned",
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to redeem points: {str(e)}"
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from models import (
     ListRequest,
     DelistRequest,
@@ -8,11 +10,14 @@ from models import (
     MarketListingsResponse,
     ListingResponse,
 )
-from web3_manager import web3_manager
+from config import config
+from web3_manager import web3_manager, async_web3_manager
 from web3 import Web3
 from typing import Optional
 from routes.auth_route import require_authenticated_user
-from dependencies.role_deps import get_user_wallet_credentials
+from dependencies.role_deps import get_user_signing_account
+from database.db import get_db
+from services.market_index import LISTING_SORTS, filter_listings, market_index
 
 # Initialize router
 router = APIRouter(prefix="/market", tags=["market"])
@@ -31,9 +36,7 @@ def _ensure_contracts():
 def _ensure_ticket_contract():
     ticket = getattr(web3_manager, "ticket_nft", None)
     if ticket is None:
-        raise HTTPException(
-            status_code=500, detail="TicketNFT contract not configured"
-        )
+        raise HTTPException(status_code=500, detail="TicketNFT contract not configured")
     return ticket
 
 
@@ -86,11 +89,11 @@ def approve_resale_market(
                 "message": "ResaleMarket is already approved to transfer your tickets",
             }
 
-        # Get wallet credentials securely only when needed for transaction
-        wallet_address, private_key = get_user_wallet_credentials(user_info)
+        # Get the signing account only when needed for transaction
+        user_account = get_user_signing_account(user_info)
 
         # Approve ResaleMarket
-        tx_hash = web3_manager.approve_resale_market(wallet_address, private_key)
+        tx_hash = web3_manager.approve_resale_market_for_account(user_account)
 
         return {
             "success": True,
@@ -125,13 +128,11 @@ def revoke_resale_market_approval(
                 "message": "ResaleMarket approval was already revoked",
             }
 
-        # Get wallet credentials securely only when needed for transaction
-        wallet_address, private_key = get_user_wallet_credentials(user_info)
+        # Get the signing account only when needed for transaction
+        user_account = get_user_signing_account(user_info)
 
         # Revoke approval
-        tx_hash = web3_manager.revoke_resale_market_approval(
-            wallet_address, private_key
-        )
+        tx_hash = web3_manager.revoke_resale_market_approval_for_account(user_account)
 
         return {
             "success": True,
@@ -157,10 +158,10 @@ def list_ticket(
     resale, mgr = _ensure_contracts()
     ticket_id = req.ticket_id
     price = int(req.price)
-    wallet_address, private_key = get_user_wallet_credentials(user_info)
+    wallet_address = user_info["wallet_address"]
 
     try:
-        seller_acct = web3_manager.get_user_account(wallet_address, private_key)
+        seller_acct = get_user_signing_account(user_info)
         seller_addr = Web3.to_checksum_address(wallet_address)
     except Exception:
         raise HTTPException(status_code=400, detail="invalid wallet credentials")
@@ -203,10 +204,10 @@ def delist_ticket(
 ):
     resale, mgr = _ensure_contracts()
     ticket_id = req.ticket_id
-    wallet_address, private_key = get_user_wallet_credentials(user_info)
+    wallet_address = user_info["wallet_address"]
 
     try:
-        seller_acct = web3_manager.get_user_account(wallet_address, private_key)
+        seller_acct = get_user_signing_account(user_info)
         seller_addr = Web3.to_checksum_address(wallet_address)
     except Exception:
         raise HTTPException(status_code=400, detail="invalid wallet credentials")
@@ -253,10 +254,10 @@ def buy_listing(
     req: BuyListingRequest, user_info: dict = Depends(require_authenticated_user)
 ):
     resale, mgr = _ensure_contracts()
-    wallet_address, private_key = get_user_wallet_credentials(user_info)
+    wallet_address = user_info["wallet_address"]
 
     try:
-        buyer_acct = web3_manager.get_user_account(wallet_address, private_key)
+        buyer_acct = get_user_signing_account(user_info)
         buyer_addr = Web3.to_checksum_address(wallet_address)
     except Exception:
         raise HTTPException(status_code=400, detail="invalid wallet credentials")
@@ -329,83 +330,121 @@ def buy_listing(
 
 
 @router.get("/listings", response_model=MarketListingsResponse)
-async def get_active_listings(user_info: dict = Depends(require_authenticated_user)):
-    """Get all active listings in the marketplace"""
-    resale, mgr = _ensure_contracts()
-    ticket = _ensure_ticket_contract()
+async def get_active_listings(
+    event_id: Optional[int] = Query(None, description="Only listings for this event"),
+    seller: Optional[str] = Query(None, description="Only listings by this address"),
+    min_price: Optional[int] = Query(None, ge=0, description="Minimum price in wei"),
+    max_price: Optional[int] = Query(None, ge=0, description="Maximum price in wei"),
+    sort: str = Query("ticket_id", description="ticket_id, price_asc or price_desc"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size"),
+    user_info: dict = Depends(require_authenticated_user),
+    db: Session = Depends(get_db),
+):
+    """Get active listings in the marketplace, optionally filtered and paginated"""
+    if sort not in LISTING_SORTS:
+        raise HTTPException(
+            status_code=400, detail=f"sort must be one of {', '.join(LISTING_SORTS)}"
+        )
+    filters = dict(
+        event_id=event_id,
+        seller=seller,
+        min_price=min_price,
+        max_price=max_price,
+        sort=sort,
+        cursor=cursor,
+        limit=limit,
+    )
 
     try:
-        # Get the next token ID to know the range of existing tokens
-        next_token_id = ticket.functions.nextTokenId().call()
-        active_listings = []
-
-        # Iterate through all possible token IDs (1 to next_token_id - 1)
-        for token_id in range(1, next_token_id):
-            try:
-                listing = resale.functions.listings(token_id).call()
-                seller_address = listing[0]
-                is_active = bool(listing[3])
-
-                if is_active:
-                    active_listings.append(
-                        ListingResponse(
-                            ticket_id=token_id,
-                            seller_address=seller_address,
-                            price=int(listing[1]),
-                            event_id=int(listing[2]),
-                            is_active=is_active,
-                        )
-                    )
-            except Exception:
-                # Token might not exist or have no listing, continue
-                continue
+        # Served from the indexer's listing table while it is caught up with the chain;
+        # the Postgres queries run in the threadpool to keep the event loop free
+        latest_block = await async_web3_manager.latest_block()
+        if await run_in_threadpool(market_index.is_current, db, latest_block):
+            listings, next_cursor = await run_in_threadpool(
+                market_index.active_listings, db, **filters
+            )
+        else:
+            listings, next_cursor = filter_listings(
+                await _read_active_listings_from_chain(
+                    config.MARKET_LISTINGS_MAX_STALENESS_BLOCKS
+                ),
+                **filters,
+            )
 
         return MarketListingsResponse(
-            listings=active_listings,
-            total=len(active_listings),
+            listings=[ListingResponse(**listing) for listing in listings],
+            total=len(listings),
             message="Successfully retrieved active listings",
+            next_cursor=next_cursor,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch market listings: {str(e)}"
         )
 
 
+async def _read_active_listings_from_chain(max_staleness=0):
+    """Scan every listing on chain (used while the index is unavailable or behind)"""
+    _ensure_contracts()
+    _ensure_ticket_contract()
+    resale = async_web3_manager.market_manager
+    ticket = async_web3_manager.ticket_nft
+
+    # Get the next token ID to know the range of existing tokens
+    next_token_id = await ticket.functions.nextTokenId().call()
+    token_ids = list(range(1, next_token_id))
+
+    # Read every listing (1 to next_token_id - 1) in batched RPC requests
+    listings = await async_web3_manager.batch_call(
+        [resale.functions.listings(token_id) for token_id in token_ids],
+        allow_failure=True,
+        use_cache=True,
+        max_staleness=max_staleness,
+    )
+    active_listings = []
+
+    for token_id, listing in zip(token_ids, listings):
+        if listing is None:
+            # Token might not exist or have no listing, continue
+            continue
+        if bool(listing[3]):
+            active_listings.append(
+                {
+                    "ticket_id": token_id,
+                    "seller_address": listing[0],
+                    "price": int(listing[1]),
+                    "event_id": int(listing[2]),
+                    "is_active": True,
+                }
+            )
+    return active_listings
+
+
 @router.get("/my-listings", response_model=MarketListingsResponse)
-async def get_my_listings(user_info: dict = Depends(require_authenticated_user)):
+async def get_my_listings(
+    user_info: dict = Depends(require_authenticated_user),
+    db: Session = Depends(get_db),
+):
     """Get all listings by the authenticated user"""
-    resale, mgr = _ensure_contracts()
-    ticket = _ensure_ticket_contract()
-
     try:
         user_address = user_info["wallet_address"]
-        # Get the next token ID to know the range of existing tokens
-        next_token_id = ticket.functions.nextTokenId().call()
-        user_listings = []
-
-        # Iterate through all possible token IDs (1 to next_token_id - 1)
-        for token_id in range(1, next_token_id):
-            try:
-                listing = resale.functions.listings(token_id).call()
-                seller_address = listing[0]
-                is_active = bool(listing[3])
-
-                if is_active and seller_address.lower() == user_address.lower():
-                    user_listings.append(
-                        ListingResponse(
-                            ticket_id=token_id,
-                            seller_address=seller_address,
-                            price=int(listing[1]),
-                            event_id=int(listing[2]),
-                            is_active=is_active,
-                        )
-                    )
-            except Exception:
-                # Token might not exist or have no listing, continue
-                continue
+        # Per-seller index lookup (cached per user in Redis) while the indexer is
+        # caught up; Postgres and Redis calls run in the threadpool
+        latest_block = await async_web3_manager.latest_block()
+        if await run_in_threadpool(market_index.is_current, db, latest_block):
+            user_listings = await run_in_threadpool(
+                market_index.seller_listings, db, user_address
+            )
+        else:
+            user_listings, _ = filter_listings(
+                await _read_active_listings_from_chain(), seller=user_address
+            )
 
         return MarketListingsResponse(
-            listings=user_listings,
+            listings=[ListingResponse(**listing) for listing in user_listings],
             total=len(user_listings),
             message=f"Successfully retrieved listings for address {user_address}",
         )
@@ -1,69 +1,134 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import List, Dict, Any
+from database.db import get_db
 from dependencies.role_deps import require_authenticated_user
-from web3_manager import web3_manager
+from services.ticket_index import ticket_index
+from web3_manager import async_web3_manager
 from web3 import Web3
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
 
+async def _fetch_owned_ticket_ids(owner: str, balance: int) -> List[int]:
+    """Enumerate an owner's token IDs with one batched tokenOfOwnerByIndex read"""
+    ticket_nft = async_web3_manager.ticket_nft
+    return await async_web3_manager.batch_call(
+        [ticket_nft.functions.tokenOfOwnerByIndex(owner, i) for i in range(balance)],
+        use_cache=True,
+    )
+
+
+async def _fetch_ticket_state(ticket_ids: List[int]):
+    """Batch isUsed and ticketToEvent for a list of tickets"""
+    ticket_nft = async_web3_manager.ticket_nft
+    calls = []
+    for ticket_id in ticket_ids:
+        calls.append(ticket_nft.functions.isUsed(ticket_id))
+        calls.append(ticket_nft.functions.ticketToEvent(ticket_id))
+    results = await async_web3_manager.batch_call(calls, use_cache=True)
+    return results[0::2], results[1::2]
+
+
+async def _chain_overview(user_address: str) -> dict:
+    """Ticket counts read from the chain (used while the index is behind)"""
+    total_tickets = await async_web3_manager.ticket_nft.functions.balanceOf(
+        user_address
+    ).call()
+    if total_tickets == 0:
+        return {
+            "total_tickets": 0,
+            "valid_tickets": 0,
+            "used_tickets": 0,
+            "events_with_tickets": 0,
+        }
+
+    # Get all ticket IDs owned by user in one batched request
+    ticket_ids = await _fetch_owned_ticket_ids(user_address, total_tickets)
+
+    # Read used flags and parent events for every ticket in one batch
+    is_used_flags, event_ids = await _fetch_ticket_state(ticket_ids)
+
+    # Count used vs valid tickets and unique events
+    used_tickets = sum(1 for is_used in is_used_flags if is_used)
+    return {
+        "total_tickets": total_tickets,
+        "valid_tickets": len(ticket_ids) - used_tickets,
+        "used_tickets": used_tickets,
+        "events_with_tickets": len(set(event_ids)),
+    }
+
+
+async def _chain_owned_tickets(user_address: str) -> List[Dict[str, Any]]:
+    """(ticket_id, event_id, is_used) of an owner's tickets read from the chain"""
+    balance = await async_web3_manager.ticket_nft.functions.balanceOf(
+        user_address
+    ).call()
+    if balance == 0:
+        return []
+
+    # Enumerate tickets and their state in two batched requests
+    ticket_ids = await _fetch_owned_ticket_ids(user_address, balance)
+    is_used_flags, event_ids = await _fetch_ticket_state(ticket_ids)
+    return [
+        {
+            "ticket_id": ticket_id,
+            "event_id": event_id,
+            "is_used": is_used,
+            "event": None,
+        }
+        for ticket_id, event_id, is_used in zip(ticket_ids, event_ids, is_used_flags)
+    ]
+
+
+async def _fill_event_details(tickets: List[Dict[str, Any]]):
+    """Read (name, venue, date, price) for tickets whose event is not in the index"""
+    missing = list(dict.fromkeys(t["event_id"] for t in tickets if t["event"] is None))
+    if not missing:
+        return
+    event_rows = await async_web3_manager.batch_call(
+        [
+            async_web3_manager.event_manager.functions.events(event_id)
+            for event_id in missing
+        ],
+        use_cache=True,
+    )
+    events_by_id = {
+        event_id: (row[2], row[3], row[4], row[5])
+        for event_id, row in zip(missing, event_rows)
+    }
+    for ticket in tickets:
+        if ticket["event"] is None:
+            ticket["event"] = events_by_id[ticket["event_id"]]
+
+
 @router.get("/", summary="Get user ticket overview")
-async def get_ticket_overview(user_info: dict = Depends(require_authenticated_user)):
+async def get_ticket_overview(
+    user_info: dict = Depends(require_authenticated_user),
+    db: Session = Depends(get_db),
+):
     """Get overview of user's tickets"""
     try:
         user_address = user_info["wallet_address"]
 
-        # Get all tickets owned by user
-        total_tickets = web3_manager.ticket_nft.functions.balanceOf(user_address).call()
-
-        if total_tickets == 0:
-            return {
-                "success": True,
-                "user_address": user_address,
-                "overview": {
-                    "total_tickets": 0,
-                    "valid_tickets": 0,
-                    "used_tickets": 0,
-                    "events_with_tickets": 0,
-                },
-                "message": "User owns 0 tickets across 0 events",
-            }
-
-        # Get all ticket IDs owned by user using efficient enumeration
-        ticket_ids = []
-
-        for i in range(total_tickets):
-            ticket_id = web3_manager.ticket_nft.functions.tokenOfOwnerByIndex(
-                user_address, i
-            ).call()
-            ticket_ids.append(ticket_id)
-
-        # Count used vs valid tickets and unique events
-        used_tickets = 0
-        valid_tickets = 0
-        event_ids = set()
-
-        for ticket_id in ticket_ids:
-            is_used = web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
-            event_id = web3_manager.ticket_nft.functions.ticketToEvent(ticket_id).call()
-
-            if is_used:
-                used_tickets += 1
-            else:
-                valid_tickets += 1
-
-            event_ids.add(event_id)
+        # Aggregate over the ownership index while the indexer is caught up; the
+        # Postgres queries run in the threadpool to keep the event loop free
+        latest_block = await async_web3_manager.latest_block()
+        if await run_in_threadpool(ticket_index.is_current, db, latest_block):
+            overview = await run_in_threadpool(
+                ticket_index.owner_overview, db, user_address
+            )
+        else:
+            overview = await _chain_overview(user_address)
 
+        total_tickets = overview["total_tickets"]
+        events_with_tickets = overview["events_with_tickets"]
         return {
             "success": True,
             "user_address": user_address,
-            "overview": {
-                "total_tickets": total_tickets,
-                "valid_tickets": valid_tickets,
-                "used_tickets": used_tickets,
-                "events_with_tickets": len(event_ids),
-            },
-            "message": f"User owns {total_tickets} tickets across {len(event_ids)} events",
+            "overview": overview,
+            "message": f"User owns {total_tickets} tickets across {events_with_tickets} events",
         }
 
     except Exception as e:
@@ -73,17 +138,25 @@ async def get_ticket_overview(user_info: dict = Depends(require_authenticated_us
 
 
 @router.get("/owned", summary="Get all tickets owned by user")
-async def get_owned_tickets(user_info: dict = Depends(require_authenticated_user)):
+async def get_owned_tickets(
+    user_info: dict = Depends(require_authenticated_user),
+    db: Session = Depends(get_db),
+):
     """Get all tickets owned by the authenticated user"""
     try:
         user_address = user_info["wallet_address"]
-        # Convert to checksum address for Web3.py compatibility
-        user_address_checksum = Web3.to_checksum_address(user_address)
 
-        # Get number of tickets owned by user
-        balance = web3_manager.ticket_nft.functions.balanceOf(user_address_checksum).call()
+        # One indexed query while the indexer is caught up, otherwise batched reads
+        latest_block = await async_web3_manager.latest_block()
+        if await run_in_threadpool(ticket_index.is_current, db, latest_block):
+            owned = await run_in_threadpool(
+                ticket_index.owned_tickets, db, user_address
+            )
+        else:
+            # Convert to checksum address for Web3.py compatibility
+            owned = await _chain_owned_tickets(Web3.to_checksum_address(user_address))
 
-        if balance == 0:
+        if not owned:
             return {
                 "success": True,
                 "user_address": user_address,
@@ -92,33 +165,23 @@ async def get_owned_tickets(user_info: dict = Depends(require_authenticated_user
                 "message": "No tickets found for user",
             }
 
-        tickets = []
-
-        # Use efficient enumeration to get all tickets owned by user
-        for i in range(balance):
-            ticket_id = web3_manager.ticket_nft.functions.tokenOfOwnerByIndex(
-                user_address_checksum, i
-            ).call()
-
-            # Get ticket details
-            event_id = web3_manager.ticket_nft.functions.ticketToEvent(ticket_id).call()
-            is_used = web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
-
-            # Get event details
-            event_data = web3_manager.event_manager.functions.events(event_id).call()
-
-            ticket_info = {
-                "ticket_id": ticket_id,
-                "event_id": event_id,
-                "event_name": event_data[1],  # name
-                "event_location": event_data[2],  # venue
-                "event_date": str(event_data[3]),  # date (Unix timestamp)
-                "ticket_price": str(event_data[4]),  # ticketPrice in wei
-                "is_used": is_used,
-                "owner_address": user_address,
-            }
+        await _fill_event_details(owned)
 
-            tickets.append(ticket_info)
+        tickets = []
+        for ticket in owned:
+            name, venue, date, price = ticket["event"]
+            tickets.append(
+                {
+                    "ticket_id": ticket["ticket_id"],
+                    "event_id": ticket["event_id"],
+                    "event_name": name,
+                    "event_location": venue,
+                    "event_date": str(date),  # Unix timestamp
+                    "ticket_price": str(price),  # in wei
+                    "is_used": ticket["is_used"],
+                    "owner_address": user_address,
+                }
+            )
 
         return {
             "success": True,
@@ -144,14 +207,22 @@ async def get_ticket_details(
 
         # Check if ticket exists
         try:
-            owner = web3_manager.ticket_nft.functions.ownerOf(ticket_id).call()
+            owner = await async_web3_manager.ticket_nft.functions.ownerOf(
+                ticket_id
+            ).call()
         except Exception:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
         # Get ticket and event information
-        event_id = web3_manager.ticket_nft.functions.ticketToEvent(ticket_id).call()
-        is_used = web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
-        event_data = web3_manager.event_manager.functions.events(event_id).call()
+        event_id = await async_web3_manager.cached_call(
+            async_web3_manager.ticket_nft.functions.ticketToEvent(ticket_id)
+        )
+        is_used = await async_web3_manager.cached_call(
+            async_web3_manager.ticket_nft.functions.isUsed(ticket_id)
+        )
+        event_data = await async_web3_manager.cached_call(
+            async_web3_manager.event_manager.functions.events(event_id)
+        )
 
         # Check if user is owner
         is_owner = owner.lower() == user_address.lower()
@@ -194,12 +265,16 @@ async def check_ticket_used(
     try:
         # Check if ticket exists
         try:
-            owner = web3_manager.ticket_nft.functions.ownerOf(ticket_id).call()
+            owner = await async_web3_manager.ticket_nft.functions.ownerOf(
+                ticket_id
+            ).call()
         except Exception:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
         # Get ticket usage status
-        is_used = web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
+        is_used = await async_web3_manager.cached_call(
+            async_web3_manager.ticket_nft.functions.isUsed(ticket_id)
+        )
 
         return {
             "success": True,
@@ -235,30 +310,27 @@ async def mark_ticket_used(
 
         # Check if ticket exists
         try:
-            owner = web3_manager.ticket_nft.functions.ownerOf(ticket_id).call()
+            owner = await async_web3_manager.ticket_nft.functions.ownerOf(
+                ticket_id
+            ).call()
         except Exception:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
         # Check if ticket is already used
-        is_used = web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
+        is_used = await async_web3_manager.ticket_nft.functions.isUsed(ticket_id).call()
         if is_used:
             raise HTTPException(
                 status_code=400, detail="Ticket is already marked as used"
             )
 
-        # Mark ticket as used using oracle account (the predefined admin account 0)
-        admin_account = web3_manager.get_user_account_by_index(
-            0
-        )  # Use the hardhat account 0 as oracle
-
-        # Call markTicketAsUsed on EventManager (which owns the TicketNFT contract)
-        function_call = web3_manager.event_manager.functions.markTicketAsUsed(ticket_id)
-
-        # Build and send transaction from admin account
-        txn = web3_manager.build_user_transaction(
-            function_call, admin_account, gas=150000
+        # Call markTicketAsUsed on EventManager (which owns the TicketNFT contract),
+        # signed by an oracle pool signer
+        function_call = async_web3_manager.event_manager.functions.markTicketAsUsed(
+            ticket_id
         )
-        tx_hash = web3_manager.sign_and_send_user_transaction(txn, admin_account)
+
+        txn = await async_web3_manager.build_transaction(function_call, gas=150000)
+        tx_hash = await async_web3_manager.sign_and_send_transaction(txn)
 
         return {
             "success": True,
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException
+from tx_tracker import tx_tracker
+
+router = APIRouter(prefix="/tx", tags=["transactions"])
+
+
+@router.get("/{tx_hash}", summary="Get status of a submitted transaction")
+def get_transaction_status(tx_hash: str):
+    """Report pending/confirmed/failed for a tracked transaction, with decoded events"""
+    try:
+        status = tx_tracker.get_status(tx_hash)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get transaction status: {str(e)}"
+        )
+
+    if status is None:
+        raise HTTPException(
+            status_code=404, detail="Transaction not tracked or record expired"
+        )
+    return status
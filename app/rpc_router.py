@@ -0,0 +1,341 @@
+"""Latency-aware routing and failover across several JSON-RPC endpoints"""
+
+import contextlib
+import contextvars
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import ClientTimeout
+from web3 import AsyncHTTPProvider, HTTPProvider
+from web3.exceptions import ProviderConnectionError
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.providers.base import JSONBaseProvider
+
+from config import config
+
+# Routing key (signer address) for requests that must stay on one node
+_route_key = contextvars.ContextVar("rpc_route_key", default=None)
+
+
+@contextlib.contextmanager
+def sticky_route(key):
+    """Send every request made inside the block to the node chosen for `key`"""
+    token = _route_key.set(key.lower() if key else None)
+    try:
+        yield
+    finally:
+        _route_key.reset(token)
+
+
+def _route_key_for(method, params):
+    """Explicit routing key, or the address of a pending-nonce lookup"""
+    key = _route_key.get()
+    if key is None and method == "eth_getTransactionCount" and params:
+        if len(params) > 1 and params[1] == "pending":
+            key = str(params[0]).lower()
+    return key
+
+
+class RpcEndpoint:
+    """Health of one RPC endpoint: latency EWMA, last seen block and circuit breaker"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency_ms = None
+        self.block_number = None
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def cooled_down(self) -> bool:
+        return (
+            self.opened_at is not None
+            and time.monotonic() - self.opened_at >= config.RPC_BREAKER_COOLDOWN_SECONDS
+        )
+
+    def claim_trial(self) -> bool:
+        """Let a single request through an open breaker once its cooldown has passed"""
+        with self._lock:
+            if self._trial_in_flight or not self.cooled_down():
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self, latency_ms=None, block_number=None):
+        with self._lock:
+            if self.opened_at is not None:
+                print(f"✅ RPC endpoint {self.url} recovered")
+            if latency_ms is not None:
+                alpha = config.RPC_LATENCY_EWMA_ALPHA
+                self.latency_ms = (
+                    latency_ms
+                    if self.latency_ms is None
+                    else alpha * latency_ms + (1 - alpha) * self.latency_ms
+                )
+            if block_number is not None:
+                self.block_number = block_number
+            self.failures = 0
+            self.opened_at = None
+            self.last_error = None
+            self._trial_in_flight = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            trial, self._trial_in_flight = self._trial_in_flight, False
+            if trial or self.failures >= config.RPC_BREAKER_FAILURES:
+                if self.opened_at is None:
+                    print(f"❌ RPC endpoint {self.url} ejected: {error}")
+                self.opened_at = time.monotonic()
+
+    def status(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": not self.is_open,
+            "latency_ms": (
+                round(self.latency_ms, 2) if self.latency_ms is not None else None
+            ),
+            "block_number": self.block_number,
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class RpcEndpointSet:
+    """
+    Decides which endpoints a request tries, in order.
+
+    Reads go to the healthy endpoint with the lowest latency EWMA, skipping nodes
+    more than RPC_MAX_BLOCK_LAG blocks behind the best one seen. Requests with a
+    routing key (writes and pending-nonce lookups of a signer) use rendezvous
+    hashing, so every API worker sends a signer's transactions to the same node
+    while it stays healthy. After RPC_BREAKER_FAILURES consecutive failures an
+    endpoint is ejected for RPC_BREAKER_COOLDOWN_SECONDS, then gets a single trial
+    request. Ejected endpoints are still tried last when nothing else is left.
+    """
+
+    def __init__(self, urls):
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+        self.endpoints = [RpcEndpoint(url) for url in urls]
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def urls(self):
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def _split(self, claim_trials: bool):
+        closed = [endpoint for endpoint in self.endpoints if not endpoint.is_open]
+        trials = []
+        if claim_trials:
+            trials = [
+                endpoint
+                for endpoint in self.endpoints
+                if endpoint.is_open and endpoint.claim_trial()
+            ]
+        ejected = [
+            endpoint
+            for endpoint in self.endpoints
+            if endpoint.is_open and endpoint not in trials
+        ]
+        ejected.sort(key=lambda endpoint: endpoint.opened_at)
+        return closed, trials, ejected
+
+    def read_order(self):
+        # A recovering endpoint goes first so its trial request is really made
+        closed, trials, ejected = self._split(claim_trials=True)
+        blocks = [e.block_number for e in closed if e.block_number is not None]
+        floor = max(blocks) - config.RPC_MAX_BLOCK_LAG if blocks else None
+
+        def rank(endpoint):
+            lagging = (
+                floor is not None
+                and endpoint.block_number is not None
+                and endpoint.block_number < floor
+            )
+            # Endpoints without a latency sample yet are tried first to get one
+            latency = endpoint.latency_ms if endpoint.latency_ms is not None else 0.0
+            return (lagging, latency)
+
+        return trials + sorted(closed, key=rank) + ejected
+
+    def sticky_order(self, key: str):
+        def weight(endpoint):
+            return hashlib.sha256(f"{key}|{endpoint.url}".encode()).digest()
+
+        # Writes never go out as trials; recovered endpoints rejoin via reads or probes
+        closed, _, ejected = self._split(claim_trials=False)
+        return sorted(closed, key=weight, reverse=True) + ejected
+
+    def plan(self, method, params):
+        key = _route_key_for(method, params)
+        return self.sticky_order(key) if key else self.read_order()
+
+    def status(self) -> list:
+        return [endpoint.status() for endpoint in self.endpoints]
+
+
+def _block_from_response(response) -> int:
+    if "error" in response or response.get("result") is None:
+        raise ValueError(f"eth_blockNumber failed: {response.get('error')}")
+    return int(response["result"], 16)
+
+
+class RoutingHTTPProvider(JSONBaseProvider):
+    """HTTP provider that spreads requests over an RpcEndpointSet with failover"""
+
+    def __init__(self, endpoint_set: RpcEndpointSet, **kwargs):
+        super().__init__(**kwargs)
+        self.endpoint_set = endpoint_set
+        # No per-node retries: a failing node is skipped for the next one instead
+        self._providers = {
+            url: HTTPProvider(
+                url,
+                request_kwargs={"timeout": config.RPC_REQUEST_TIMEOUT_SECONDS},
+                exception_retry_configuration=None,
+            )
+            for url in endpoint_set.urls
+        }
+        self._probe_pool = ThreadPoolExecutor(max_workers=len(endpoint_set))
+
+    def __str__(self) -> str:
+        return f"RoutingHTTPProvider({', '.join(self.endpoint_set.urls)})"
+
+    def _route(self, method, params, send, measure: bool):
+        errors = []
+        for endpoint in self.endpoint_set.plan(method, params):
+            start = time.monotonic()
+            try:
+                response = send(self._providers[endpoint.url])
+            except Exception as e:
+                endpoint.record_failure(e)
+                errors.append(f"{endpoint.url}: {e}")
+                continue
+            latency_ms = (time.monotonic() - start) * 1000 if measure else None
+            endpoint.record_success(latency_ms)
+            return response
+        raise ProviderConnectionError(f"All RPC endpoints failed: {'; '.join(errors)}")
+
+    def make_request(self, method, params):
+        return self._route(
+            method,
+            params,
+            lambda provider: provider.make_request(method, params),
+            measure=True,
+        )
+
+    def make_batch_request(self, requests):
+        method = requests[0][0] if requests else None
+        params = requests[0][1] if requests else None
+        return self._route(
+            method,
+            params,
+            lambda provider: provider.make_batch_request(requests),
+            measure=False,
+        )
+
+    def _probe(self, endpoint):
+        start = time.monotonic()
+        try:
+            block_number = _block_from_response(
+                self._providers[endpoint.url].make_request("eth_blockNumber", [])
+            )
+        except Exception as e:
+            endpoint.record_failure(e)
+            return None
+        endpoint.record_success((time.monotonic() - start) * 1000, block_number)
+        return block_number
+
+    def probe(self) -> int:
+        """Check every endpoint concurrently; returns the highest block seen"""
+        blocks = [
+            block
+            for block in self._probe_pool.map(self._probe, self.endpoint_set.endpoints)
+            if block is not None
+        ]
+        if not blocks:
+            raise ProviderConnectionError("No RPC endpoint reachable")
+        return max(blocks)
+
+
+class AsyncRoutingHTTPProvider(AsyncJSONBaseProvider):
+    """Async counterpart of RoutingHTTPProvider sharing the same endpoint health"""
+
+    def __init__(self, endpoint_set: RpcEndpointSet, **kwargs):
+        super().__init__(**kwargs)
+        self.endpoint_set = endpoint_set
+        self._providers = {
+            url: AsyncHTTPProvider(
+                url,
+                request_kwargs={
+                    "timeout": ClientTimeout(total=config.RPC_REQUEST_TIMEOUT_SECONDS)
+                },
+                exception_retry_configuration=None,
+            )
+            for url in endpoint_set.urls
+        }
+
+    def __str__(self) -> str:
+        return f"AsyncRoutingHTTPProvider({', '.join(self.endpoint_set.urls)})"
+
+    async def _route(self, method, params, send, measure: bool):
+        errors = []
+        for endpoint in self.endpoint_set.plan(method, params):
+            start = time.monotonic()
+            try:
+                response = await send(self._providers[endpoint.url])
+            except Exception as e:
+                endpoint.record_failure(e)
+                errors.append(f"{endpoint.url}: {e}")
+                continue
+            latency_ms = (time.monotonic() - start) * 1000 if measure else None
+            endpoint.record_success(latency_ms)
+            return response
+        raise ProviderConnectionError(f"All RPC endpoints failed: {'; '.join(errors)}")
+
+    async def make_request(self, method, params):
+        return await self._route(
+            method,
+            params,
+            lambda provider: provider.make_request(method, params),
+            measure=True,
+        )
+
+    async def make_batch_request(self, requests):
+        method = requests[0][0] if requests else None
+        params = requests[0][1] if requests else None
+        return await self._route(
+            method,
+            params,
+            lambda provider: provider.make_batch_request(requests),
+            measure=False,
+        )
+
+    async def disconnect(self):
+        for provider in self._providers.values():
+            await provider.disconnect()
+
+
+def build_http_provider(endpoint_set: RpcEndpointSet):
+    """Plain HTTPProvider for a single node, RoutingHTTPProvider for several"""
+    if len(endpoint_set) == 1:
+        return HTTPProvider(endpoint_set.urls[0])
+    return RoutingHTTPProvider(endpoint_set)
+
+
+def build_async_http_provider(endpoint_set: RpcEndpointSet):
+    """Plain AsyncHTTPProvider for a single node, AsyncRoutingHTTPProvider for several"""
+    if len(endpoint_set) == 1:
+        return AsyncHTTPProvider(endpoint_set.urls[0])
+    return AsyncRoutingHTTPProvider(endpoint_set)
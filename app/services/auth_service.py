@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from config import config
+from account_cache import invalidate_user
 from database.db_models import User, Role, Session as SessionModel
 
 
@@ -88,6 +89,11 @@ class AuthService:
         """Get user by ID"""
         return db.query(User).filter(User.id == user_id).first()
 
+    def is_user_active(self, db: Session, user_id: int) -> bool:
+        """Whether the user exists and is active, without loading the full row"""
+        is_active = db.query(User.is_active).filter(User.id == user_id).scalar()
+        return bool(is_active)
+
     def get_user_by_username(self, db: Session, username: str) -> Optional[User]:
         """Get user by username"""
         return db.query(User).filter(User.username == username).first()
@@ -287,6 +293,7 @@ class AuthService:
                 {"is_active": False}
             )
             db.commit()
+            invalidate_user(getattr(db_session, "user_id"))
             return True
         return False
 
@@ -316,6 +323,7 @@ class AuthService:
             ).update({"is_active": False}, synchronize_session=False)
 
         db.commit()
+        invalidate_user(user_id)
         return count
 
     # Role management
@@ -345,6 +353,7 @@ class AuthService:
             user.roles = roles
             db.commit()
             db.refresh(user)
+            invalidate_user(user.id)
             return True
 
         except Exception as e:
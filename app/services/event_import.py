@@ -0,0 +1,267 @@
+"""Bulk event import: validation shared with the create routes and pipelined submission"""
+
+import asyncio
+import csv
+import io
+import json
+
+from pydantic import ValidationError
+from web3.logs import DISCARD
+
+from config import config
+from contract_batch import chunked
+from models import CreateEventRequest, CreateMultiDayEventRequest
+from tx_tracker import normalize_tx_hash, tx_tracker
+from web3_manager import async_web3_manager
+
+# CSV cells holding one value per day of a multi-day event
+LIST_COLUMNS = ("dates", "venues", "tickets_per_day", "swappable_flags")
+LIST_SEPARATOR = ";"
+
+
+def validate_event(request: CreateEventRequest):
+    """Checks of /events/create; raises ValueError"""
+    if not request.name.strip():
+        raise ValueError("Event name cannot be empty")
+    if not request.venue.strip():
+        raise ValueError("Venue cannot be empty")
+    if request.date <= 0:
+        raise ValueError("Invalid date")
+    if request.price <= 0:
+        raise ValueError("Price must be greater than 0")
+    if request.total_tickets <= 0:
+        raise ValueError("Total tickets must be greater than 0")
+
+
+def validate_multi_day_event(request: CreateMultiDayEventRequest):
+    """Checks of /events/multi-day; raises ValueError"""
+    if not request.name.strip():
+        raise ValueError("Event name cannot be empty")
+    if len(request.dates) < 2:
+        raise ValueError("Multi-day event requires at least 2 days")
+    if len(request.dates) != len(request.venues):
+        raise ValueError("Dates and venues length mismatch")
+    if len(request.dates) != len(request.tickets_per_day):
+        raise ValueError("Dates and tickets per day length mismatch")
+    if len(request.dates) != len(request.swappable_flags):
+        raise ValueError("Dates and swappable flags length mismatch")
+    for i, date in enumerate(request.dates):
+        if date <= 0:
+            raise ValueError(f"Invalid date for day {i+1}")
+    for i, venue in enumerate(request.venues):
+        if not venue.strip():
+            raise ValueError(f"Venue cannot be empty for day {i+1}")
+    if request.price <= 0:
+        raise ValueError("Price must be greater than 0")
+    for i, tickets in enumerate(request.tickets_per_day):
+        if tickets <= 0:
+            raise ValueError(f"Tickets per day must be greater than 0 for day {i+1}")
+
+
+def multi_day_gas(days: int) -> int:
+    """Multi-day events need a higher gas limit due to multiple storage operations"""
+    return 800000 + days * 200000  # Base + per-day costs
+
+
+def parse_rows(content: str, fmt: str):
+    """
+    Raw event rows from JSON (a list, or {"events": [...]}) or CSV.
+
+    CSV rows of multi-day events fill `dates`, `venues`, `tickets_per_day` and
+    `swappable_flags` with one value per day separated by ";" instead of `venue`,
+    `date` and `total_tickets`. Raises ValueError if the document cannot be read.
+    """
+    if fmt == "json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        rows = data.get("events") if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise ValueError('JSON must be a list of events or {"events": [...]}')
+        return rows
+
+    if fmt == "csv":
+        rows = []
+        for record in csv.DictReader(io.StringIO(content)):
+            row = {
+                key.strip(): value.strip()
+                for key, value in record.items()
+                if key and value is not None and value.strip()
+            }
+            for column in LIST_COLUMNS:
+                if column in row:
+                    row[column] = [
+                        item.strip() for item in row[column].split(LIST_SEPARATOR)
+                    ]
+            rows.append(row)
+        return rows
+
+    raise ValueError("Format must be json or csv")
+
+
+def build_request(row: dict):
+    """CreateEventRequest or CreateMultiDayEventRequest for a row; raises ValueError"""
+    try:
+        if "dates" in row:
+            request = CreateMultiDayEventRequest(**row)
+            validate_multi_day_event(request)
+        else:
+            request = CreateEventRequest(**row)
+            validate_event(request)
+    except ValidationError as e:
+        raise ValueError(
+            "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+        )
+    return request
+
+
+class EventImporter:
+    """
+    Creates many events with pipelined oracle transactions.
+
+    Every row is validated before anything is sent; one invalid row rejects the
+    whole import. The createEvent/createMultiDayEvent transactions then go out
+    from the primary oracle account (like single event creation, so every event
+    has the same on-chain organiser), RPC_BATCH_SIZE at a time, each chunk with one
+    nonce allocation and one batched eth_sendRawTransaction request. Sending stops
+    at the first rejected transaction: the rows of later chunks are reported as
+    not_submitted, with the rejected row named in their error, and can be imported
+    again. Each sent transaction is registered with the transaction tracker, and
+    the importer can wait for the receipts to report the created event (and
+    sub-event) ids.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def validate(self, rows):
+        """(requests, errors): errors is a list of {"row", "error"} for invalid rows"""
+        requests, errors = [], []
+        for index, row in enumerate(rows, start=1):
+            try:
+                requests.append(build_request(row))
+            except ValueError as e:
+                errors.append({"row": index, "name": row.get("name"), "error": str(e)})
+        return requests, errors
+
+    def _transaction_item(self, request):
+        functions = self.manager.event_manager.functions
+        if isinstance(request, CreateMultiDayEventRequest):
+            function_call = functions.createMultiDayEvent(
+                request.name,
+                request.dates,
+                request.venues,
+                request.price,
+                request.tickets_per_day,
+                request.swappable_flags,
+            )
+            return (function_call, 0, multi_day_gas(len(request.dates)))
+        function_call = functions.createEvent(
+            request.name,
+            request.venue,
+            request.date,
+            request.price,
+            request.total_tickets,
+        )
+        return (function_call, 0, config.DEFAULT_GAS)
+
+    async def submit(self, requests):
+        """Send all creations; one result row per request, with its tx hash or error"""
+        signer = self.manager.oracle_account
+        results = []
+        rejected_row = None
+        for chunk in chunked(list(requests), config.RPC_BATCH_SIZE):
+            try:
+                sent = await self.manager.send_transaction_batch(
+                    [self._transaction_item(request) for request in chunk],
+                    signer=signer,
+                )
+            except Exception as e:
+                sent = [e] * len(chunk)
+            for result in sent:
+                results.append(result)
+                if rejected_row is None and isinstance(result, Exception):
+                    rejected_row = len(results)
+            if rejected_row is not None:
+                break
+
+        rows = []
+        for index, request in enumerate(requests, start=1):
+            row = {"row": index, "name": request.name}
+            result = results[index - 1] if index <= len(results) else None
+            if result is None:
+                row.update(
+                    status="not_submitted",
+                    error=f"Not sent: row {rejected_row} was rejected",
+                )
+            elif isinstance(result, Exception):
+                row.update(status="failed", error=str(result))
+            else:
+                tx_hash = normalize_tx_hash(result)
+                row.update(status="pending", tx_hash=tx_hash)
+                multi_day = isinstance(request, CreateMultiDayEventRequest)
+                status_url = await asyncio.to_thread(
+                    tx_tracker.track_sent,
+                    tx_hash,
+                    "multi_day_event_create" if multi_day else "event_create",
+                    events=[
+                        (
+                            "event_manager.MultiDayEventCreated"
+                            if multi_day
+                            else "event_manager.EventCreated"
+                        )
+                    ],
+                    meta={"name": request.name, "import_row": index},
+                )
+                if status_url:
+                    row["status_url"] = status_url
+            rows.append(row)
+        return rows
+
+    async def _settle(self, row, timeout):
+        try:
+            receipt = await self.manager.wait_for_transaction_receipt(
+                row["tx_hash"], timeout=timeout
+            )
+        except Exception as e:
+            row.update(status="pending", error=f"Not mined yet: {e}")
+            return
+        row["block_number"] = receipt["blockNumber"]
+        if receipt["status"] != 1:
+            row.update(status="failed", error="Transaction reverted")
+            return
+
+        events = self.manager.event_manager.events
+        created = events.EventCreated().process_receipt(
+            receipt, errors=DISCARD
+        ) or events.MultiDayEventCreated().process_receipt(receipt, errors=DISCARD)
+        sub_events = events.SubEventCreated().process_receipt(receipt, errors=DISCARD)
+        row["status"] = "confirmed"
+        if created:
+            row["event_id"] = created[0]["args"]["eventId"]
+        if sub_events:
+            row["sub_event_ids"] = [log["args"]["subEventId"] for log in sub_events]
+
+    async def wait(self, rows, timeout=None):
+        """Fill in status and event ids of submitted rows once they are mined"""
+        timeout = timeout or config.EVENT_IMPORT_WAIT_SECONDS
+        await asyncio.gather(
+            *(self._settle(row, timeout) for row in rows if row["status"] == "pending")
+        )
+        return rows
+
+
+def summarize(rows) -> dict:
+    """Import report with per-status counts"""
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    return {"total": len(rows), **counts, "rows": rows}
+
+
+# Create singleton instance
+event_importer = EventImporter(async_web3_manager)
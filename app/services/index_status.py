@@ -0,0 +1,28 @@
+"""Freshness of the chain indexer's tables, shared by the index-backed services"""
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from config import config
+from database.index_models import CONTRACTS_CHECKPOINT, IndexerCheckpoint
+
+
+def index_block(db: Session) -> Optional[int]:
+    """Last block applied by the indexer, or None before its first range"""
+    checkpoint = db.get(IndexerCheckpoint, CONTRACTS_CHECKPOINT)
+    return checkpoint.block_number if checkpoint is not None else None
+
+
+def is_index_current(db: Session, latest_block: int) -> bool:
+    """
+    Whether the index is close enough to the chain head to answer reads.
+
+    The indexer deliberately stays BACKFILL_CONFIRMATIONS blocks below head, so the
+    lag is measured from that confirmed head rather than from `latest_block`.
+    """
+    indexed = index_block(db)
+    confirmed_head = latest_block - config.BACKFILL_CONFIRMATIONS
+    return (
+        indexed is not None and confirmed_head - indexed <= config.INDEX_MAX_LAG_BLOCKS
+    )
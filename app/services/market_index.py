@@ -0,0 +1,230 @@
+"""Resale market queries served from the chain indexer's listing table"""
+
+import base64
+import json
+from typing import Optional
+
+import redis
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from web3 import Web3
+
+from config import config
+from database.index_models import IndexedListing
+from services.index_status import index_block, is_index_current
+
+LISTING_SORTS = ("ticket_id", "price_asc", "price_desc")
+
+
+def encode_cursor(sort: str, price: int, ticket_id: int) -> str:
+    """Opaque cursor pointing just after (price, ticket_id) in `sort` order"""
+    payload = json.dumps({"s": sort, "p": str(price), "t": ticket_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str):
+    """(price, ticket_id) from a cursor; raises ValueError if it is invalid"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        price, ticket_id = int(payload["p"]), int(payload["t"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if payload.get("s") != sort:
+        raise ValueError("Cursor was issued for a different sort order")
+    return price, ticket_id
+
+
+def _seller_version_key(seller: str) -> str:
+    return f"market:seller:{seller}:version"
+
+
+def _seller_listings_key(seller: str, version: str) -> str:
+    return f"market:seller:{seller}:listings:{version}"
+
+
+def _sort_key(sort: str):
+    if sort == "ticket_id":
+        return lambda listing: (listing["ticket_id"],)
+    return lambda listing: (listing["price"], listing["ticket_id"])
+
+
+def filter_listings(
+    listings,
+    event_id: Optional[int] = None,
+    seller: Optional[str] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    sort: str = "ticket_id",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Apply the listing filters, sort and cursor to listings read from the chain.
+    Same semantics as MarketIndexService.active_listings, for the fallback path.
+    """
+    seller = seller.lower() if seller else None
+    selected = [
+        listing
+        for listing in listings
+        if (event_id is None or listing["event_id"] == event_id)
+        and (seller is None or listing["seller_address"].lower() == seller)
+        and (min_price is None or listing["price"] >= min_price)
+        and (max_price is None or listing["price"] <= max_price)
+    ]
+    key = _sort_key(sort)
+    descending = sort == "price_desc"
+    selected.sort(key=key, reverse=descending)
+
+    if cursor:
+        after_price, after_id = decode_cursor(cursor, sort)
+        after = (after_id,) if sort == "ticket_id" else (after_price, after_id)
+        selected = [
+            listing
+            for listing in selected
+            if (key(listing) < after if descending else key(listing) > after)
+        ]
+    return _page(selected, sort, limit)
+
+
+def _page(listings, sort, limit):
+    if limit is None or len(listings) <= limit:
+        return listings, None
+    page = listings[:limit]
+    last = page[-1]
+    return page, encode_cursor(sort, last["price"], last["ticket_id"])
+
+
+class MarketIndexService:
+    """
+    Active-listing queries against indexed_listings (kept current by the indexer).
+
+    A seller's listings are also cached in Redis under a per-seller version number.
+    The indexer bumps the version after committing a Listed/Delisted/Purchased log
+    for that seller, so the next read misses and re-queries; entries written for an
+    older version are never read again and simply expire.
+    """
+
+    def __init__(self, redis_client=None):
+        self.redis = (
+            redis_client
+            if redis_client is not None
+            else redis.from_url(config.REDIS_URL, decode_responses=True)
+        )
+        self.seller_cache_ttl = config.SELLER_LISTINGS_CACHE_TTL_SECONDS
+
+    def index_block(self, db: Session) -> Optional[int]:
+        return index_block(db)
+
+    def is_current(self, db: Session, latest_block: int) -> bool:
+        """Whether the index is close enough to the chain head to answer reads"""
+        return is_index_current(db, latest_block)
+
+    def active_listings(
+        self,
+        db: Session,
+        event_id: Optional[int] = None,
+        seller: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        sort: str = "ticket_id",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        """One page of active listings and the cursor for the next page (or None)"""
+        query = db.query(IndexedListing).filter(IndexedListing.active.is_(True))
+        if event_id is not None:
+            query = query.filter(IndexedListing.event_id == event_id)
+        if seller:
+            query = query.filter(IndexedListing.seller == seller.lower())
+        if min_price is not None:
+            query = query.filter(IndexedListing.price >= min_price)
+        if max_price is not None:
+            query = query.filter(IndexedListing.price <= max_price)
+
+        if sort == "ticket_id":
+            order = [IndexedListing.ticket_id.asc()]
+        elif sort == "price_asc":
+            order = [IndexedListing.price.asc(), IndexedListing.ticket_id.asc()]
+        else:
+            order = [IndexedListing.price.desc(), IndexedListing.ticket_id.desc()]
+
+        if cursor:
+            price, ticket_id = decode_cursor(cursor, sort)
+            if sort == "ticket_id":
+                query = query.filter(IndexedListing.ticket_id > ticket_id)
+            elif sort == "price_asc":
+                query = query.filter(
+                    or_(
+                        IndexedListing.price > price,
+                        and_(
+                            IndexedListing.price == price,
+                            IndexedListing.ticket_id > ticket_id,
+                        ),
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        IndexedListing.price < price,
+                        and_(
+                            IndexedListing.price == price,
+                            IndexedListing.ticket_id < ticket_id,
+                        ),
+                    )
+                )
+
+        query = query.order_by(*order)
+        if limit is not None:
+            # One extra row tells whether another page exists
+            query = query.limit(limit + 1)
+
+        listings = [
+            {
+                "ticket_id": int(row.ticket_id),
+                "seller_address": Web3.to_checksum_address(row.seller),
+                "price": int(row.price),
+                "event_id": int(row.event_id),
+                "is_active": True,
+            }
+            for row in query
+        ]
+        return _page(listings, sort, limit)
+
+    def seller_listings(self, db: Session, seller: str):
+        """All active listings of one seller, cached per seller until their next change"""
+        seller = seller.lower()
+        version = None
+        try:
+            version = self.redis.get(_seller_version_key(seller)) or "0"
+            cached = self.redis.get(_seller_listings_key(seller, version))
+            if cached is not None:
+                return json.loads(cached)
+        except redis.RedisError as e:
+            print(f"⚠️  Seller listing cache unavailable: {e}")
+
+        listings, _ = self.active_listings(db, seller=seller)
+        if version is not None and self.seller_cache_ttl > 0:
+            try:
+                self.redis.set(
+                    _seller_listings_key(seller, version),
+                    json.dumps(listings),
+                    ex=self.seller_cache_ttl,
+                )
+            except redis.RedisError:
+                pass
+        return listings
+
+    def invalidate_sellers(self, sellers):
+        """Bump the cache version of sellers whose listings changed (called by the indexer)"""
+        sellers = {seller.lower() for seller in sellers}
+        if not sellers:
+            return
+        pipe = self.redis.pipeline()
+        for seller in sellers:
+            pipe.incr(_seller_version_key(seller))
+        pipe.execute()
+
+
+# Create singleton instance
+market_index = MarketIndexService()
@@ -0,0 +1,68 @@
+"""Sub-event reads for multi-day events, with the sub-event id lists cached for good"""
+
+from web3_manager import async_web3_manager
+
+
+class SubEventService:
+    """
+    Reads all sub-events of an event in one batched request.
+
+    Sub-events are only created together with their multi-day parent, so an event's
+    sub-event id list never changes once it exists and is kept in memory for the life
+    of the process. The details themselves go through the block-scoped read cache;
+    the contract only exposes them as one struct, so there is nothing cheaper to
+    re-read for ticketsSold and swappable alone.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._ids = {}
+
+    async def sub_event_ids(self, event_id: int):
+        ids = self._ids.get(event_id)
+        if ids is None:
+            ids = tuple(
+                await self.manager.cached_call(
+                    self.manager.event_manager.functions.getSubEvents(event_id)
+                )
+            )
+            # An empty list may still be filled by a later createMultiDayEvent
+            if ids:
+                self._ids[event_id] = ids
+        return ids
+
+    async def fetch(self, event_id: int):
+        """Sub-event records of `event_id` in day order; unreadable ones are skipped"""
+        ids = await self.sub_event_ids(event_id)
+        details = await self.manager.batch_call(
+            [
+                self.manager.event_manager.functions.getSubEventDetails(sub_event_id)
+                for sub_event_id in ids
+            ],
+            allow_failure=True,
+            use_cache=True,
+        )
+
+        sub_events = []
+        for sub_event_id, detail in zip(ids, details):
+            if detail is None:
+                print(f"Warning: Could not get details for sub-event {sub_event_id}")
+                continue
+            _, parent_id, day_index, date, venue, swappable, total, sold = detail
+            sub_events.append(
+                {
+                    "sub_event_id": sub_event_id,
+                    "parent_event_id": parent_id,
+                    "day_index": day_index,
+                    "date": date,
+                    "venue": venue,
+                    "swappable": swappable,
+                    "total_tickets": total,
+                    "tickets_sold": sold,
+                }
+            )
+        return sub_events
+
+
+# Create singleton instance
+sub_events = SubEventService(async_web3_manager)
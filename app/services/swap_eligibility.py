@@ -0,0 +1,110 @@
+"""Swap eligibility for many ticket pairs, evaluated locally from one set of chain reads"""
+
+from web3_manager import async_web3_manager
+
+
+def can_swap(sub_event_1: int, sub_event_2: int, sub_events: dict) -> bool:
+    """
+    EventManager.canSwapTickets for two tickets' sub-event ids.
+
+    `sub_events` maps each id that is a sub-event to its (parent id, swappable);
+    any other id is its own parent, as in getParentEventId.
+    """
+    parent_1 = sub_events[sub_event_1][0] if sub_event_1 in sub_events else sub_event_1
+    parent_2 = sub_events[sub_event_2][0] if sub_event_2 in sub_events else sub_event_2
+
+    # Must be for the same parent event
+    if parent_1 != parent_2 or parent_1 == 0:
+        return False
+    # Tickets must be for different sub-events (different days)
+    if sub_event_1 == sub_event_2:
+        return False
+    # Both sub-events must be swappable (if they are sub-events)
+    for sub_event_id in (sub_event_1, sub_event_2):
+        if sub_event_id in sub_events and not sub_events[sub_event_id][1]:
+            return False
+    return True
+
+
+class SwapEligibilityService:
+    """
+    Checks ticket pairs without calling canSwapTickets once per pair.
+
+    Each distinct ticket's sub-event id and owner are read in one batch, then each
+    distinct sub-event's parent and swappable flag in a second one, both at the same
+    block. Eligibility is then decided by can_swap, which follows the contract's rules.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    async def check_pairs(self, pairs):
+        """One result per (ticket_id_1, ticket_id_2) pair, in request order"""
+        event_manager = self.manager.event_manager
+        ticket_nft = self.manager.ticket_nft
+        block = await self.manager.latest_block()
+
+        ticket_ids = sorted({ticket_id for pair in pairs for ticket_id in pair})
+        rows = await self.manager.batch_call(
+            [ticket_nft.functions.getSubEventId(t) for t in ticket_ids]
+            + [ticket_nft.functions.ownerOf(t) for t in ticket_ids],
+            block_identifier=block,
+            allow_failure=True,
+        )
+        ticket_sub_events = dict(zip(ticket_ids, rows[: len(ticket_ids)]))
+        owners = dict(zip(ticket_ids, rows[len(ticket_ids) :]))
+
+        sub_event_ids = sorted(
+            {
+                sub_event_id
+                for sub_event_id in ticket_sub_events.values()
+                if sub_event_id
+            }
+        )
+        details = await self.manager.batch_call(
+            [event_manager.functions.subEvents(i) for i in sub_event_ids],
+            block_identifier=block,
+        )
+        # subEvents(i) of an id that is not a sub-event has id 0 (isSubEvent is false)
+        sub_events = {
+            sub_event_id: (row[1], row[5])
+            for sub_event_id, row in zip(sub_event_ids, details)
+            if row[0] != 0
+        }
+
+        results = []
+        for ticket_id_1, ticket_id_2 in pairs:
+            sub_event_1 = ticket_sub_events[ticket_id_1]
+            sub_event_2 = ticket_sub_events[ticket_id_2]
+            if sub_event_1 is None or sub_event_2 is None:
+                # canSwapTickets itself would revert on an unreadable ticket
+                results.append(
+                    {
+                        "ticket_1_id": ticket_id_1,
+                        "ticket_2_id": ticket_id_2,
+                        "can_swap": False,
+                        "error": "Ticket details unavailable",
+                    }
+                )
+                continue
+            parent_1 = sub_events.get(sub_event_1, (sub_event_1,))[0]
+            parent_2 = sub_events.get(sub_event_2, (sub_event_2,))[0]
+            results.append(
+                {
+                    "ticket_1_id": ticket_id_1,
+                    "ticket_2_id": ticket_id_2,
+                    "can_swap": can_swap(sub_event_1, sub_event_2, sub_events),
+                    "ticket_1_owner": owners[ticket_id_1],
+                    "ticket_2_owner": owners[ticket_id_2],
+                    "ticket_1_sub_event_id": sub_event_1,
+                    "ticket_2_sub_event_id": sub_event_2,
+                    "ticket_1_parent_event_id": parent_1,
+                    "ticket_2_parent_event_id": parent_2,
+                    "same_event": parent_1 == parent_2,
+                }
+            )
+        return block, results
+
+
+# Create singleton instance
+swap_eligibility = SwapEligibilityService(async_web3_manager)
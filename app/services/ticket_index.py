@@ -0,0 +1,85 @@
+"""Ticket ownership queries served from the chain indexer's ticket table"""
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from database.index_models import IndexedEvent, IndexedTicket
+from services.index_status import index_block, is_index_current
+
+
+class TicketIndexService:
+    """
+    Per-owner ticket queries against indexed_tickets.
+
+    The indexer keeps each ticket's owner from TicketNFT Transfer logs and its used
+    flag from TicketUsed, so a wallet's tickets are one indexed lookup on owner
+    instead of balanceOf + tokenOfOwnerByIndex + isUsed/ticketToEvent per ticket.
+    """
+
+    def index_block(self, db: Session):
+        return index_block(db)
+
+    def is_current(self, db: Session, latest_block: int) -> bool:
+        """Whether the index is close enough to the chain head to answer reads"""
+        return is_index_current(db, latest_block)
+
+    def owner_overview(self, db: Session, owner: str) -> dict:
+        """Ticket counts of one owner, aggregated in a single query"""
+        total, used, events = (
+            db.query(
+                func.count(IndexedTicket.ticket_id),
+                func.coalesce(
+                    func.sum(case((IndexedTicket.is_used.is_(True), 1), else_=0)), 0
+                ),
+                func.count(func.distinct(IndexedTicket.event_id)),
+            )
+            .filter(IndexedTicket.owner == owner.lower())
+            .one()
+        )
+        return {
+            "total_tickets": int(total),
+            "valid_tickets": int(total) - int(used),
+            "used_tickets": int(used),
+            "events_with_tickets": int(events),
+        }
+
+    def owned_tickets(self, db: Session, owner: str):
+        """
+        An owner's tickets in ticket id order, joined with their indexed events.
+        Event fields are None for events created before the indexer's start block.
+        """
+        rows = (
+            db.query(
+                IndexedTicket.ticket_id,
+                IndexedTicket.event_id,
+                IndexedTicket.sub_event_id,
+                IndexedTicket.is_used,
+                IndexedEvent.name,
+                IndexedEvent.venue,
+                IndexedEvent.date,
+                IndexedEvent.ticket_price,
+            )
+            .outerjoin(IndexedEvent, IndexedEvent.event_id == IndexedTicket.event_id)
+            .filter(IndexedTicket.owner == owner.lower())
+            .order_by(IndexedTicket.ticket_id)
+        )
+        return [
+            {
+                "ticket_id": int(row.ticket_id),
+                "event_id": int(row.event_id),
+                "sub_event_id": (
+                    int(row.sub_event_id) if row.sub_event_id is not None else None
+                ),
+                "is_used": bool(row.is_used),
+                "event": (
+                    (row.name, row.venue, int(row.date), int(row.ticket_price))
+                    if row.name is not None
+                    else None
+                ),
+            }
+            for row in rows
+        ]
+
+
+# Create singleton instance
+ticket_index = TicketIndexService()
@@ -0,0 +1,140 @@
+"""Pool of authorised oracle accounts used to sign server-side transactions"""
+
+import itertools
+import threading
+import time
+
+from config import config
+
+
+class SignerPool:
+    """
+    Spreads oracle-only transactions across several authorised oracle keys.
+
+    Each signer has its own nonce sequence in the NonceManager, so transactions from
+    different signers never queue behind each other. A signer's load is the number of
+    nonces handed out that the chain has not confirmed yet (allocated counter minus
+    confirmed transaction count), which every API worker sees through Redis. Balances
+    and confirmed nonces are refreshed in one batch request at most every
+    SIGNER_HEALTH_CHECK_SECONDS; signers below ORACLE_MIN_BALANCE_ETH are skipped
+    while any healthy signer remains.
+    """
+
+    def __init__(self, w3, accounts, nonce_manager):
+        if not accounts:
+            raise ValueError("Signer pool needs at least one account")
+        self.w3 = w3
+        self.nonce_manager = nonce_manager
+        self.accounts = list(accounts)
+        self._by_address = {account.address.lower(): account for account in accounts}
+        self.min_balance_wei = w3.to_wei(config.ORACLE_MIN_BALANCE_ETH, "ether")
+        self.check_interval = config.SIGNER_HEALTH_CHECK_SECONDS
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._checked_at = 0.0
+        self._balances = {}
+        self._confirmed_nonces = {}
+        self._last_error = None
+
+    def __contains__(self, address) -> bool:
+        return bool(address) and address.lower() in self._by_address
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    @property
+    def addresses(self):
+        return [account.address for account in self.accounts]
+
+    def account_for(self, address):
+        """Local account for a pool address (raises if the address is not a pool signer)"""
+        try:
+            return self._by_address[address.lower()]
+        except (AttributeError, KeyError):
+            raise ValueError(f"{address} is not an oracle signer")
+
+    def needs_refresh(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.check_interval
+
+    def refresh_health(self):
+        """Fetch balance and confirmed nonce for every signer in one JSON-RPC batch"""
+        requests = []
+        for address in self.addresses:
+            requests.append(("eth_getBalance", [address, "latest"]))
+            requests.append(("eth_getTransactionCount", [address, "latest"]))
+
+        try:
+            responses = self.w3.provider.make_batch_request(requests)
+            if not isinstance(responses, list):
+                raise ValueError(f"Batch request failed: {responses}")
+            balances, nonces = {}, {}
+            for index, address in enumerate(self.addresses):
+                balance = responses[2 * index].get("result")
+                nonce = responses[2 * index + 1].get("result")
+                if balance is not None:
+                    balances[address] = int(balance, 16)
+                if nonce is not None:
+                    nonces[address] = int(nonce, 16)
+        except Exception as e:
+            # Keep the last known state; selection still works without it
+            self._last_error = str(e)
+            print(f"⚠️  Oracle signer health check failed: {e}")
+            balances, nonces = None, None
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if balances is not None:
+                self._balances.update(balances)
+                self._confirmed_nonces.update(nonces)
+                self._last_error = None
+
+    def is_healthy(self, address) -> bool:
+        balance = self._balances.get(address)
+        return balance is None or balance >= self.min_balance_wei
+
+    def loads(self) -> dict:
+        """Unconfirmed transactions per signer (0 when the counters are not known yet)"""
+        allocated = self.nonce_manager.peek_many(self.addresses)
+        loads = {}
+        for address in self.addresses:
+            next_nonce = allocated.get(address)
+            confirmed = self._confirmed_nonces.get(address)
+            if next_nonce is None or confirmed is None:
+                loads[address] = 0
+            else:
+                loads[address] = max(next_nonce - confirmed, 0)
+        return loads
+
+    def acquire(self):
+        """Pick the least-loaded healthy signer, rotating between equally loaded ones"""
+        if len(self.accounts) == 1:
+            return self.accounts[0]
+        if self.needs_refresh():
+            self.refresh_health()
+
+        candidates = [address for address in self.addresses if self.is_healthy(address)]
+        if not candidates:
+            print("⚠️  No oracle signer above the minimum balance, using all signers")
+            candidates = self.addresses
+
+        loads = self.loads()
+        offset = next(self._round_robin)
+        rotated = [
+            candidates[(offset + i) % len(candidates)] for i in range(len(candidates))
+        ]
+        chosen = min(rotated, key=lambda address: loads[address])
+        return self._by_address[chosen.lower()]
+
+    def status(self) -> list:
+        """Per-signer balance, health and load for diagnostics"""
+        loads = self.loads()
+        return [
+            {
+                "address": address,
+                "balance_wei": self._balances.get(address),
+                "confirmed_nonce": self._confirmed_nonces.get(address),
+                "pending_transactions": loads[address],
+                "healthy": self.is_healthy(address),
+            }
+            for address in self.addresses
+        ]
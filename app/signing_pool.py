@@ -0,0 +1,120 @@
+"""Optional process pool for signing transactions off the request threads"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from eth_account import Account
+
+from config import config
+
+# Accounts derived inside a worker process, keyed by private key bytes
+_worker_accounts = {}
+_WORKER_ACCOUNT_LIMIT = 1024
+
+
+def _sign_in_worker(private_key: bytes, transaction: dict):
+    """Runs in a pool worker: derive (once) and sign"""
+    account = _worker_accounts.get(private_key)
+    if account is None:
+        if len(_worker_accounts) >= _WORKER_ACCOUNT_LIMIT:
+            _worker_accounts.clear()
+        account = Account.from_key(private_key)
+        _worker_accounts[private_key] = account
+    return account.sign_transaction(transaction)
+
+
+class SigningExecutor:
+    """
+    Signs transaction dicts either inline or in a pool of worker processes.
+
+    ECDSA signing holds the GIL, so under a burst of purchases it competes with
+    request handling on the API worker. With SIGNING_POOL_WORKERS > 0 the signing
+    happens in separate processes (started lazily through a forkserver, so they do
+    not inherit the API's threads and connections). If the pool breaks, signing
+    falls back to inline until a new pool can be started.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = config.SIGNING_POOL_WORKERS if workers is None else workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["signing_pool"])
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=context
+                )
+            return self._pool
+
+    def _discard_pool(self, pool):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def sign(self, account, transaction: dict):
+        """Sign `transaction` with `account`, in the pool when it is enabled"""
+        if not self.enabled:
+            return account.sign_transaction(transaction)
+
+        pool = self._get_pool()
+        try:
+            return pool.submit(
+                _sign_in_worker, bytes(account.key), dict(transaction)
+            ).result()
+        except BrokenProcessPool:
+            print("⚠️  Signing pool broke, signing inline")
+            self._discard_pool(pool)
+            return account.sign_transaction(transaction)
+
+    async def sign_async(self, account, transaction: dict):
+        """Async variant of sign() that awaits the worker instead of blocking"""
+        if not self.enabled:
+            return account.sign_transaction(transaction)
+
+        pool = self._get_pool()
+        try:
+            return await asyncio.wrap_future(
+                pool.submit(_sign_in_worker, bytes(account.key), dict(transaction))
+            )
+        except BrokenProcessPool:
+            print("⚠️  Signing pool broke, signing inline")
+            self._discard_pool(pool)
+            return account.sign_transaction(transaction)
+
+    def sign_many(self, items):
+        """Sign a list of (account, transaction) pairs, in parallel when pooled"""
+        if not self.enabled:
+            return [account.sign_transaction(txn) for account, txn in items]
+
+        pool = self._get_pool()
+        try:
+            futures = [
+                pool.submit(_sign_in_worker, bytes(account.key), dict(txn))
+                for account, txn in items
+            ]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            print("⚠️  Signing pool broke, signing inline")
+            self._discard_pool(pool)
+            return [account.sign_transaction(txn) for account, txn in items]
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Create singleton instance
+signing_executor = SigningExecutor()
@@ -0,0 +1,18 @@
+"""Shared fixtures; the app modules import from the app directory, as in the container"""
+
+import os
+import sys
+
+import fakeredis
+import pytest
+from dotenv import load_dotenv
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+# Contract addresses and keys required by config; a local .env still takes precedence
+load_dotenv(os.path.join(APP_DIR, ".env.example"))
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
@@ -0,0 +1,56 @@
+"""User record cache: invalidations reach other workers through the Redis version key"""
+
+import fakeredis
+import pytest
+
+from account_cache import VersionedTTLCache
+
+
+@pytest.fixture
+def caches(redis_client):
+    # Two API workers sharing one Redis
+    return (
+        VersionedTTLCache(10, 60, "user", redis_client),
+        VersionedTTLCache(10, 60, "user", redis_client),
+    )
+
+
+def test_invalidation_reaches_other_worker(caches):
+    worker_a, worker_b = caches
+    worker_a.set(1, {"roles": ["user"]}, worker_a.version(1))
+    worker_b.set(1, {"roles": ["user"]}, worker_b.version(1))
+
+    worker_a.invalidate(1)
+
+    assert worker_a.get(1) is None
+    assert worker_b.get(1) is None
+
+
+def test_invalidation_during_load_is_not_overwritten(caches):
+    worker_a, worker_b = caches
+    version = worker_a.version(1)
+    worker_b.invalidate(1)
+    worker_a.set(1, {"roles": ["user"]}, version)
+
+    assert worker_a.get(1) is None
+
+
+def test_other_users_stay_cached(caches):
+    worker_a, worker_b = caches
+    worker_a.set(2, {"roles": ["admin"]}, worker_a.version(2))
+
+    worker_b.invalidate(1)
+
+    assert worker_a.get(2) == {"roles": ["admin"]}
+
+
+def test_nothing_cached_without_redis():
+    server = fakeredis.FakeServer()
+    cache = VersionedTTLCache(10, 60, "user", fakeredis.FakeRedis(server=server))
+    server.connected = False
+
+    version = cache.version(1)
+    cache.set(1, {"roles": ["user"]}, version)
+
+    assert version is None
+    assert cache.get(1) is None
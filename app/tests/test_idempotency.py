@@ -0,0 +1,120 @@
+"""Idempotency-Key replay, conflict and mismatch handling"""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from middleware.idempotency import IdempotencyMiddleware
+
+PATH = "/events/buy"
+
+
+class FakeAuth(BaseHTTPMiddleware):
+    """Stands in for AuthMiddleware: the user id comes from a test header"""
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.user_id = int(request.headers.get("x-user", "1"))
+        return await call_next(request)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(redis_client, calls):
+    app = FastAPI()
+
+    @app.post(PATH)
+    async def buy(body: dict):
+        calls.append(body)
+        if body.get("fail"):
+            raise HTTPException(status_code=body["fail"], detail="purchase failed")
+        return {"purchase": len(calls)}
+
+    app.add_middleware(IdempotencyMiddleware, paths={PATH}, redis_client=redis_client)
+    app.add_middleware(FakeAuth)
+    return TestClient(app)
+
+
+def buy(client, body, key="key-1", user=1):
+    return client.post(
+        PATH, json=body, headers={"Idempotency-Key": key, "X-User": str(user)}
+    )
+
+
+def test_retry_replays_stored_response(client, calls):
+    first = buy(client, {"event_id": 1})
+    retry = buy(client, {"event_id": 1})
+
+    assert retry.status_code == 200
+    assert retry.json() == first.json() == {"purchase": 1}
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+def test_key_is_scoped_per_user(client, calls):
+    buy(client, {"event_id": 1}, user=1)
+    other = buy(client, {"event_id": 1}, user=2)
+
+    assert other.json() == {"purchase": 2}
+    assert "Idempotent-Replayed" not in other.headers
+
+
+def test_different_body_with_same_key_is_rejected(client, calls):
+    buy(client, {"event_id": 1})
+    reused = buy(client, {"event_id": 2})
+
+    assert reused.status_code == 422
+    assert len(calls) == 1
+
+
+def test_request_in_flight_gets_conflict(client, redis_client, calls):
+    # Another worker holds the key for the same body
+    buy(client, {"event_id": 1}, key="seed")
+    marker = redis_client.get(f"idempotency:1:{PATH}:seed")
+    redis_client.set(
+        f"idempotency:1:{PATH}:busy",
+        marker.replace('"completed"', '"in_flight"'),
+    )
+
+    response = buy(client, {"event_id": 1}, key="busy")
+
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+    assert len(calls) == 1
+
+
+def test_client_error_releases_key(client, redis_client, calls):
+    assert buy(client, {"fail": 400}).status_code == 400
+
+    assert redis_client.get(f"idempotency:1:{PATH}:key-1") is None
+    assert buy(client, {"fail": 400}).status_code == 400
+    assert len(calls) == 2
+
+
+def test_server_error_is_replayed(client, calls):
+    # A 500 may come after the transaction was sent; the retry must not resend it
+    first = buy(client, {"fail": 500})
+    retry = buy(client, {"fail": 500})
+
+    assert first.status_code == retry.status_code == 500
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(calls) == 1
+
+
+def test_requests_without_key_are_not_stored(client, redis_client, calls):
+    client.post(PATH, json={"event_id": 1})
+    client.post(PATH, json={"event_id": 1})
+
+    assert len(calls) == 2
+    assert redis_client.keys("idempotency:*") == []
+
+
+def test_overlong_key_is_rejected(client, calls):
+    response = buy(client, {"event_id": 1}, key="k" * 256)
+
+    assert response.status_code == 400
+    assert calls == []
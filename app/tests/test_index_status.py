@@ -0,0 +1,36 @@
+"""Freshness check of the indexer tables against the indexer's own confirmation depth"""
+
+from types import SimpleNamespace
+
+from config import config
+from services.index_status import is_index_current
+
+
+class FakeSession:
+    def __init__(self, block_number):
+        self.block_number = block_number
+
+    def get(self, model, name):
+        if self.block_number is None:
+            return None
+        return SimpleNamespace(block_number=self.block_number)
+
+
+def test_index_caught_up_with_live_indexing_is_current():
+    # ChainIndexer.run_once stops BACKFILL_CONFIRMATIONS blocks below head
+    head = 1000
+    db = FakeSession(head - config.BACKFILL_CONFIRMATIONS)
+
+    assert is_index_current(db, head)
+
+
+def test_index_within_allowed_lag_is_current():
+    head = 1000
+    indexed = head - config.BACKFILL_CONFIRMATIONS - config.INDEX_MAX_LAG_BLOCKS
+
+    assert is_index_current(FakeSession(indexed), head)
+    assert not is_index_current(FakeSession(indexed - 1), head)
+
+
+def test_index_without_checkpoint_is_not_current():
+    assert not is_index_current(FakeSession(None), 1000)
@@ -0,0 +1,100 @@
+"""Seat reservations: the Lua reserve/settle scripts against an in-memory Redis"""
+
+import pytest
+
+from inventory import InventoryExhausted, InventoryManager, event_scope
+
+SCOPE = event_scope(1)
+
+
+@pytest.fixture
+def inventory(redis_client):
+    return InventoryManager(redis_client)
+
+
+def state(redis_client):
+    return {
+        field: int(value)
+        for field, value in redis_client.hgetall(f"inventory:{SCOPE}").items()
+    }
+
+
+def test_reserve_rejects_oversell(inventory, redis_client):
+    inventory.reserve(SCOPE, 3, total=10, sold=5, block=100)
+    inventory.reserve(SCOPE, 2, total=10, sold=5, block=100)
+
+    with pytest.raises(InventoryExhausted) as exhausted:
+        inventory.reserve(SCOPE, 1, total=10, sold=5, block=100)
+
+    assert exhausted.value.available == 0
+    assert state(redis_client) == {"total": 10, "sold": 5, "held": 5, "block": 100}
+
+
+def test_reserve_reports_seats_left(inventory):
+    inventory.reserve(SCOPE, 4, total=5, sold=0, block=100)
+
+    with pytest.raises(InventoryExhausted) as exhausted:
+        inventory.reserve(SCOPE, 2, total=5, sold=0, block=100)
+
+    assert exhausted.value.available == 1
+
+
+def test_later_chain_reads_do_not_reseed_counters(inventory, redis_client):
+    inventory.reserve(SCOPE, 2, total=10, sold=5, block=100)
+    # A stale read from another worker must not overwrite the held seats
+    inventory.reserve(SCOPE, 1, total=10, sold=0, block=99)
+
+    assert state(redis_client)["sold"] == 5
+    assert state(redis_client)["held"] == 3
+
+
+def test_confirmed_settle_counts_seats_once(inventory, redis_client):
+    reservation = inventory.reserve(SCOPE, 3, total=10, sold=5, block=100)
+
+    inventory.settle(SCOPE, reservation, confirmed=True, block=101)
+    inventory.settle(SCOPE, reservation, confirmed=True, block=101)
+
+    assert state(redis_client)["sold"] == 8
+    assert state(redis_client)["held"] == 0
+
+
+def test_purchase_already_in_seed_read_is_not_counted_again(inventory, redis_client):
+    reservation = inventory.reserve(SCOPE, 3, total=10, sold=5, block=100)
+
+    inventory.settle(SCOPE, reservation, confirmed=True, block=100)
+
+    assert state(redis_client)["sold"] == 5
+    assert state(redis_client)["held"] == 0
+
+
+def test_reverted_purchase_releases_seats(inventory, redis_client):
+    reservation = inventory.reserve(SCOPE, 5, total=10, sold=5, block=100)
+    meta = {"reservation": {"scope": SCOPE, "id": reservation}}
+
+    inventory.on_tx_settled(meta, "failed", 101)
+
+    assert state(redis_client)["sold"] == 5
+    assert state(redis_client)["held"] == 0
+    inventory.reserve(SCOPE, 5, total=10, sold=5, block=100)
+
+
+def test_release_is_idempotent(inventory, redis_client):
+    first = inventory.reserve(SCOPE, 2, total=10, sold=0, block=100)
+    inventory.reserve(SCOPE, 3, total=10, sold=0, block=100)
+
+    inventory.release(SCOPE, first)
+    inventory.release(SCOPE, first)
+
+    assert state(redis_client)["held"] == 3
+
+
+def test_expired_holds_free_their_seats(inventory, redis_client):
+    inventory.hold_ttl = -1
+    expired = inventory.reserve(SCOPE, 5, total=5, sold=0, block=100)
+    inventory.hold_ttl = 60
+
+    inventory.reserve(SCOPE, 5, total=5, sold=0, block=100)
+    # Settling the expired hold late changes nothing
+    inventory.settle(SCOPE, expired, confirmed=False)
+
+    assert state(redis_client)["held"] == 5
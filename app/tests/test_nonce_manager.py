@@ -0,0 +1,98 @@
+"""Nonce allocation for signer accounts, shared through Redis or kept per process"""
+
+import pytest
+
+from nonce_manager import NonceManager
+
+ADDRESS = "0x" + "ab" * 20
+
+
+class FakeEth:
+    def __init__(self, pending: int):
+        self.pending = pending
+        self.calls = 0
+
+    def get_transaction_count(self, address, block_identifier):
+        assert block_identifier == "pending"
+        self.calls += 1
+        return self.pending
+
+
+class FakeWeb3:
+    def __init__(self, pending: int = 7):
+        self.eth = FakeEth(pending)
+
+    @staticmethod
+    def to_checksum_address(address):
+        return address
+
+
+@pytest.fixture
+def w3():
+    return FakeWeb3()
+
+
+@pytest.fixture(params=["redis", "local"])
+def nonces(request, w3, redis_client):
+    return NonceManager(w3, redis_client if request.param == "redis" else None)
+
+
+def test_allocate_seeds_from_chain_once(nonces, w3):
+    assert nonces.allocate(ADDRESS) == 7
+    assert nonces.allocate(ADDRESS) == 8
+    assert w3.eth.calls == 1
+
+
+def test_allocate_reserves_consecutive_nonces(nonces):
+    assert nonces.allocate(ADDRESS, 3) == 7
+    assert nonces.allocate(ADDRESS) == 10
+
+
+def test_allocate_rejects_empty_count(nonces):
+    with pytest.raises(ValueError):
+        nonces.allocate(ADDRESS, 0)
+
+
+def test_release_hands_back_last_nonce(nonces, w3):
+    nonce = nonces.allocate(ADDRESS)
+
+    nonces.release(ADDRESS, nonce)
+
+    assert nonces.allocate(ADDRESS) == nonce
+    assert w3.eth.calls == 1
+
+
+def test_release_below_later_allocations_resyncs(nonces, w3):
+    first = nonces.allocate(ADDRESS)
+    nonces.allocate(ADDRESS)
+    w3.eth.pending = 8
+
+    nonces.release(ADDRESS, first)
+
+    assert nonces.allocate(ADDRESS) == 8
+
+
+def test_release_after_nonce_error_resyncs(nonces, w3):
+    nonce = nonces.allocate(ADDRESS)
+    w3.eth.pending = 12
+
+    nonces.release(ADDRESS, nonce, ValueError("nonce too low"))
+
+    assert nonces.allocate(ADDRESS) == 12
+
+
+def test_resync_resets_counter_to_chain(nonces, w3):
+    nonces.allocate(ADDRESS, 5)
+    w3.eth.pending = 9
+
+    assert nonces.resync(ADDRESS) == 9
+    assert nonces.allocate(ADDRESS) == 9
+
+
+def test_workers_share_the_redis_counter(w3, redis_client):
+    worker_1 = NonceManager(w3, redis_client)
+    worker_2 = NonceManager(w3, redis_client)
+
+    assert worker_1.allocate(ADDRESS, 2) == 7
+    assert worker_2.allocate(ADDRESS) == 9
+    assert worker_2.peek_many([ADDRESS]) == {ADDRESS: 10}
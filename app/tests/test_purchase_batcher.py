@@ -0,0 +1,153 @@
+"""Batched oracle sends: nonce gaps left by rejected items and dependent chain steps"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import rlp
+from eth_account import Account
+from hexbytes import HexBytes
+from web3 import Web3
+
+from purchase_batcher import PurchaseBatcher
+from web3_manager import AsyncWeb3Manager, BatchSendResults
+
+FIRST_NONCE = 10
+
+
+def nonce_of(raw_transaction: str) -> int:
+    # Legacy transaction: [nonce, gasPrice, gas, to, value, data, v, r, s]
+    return int.from_bytes(rlp.decode(bytes.fromhex(raw_transaction[2:]))[0], "big")
+
+
+class FakeCall:
+    def __init__(self, name):
+        self.name = name
+
+    async def build_transaction(self, transaction):
+        return dict(transaction, to="0x" + "11" * 20, data="0x")
+
+
+class FakeNode:
+    """Accepts every raw transaction except the nonces listed in `reject`"""
+
+    def __init__(self, reject=(), reject_fillers=False):
+        self.reject = set(reject)
+        self.reject_fillers = reject_fillers
+        self.sent = []
+
+    async def make_batch_request(self, requests):
+        responses = []
+        for _, (raw_transaction,) in requests:
+            nonce = nonce_of(raw_transaction)
+            refill = nonce in self.sent
+            self.sent.append(nonce)
+            if nonce in self.reject and (not refill or self.reject_fillers):
+                responses.append({"error": {"message": "insufficient funds"}})
+            else:
+                responses.append({"result": "0x%064x" % len(self.sent)})
+        return responses
+
+
+class FakeManager:
+    """The parts of AsyncWeb3Manager that send_transaction_batch uses"""
+
+    send_transaction_batch = AsyncWeb3Manager.send_transaction_batch
+    _fill_nonce_gaps = AsyncWeb3Manager._fill_nonce_gaps
+
+    def __init__(self, node):
+        self.signer = Account.create()
+        self.next_nonce = FIRST_NONCE
+        self.resyncs = 0
+        self.w3 = SimpleNamespace(provider=node, to_wei=Web3.to_wei)
+        self.signing_executor = SimpleNamespace(
+            sign_many=lambda items: [a.sign_transaction(t) for a, t in items]
+        )
+        self.nonce_manager = SimpleNamespace(
+            allocate=self._allocate, resync=self._resync
+        )
+
+    def _allocate(self, address, count):
+        nonce = self.next_nonce
+        self.next_nonce += count
+        return nonce
+
+    def _resync(self, address):
+        self.resyncs += 1
+
+    async def get_chain_id(self):
+        return 31337
+
+    async def acquire_signer(self):
+        return self.signer
+
+
+def send(manager, count):
+    items = [(FakeCall(i), 0) for i in range(count)]
+    return asyncio.run(manager.send_transaction_batch(items, signer=manager.signer))
+
+
+def test_rejected_item_gap_is_filled():
+    node = FakeNode(reject={FIRST_NONCE + 1})
+    manager = FakeManager(node)
+
+    results = send(manager, 4)
+
+    assert [isinstance(r, HexBytes) for r in results] == [True, False, True, True]
+    assert isinstance(results, BatchSendResults)
+    assert results.stranded == []
+    # The filler went out on the rejected nonce and the counter stayed in place
+    assert node.sent[-1] == FIRST_NONCE + 1
+    assert manager.resyncs == 0
+
+
+def test_unfilled_gap_strands_later_items():
+    node = FakeNode(reject={FIRST_NONCE + 1}, reject_fillers=True)
+    manager = FakeManager(node)
+
+    results = send(manager, 4)
+
+    assert results.stranded == [2, 3]
+    assert manager.resyncs == 1
+
+
+def test_trailing_rejection_resyncs_without_filler():
+    node = FakeNode(reject={FIRST_NONCE + 2})
+    manager = FakeManager(node)
+
+    results = send(manager, 3)
+
+    assert results.stranded == []
+    assert node.sent == [FIRST_NONCE, FIRST_NONCE + 1, FIRST_NONCE + 2]
+    assert manager.resyncs == 1
+
+
+@pytest.mark.parametrize("reject_fillers", [False, True])
+def test_mixed_batch_of_chains(reject_fillers):
+    # Three redeem-then-buy chains; the second redemption is rejected
+    node = FakeNode(reject={FIRST_NONCE + 1}, reject_fillers=reject_fillers)
+    manager = FakeManager(node)
+    batcher = PurchaseBatcher(manager, window_ms=0)
+    futures = []
+
+    async def flush():
+        loop = asyncio.get_running_loop()
+        batch = []
+        for buyer in range(3):
+            future = loop.create_future()
+            futures.append(future)
+            chain = [(FakeCall(f"redeem-{buyer}"), 0), (FakeCall(f"buy-{buyer}"), 0)]
+            batch.append((chain, None, future))
+        await batcher._flush(batch)
+
+    asyncio.run(flush())
+    first, second, third = (future.result() for future in futures)
+
+    assert all(isinstance(r, HexBytes) for r in first)
+    assert isinstance(second[0], Exception) and second[1] is None
+    assert isinstance(third[0], HexBytes)
+    if reject_fillers:
+        # Its redemption sits above an unfillable gap, so the purchase is held back
+        assert isinstance(third[1], RuntimeError)
+    else:
+        assert isinstance(third[1], HexBytes)
@@ -0,0 +1,80 @@
+"""Transaction tracker: settling shared pending records and tracking failures"""
+
+from types import SimpleNamespace
+
+import redis
+
+from tx_tracker import TxTracker
+
+TX_HASH = "0x" + "ab" * 32
+
+RECEIPT = {
+    "status": "0x1",
+    "blockNumber": "0x5",
+    "gasUsed": "0x5208",
+    "cumulativeGasUsed": "0x5208",
+    "effectiveGasPrice": "0x1",
+    "transactionHash": TX_HASH,
+    "transactionIndex": "0x0",
+    "blockHash": "0x" + "00" * 32,
+    "from": "0x" + "11" * 20,
+    "to": "0x" + "22" * 20,
+    "contractAddress": None,
+    "logs": [],
+    "logsBloom": "0x" + "00" * 256,
+    "type": "0x0",
+}
+
+
+def make_manager(redis_client):
+    provider = SimpleNamespace(
+        make_batch_request=lambda requests: [{"result": RECEIPT} for _ in requests]
+    )
+    return SimpleNamespace(
+        w3=SimpleNamespace(provider=provider),
+        redis=redis_client,
+        read_cache=SimpleNamespace(observe_block=lambda block: None),
+    )
+
+
+def test_receipt_is_settled_by_one_worker(redis_client):
+    manager = make_manager(redis_client)
+    workers = [TxTracker(manager), TxTracker(manager)]
+    settled = []
+    for worker in workers:
+        worker.add_settle_listener(lambda *args: settled.append(args))
+    workers[0].track(TX_HASH, "ticket_purchase", meta={"event_id": 1})
+
+    # Both workers saw the hash pending before either settled it
+    pending = redis_client.smembers("tx:pending")
+    for worker in workers:
+        worker.redis = SimpleNamespace(
+            smembers=lambda key: pending,
+            srem=redis_client.srem,
+            hget=redis_client.hget,
+            hmget=redis_client.hmget,
+            pipeline=redis_client.pipeline,
+        )
+
+    assert [worker.poll_once() for worker in workers] == [1, 0]
+    assert len(settled) == 1
+    assert settled[0][:3] == ({"event_id": 1}, "confirmed", 5)
+
+
+def test_track_sent_survives_redis_failure():
+    class BrokenRedis:
+        def pipeline(self):
+            raise redis.ConnectionError("Redis is down")
+
+    tracker = TxTracker(make_manager(BrokenRedis()))
+
+    assert tracker.track_sent(TX_HASH, "ticket_purchase") is None
+
+
+def test_track_sent_returns_status_url(redis_client):
+    tracker = TxTracker(make_manager(redis_client))
+
+    assert tracker.track_sent(bytes.fromhex("ab" * 32), "ticket_purchase") == (
+        f"/tx/{TX_HASH}"
+    )
+    assert tracker.get_status(TX_HASH)["status"] == "pending"
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from .queue_manager import (
     leave_queue,
     is_allowed_purchased,
@@ -8,7 +9,8 @@ from .queue_manager import (
     complete_purchase)
 from pydantic import BaseModel
 
-from web3_manager import web3_manager as wm
+from web3_manager import async_web3_manager as wm
+from tx_tracker import normalize_tx_hash, tx_tracker
 
 class JoinQueueRequest(BaseModel):
     user_address: str
@@ -26,13 +28,14 @@ async def join_queue_endpoint(request: JoinQueueRequest):
     try:
         user_address = request.user_address.lower()
         pts = int(request.points_amount or 0)
+        redeem_hash = None
 
         # ✅ If redeem requested (points_amount > 0)
         if pts > 0:
 
             # ✅ Check user balance before redeem
             try:
-                balance = wm.get_points_balance(user_address)
+                balance = await wm.get_points_balance(user_address)
             except Exception as e:
                 raise HTTPException(
                     status_code=500,
@@ -53,17 +56,30 @@ async def join_queue_endpoint(request: JoinQueueRequest):
                     wm.loyalty_system.address,
                     pts
                 )
-                approval_txn = wm.build_user_transaction(approval_tx, user_account)
-                approval_hash = wm.sign_and_send_user_transaction(approval_txn, user_account)
-                wm.w3.eth.wait_for_transaction_receipt(approval_hash)
+                approval_txn = await wm.build_user_transaction(approval_tx, user_account)
+                approval_hash = await wm.sign_and_send_user_transaction(
+                    approval_txn, user_account
+                )
+                await wm.wait_for_transaction_receipt(approval_hash)
 
                 try: 
-                    points_used = wm.redeem_loyalty_points_queue(user_address, request.points_amount)
+                    redeem_hash = await wm.redeem_loyalty_points_queue(
+                        user_address, request.points_amount
+                    )
                 except Exception as e:
                     raise HTTPException(
                         status_code=500,
                         detail=f"Failed to redeem points via contract call: {str(e)}"
                     )
+                # The redemption is out; a tracking failure must not fail the request
+                redeem_hash = normalize_tx_hash(redeem_hash)
+                await run_in_threadpool(
+                    tx_tracker.track_sent,
+                    redeem_hash,
+                    "loyalty_redeem_queue",
+                    events=["loyalty_system.PointsRedeemedQueue"],
+                    meta={"user_address": user_address, "points": pts},
+                )
                 # try:
                     # Use the account-by-index helper for Hardhat test accounts
                     # user_account = wm.get_user_account_by_index(request.user_account_index)\
@@ -90,10 +106,14 @@ async def join_queue_endpoint(request: JoinQueueRequest):
         # ✅ Add to local queue
         result = join_queue(user_address, pts)
 
-        return {
+        response = {
             "success": True,
             **result
         }
+        if redeem_hash:
+            # Redemption is mined in the background; progress at /tx/{hash}
+            response["redeem_tx_hash"] = redeem_hash
+        return response
 
     except HTTPException:
         raise
@@ -0,0 +1,250 @@
+"""Background tracking of submitted transactions, with results stored in Redis"""
+
+import json
+import threading
+import time
+
+import redis
+from hexbytes import HexBytes
+from web3._utils.method_formatters import receipt_formatter
+from web3.logs import DISCARD
+
+from config import config
+from contract_batch import chunked
+from web3_manager import web3_manager
+
+PENDING_SET_KEY = "tx:pending"
+
+
+def _tx_key(tx_hash: str) -> str:
+    return f"tx:{tx_hash.lower()}"
+
+
+def normalize_tx_hash(tx_hash) -> str:
+    """0x-prefixed lowercase hex string for a hash given as bytes or str"""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        tx_hash = HexBytes(tx_hash).to_0x_hex()
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+def _to_jsonable(value):
+    """Convert decoded event args (AttributeDicts, HexBytes) into JSON types"""
+    if isinstance(value, (bytes, bytearray)):
+        return HexBytes(value).to_0x_hex()
+    if isinstance(value, dict):
+        return {key: _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(item) for item in value]
+    return value
+
+
+class TxTracker:
+    """
+    Follows submitted transactions so routes do not block on receipts.
+
+    A route registers a transaction hash together with the events it cares about,
+    as "<contract attribute>.<EventName>" (e.g. "loyalty_system.PointsAwarded"),
+    and returns right away. A background thread polls all pending receipts in one
+    JSON-RPC batch every TX_TRACKER_POLL_INTERVAL_SECONDS, decodes the requested
+    events and stores the outcome in the `tx:<hash>` Redis hash, which is served by
+    GET /tx/{hash}. Records expire TX_RESULT_TTL_SECONDS after they settle.
+    Listeners registered with add_settle_listener are called with the record's
+    meta, its final status, block number and decoded events whenever a transaction
+    settles. Every API worker polls the same pending set, so a hash is claimed by
+    removing it from the set before it is settled; listeners run once per
+    transaction, in whichever worker claimed it.
+    """
+
+    def __init__(self, manager, redis_client=None):
+        self.manager = manager
+        self.w3 = manager.w3
+        self.redis = redis_client if redis_client is not None else manager.redis
+        self.poll_interval = config.TX_TRACKER_POLL_INTERVAL_SECONDS
+        self.timeout = config.TX_TRACKER_TIMEOUT_SECONDS
+        self.result_ttl = config.TX_RESULT_TTL_SECONDS
+        self._thread = None
+        self._stop = threading.Event()
+        self._settle_listeners = []
+
+    def add_settle_listener(self, listener):
+        """Call `listener(meta, status, block_number, events)` when a transaction settles"""
+        self._settle_listeners.append(listener)
+
+    def _notify(self, tx_hash: str, status: str, block_number=None):
+        if not self._settle_listeners:
+            return
+        meta, events = self.redis.hmget(_tx_key(tx_hash), "meta", "events")
+        meta = json.loads(meta or "{}")
+        events = json.loads(events or "{}")
+        for listener in self._settle_listeners:
+            try:
+                listener(meta, status, block_number, events)
+            except Exception as e:
+                print(f"⚠️  Settle listener failed for {tx_hash}: {e}")
+
+    def track(self, tx_hash, kind: str, events=(), meta: dict = None) -> str:
+        """Register a submitted transaction and return its normalized hash"""
+        tx_hash = normalize_tx_hash(tx_hash)
+        record = {
+            "tx_hash": tx_hash,
+            "kind": kind,
+            "status": "pending",
+            "watch_events": json.dumps(list(events)),
+            "meta": json.dumps(_to_jsonable(meta or {})),
+            "submitted_at": str(int(time.time())),
+        }
+        pipe = self.redis.pipeline()
+        pipe.hset(_tx_key(tx_hash), mapping=record)
+        # Pending records outlive the poll timeout so they are never dropped unseen
+        pipe.expire(_tx_key(tx_hash), self.timeout + self.result_ttl)
+        pipe.sadd(PENDING_SET_KEY, tx_hash)
+        pipe.execute()
+        return tx_hash
+
+    def track_sent(self, tx_hash, kind: str, events=(), meta: dict = None):
+        """
+        track() for a transaction that is already broadcast; returns its /tx status
+        URL, or None if the record could not be stored. A tracking failure must not
+        turn a purchase that went out into an error the client would retry.
+        """
+        try:
+            return f"/tx/{self.track(tx_hash, kind, events=events, meta=meta)}"
+        except Exception as e:
+            print(f"⚠️  Failed to track {kind} transaction {tx_hash}: {e}")
+            return None
+
+    def get_status(self, tx_hash) -> dict:
+        """Current record for a transaction, or None if it is not tracked"""
+        record = self.redis.hgetall(_tx_key(normalize_tx_hash(tx_hash)))
+        if not record:
+            return None
+
+        status = {
+            "tx_hash": record["tx_hash"],
+            "kind": record.get("kind"),
+            "status": record.get("status"),
+            "submitted_at": int(record.get("submitted_at", 0)),
+            "meta": json.loads(record.get("meta") or "{}"),
+        }
+        for field in ("block_number", "gas_used", "settled_at"):
+            if field in record:
+                status[field] = int(record[field])
+        if "events" in record:
+            status["events"] = json.loads(record["events"])
+        if "error" in record:
+            status["error"] = record["error"]
+        return status
+
+    def poll_once(self) -> int:
+        """Fetch receipts for all pending transactions; returns how many settled"""
+        pending = sorted(self.redis.smembers(PENDING_SET_KEY))
+        settled = 0
+        for chunk in chunked(pending, config.RPC_BATCH_SIZE):
+            responses = self.w3.provider.make_batch_request(
+                [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in chunk]
+            )
+            if not isinstance(responses, list):
+                raise ValueError(f"Receipt batch request failed: {responses}")
+
+            for tx_hash, response in zip(chunk, responses):
+                receipt = response.get("result")
+                if receipt:
+                    settled += self._settle(tx_hash, receipt_formatter(receipt))
+                elif "error" not in response:
+                    settled += self._expire_if_stale(tx_hash)
+        return settled
+
+    def _decode_events(self, tx_hash: str, receipt) -> dict:
+        watch_events = json.loads(
+            self.redis.hget(_tx_key(tx_hash), "watch_events") or "[]"
+        )
+        decoded = {}
+        for name in watch_events:
+            contract_attr, event_name = name.split(".", 1)
+            contract = getattr(self.manager, contract_attr)
+            logs = contract.events[event_name]().process_receipt(
+                receipt, errors=DISCARD
+            )
+            decoded[event_name] = [_to_jsonable(log["args"]) for log in logs]
+        return decoded
+
+    def _claim(self, tx_hash: str) -> bool:
+        """Take a hash off the pending set; False if another worker already did"""
+        return bool(self.redis.srem(PENDING_SET_KEY, tx_hash))
+
+    def _settle(self, tx_hash: str, receipt) -> int:
+        if not self._claim(tx_hash):
+            return 0
+
+        status = "confirmed" if receipt["status"] == 1 else "failed"
+        update = {
+            "status": status,
+            "block_number": receipt["blockNumber"],
+            "gas_used": receipt["gasUsed"],
+            "settled_at": int(time.time()),
+        }
+        if status == "confirmed":
+            try:
+                update["events"] = json.dumps(self._decode_events(tx_hash, receipt))
+            except Exception as e:
+                update["error"] = f"Failed to decode events: {e}"
+        else:
+            update["error"] = "Transaction reverted"
+
+        pipe = self.redis.pipeline()
+        pipe.hset(_tx_key(tx_hash), mapping=update)
+        pipe.expire(_tx_key(tx_hash), self.result_ttl)
+        pipe.execute()
+        self.manager.read_cache.observe_block(receipt["blockNumber"])
+        self._notify(tx_hash, status, receipt["blockNumber"])
+        return 1
+
+    def _expire_if_stale(self, tx_hash: str) -> int:
+        submitted_at = self.redis.hget(_tx_key(tx_hash), "submitted_at")
+        if submitted_at is not None and time.time() - int(submitted_at) < self.timeout:
+            return 0
+        if not self._claim(tx_hash):
+            return 0
+
+        pipe = self.redis.pipeline()
+        if submitted_at is not None:
+            pipe.hset(
+                _tx_key(tx_hash),
+                mapping={
+                    "status": "failed",
+                    "error": "No receipt before the tracking timeout",
+                    "settled_at": int(time.time()),
+                },
+            )
+            pipe.expire(_tx_key(tx_hash), self.result_ttl)
+        pipe.execute()
+        if submitted_at is not None:
+            self._notify(tx_hash, "failed")
+        return 1
+
+    def run(self):
+        """Poll loop for the background thread"""
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except redis.exceptions.ConnectionError:
+                print("⚠️  Transaction tracker: Redis not ready, retrying...")
+            except Exception as e:
+                print(f"❌ Transaction tracker error: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Start the background polling thread (once per process)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+# Create singleton instance
+tx_tracker = TxTracker(web3_manager)
@@ -1,6 +1,27 @@
+import asyncio
 import json
-from web3 import Web3
+import time
+import redis
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
 from config import config
+from heartbeat import NodeHeartbeat
+from contract_batch import (
+    check_batch_response,
+    chunked,
+    decode_call_response,
+    encode_call_request,
+)
+from nonce_manager import NonceManager
+from read_cache import BlockReadCache, call_cache_key
+from rpc_router import (
+    RpcEndpointSet,
+    build_async_http_provider,
+    build_http_provider,
+    sticky_route,
+)
+from signer_pool import SignerPool
+from signing_pool import signing_executor
 
 # Set up logging
 
@@ -33,6 +54,20 @@ HARDHAT_ADDRESSES = {
 }
 
 
+class BatchSendResults(list):
+    """
+    Per-item results of AsyncWeb3Manager.send_transaction_batch.
+
+    `stranded` lists the offsets of accepted items queued above a rejected nonce
+    that could not be filled; the counter was resynced below them, so nonces handed
+    out afterwards can be lower than theirs.
+    """
+
+    def __init__(self, results, stranded=()):
+        super().__init__(results)
+        self.stranded = list(stranded)
+
+
 class Web3Manager:
     """Manager class for Web3 connection and contract interactions"""
 
@@ -40,11 +75,28 @@ class Web3Manager:
         # Validate environment variables
         config.validate_required_env_vars()
 
-        # Initialize Web3 connection
-        self.w3 = Web3(Web3.HTTPProvider(config.RPC_URL))
+        # Initialize Web3 connection - routed across RPC_URLS when several are set
+        self.rpc_endpoints = RpcEndpointSet(config.RPC_URLS)
+        self.w3 = Web3(build_http_provider(self.rpc_endpoints))
 
-        # Initialize oracle account
+        # Initialize oracle accounts - the primary oracle plus any extra pool keys
         self.oracle_account = self.w3.eth.account.from_key(config.ORACLE_PRIVATE_KEY)
+        self.oracle_accounts = [self.oracle_account]
+        for key in config.ORACLE_PRIVATE_KEYS:
+            account = self.w3.eth.account.from_key(key)
+            if account.address not in [a.address for a in self.oracle_accounts]:
+                self.oracle_accounts.append(account)
+
+        # Shared nonce counter for oracle-signed transactions (Redis-backed across workers)
+        self.redis = redis.Redis.from_url(
+            config.REDIS_URL, db=config.REDIS_DB, decode_responses=True
+        )
+        self.nonce_manager = NonceManager(self.w3, self.redis)
+        self.signer_pool = SignerPool(self.w3, self.oracle_accounts, self.nonce_manager)
+        self.read_cache = BlockReadCache()
+        self.heartbeat = NodeHeartbeat(self)
+        self.signing_executor = signing_executor
+        self._chain_id = None
 
         # Load contract ABI and initialize contract
         self.event_manager_abi = self._load_contract_abi(
@@ -132,38 +184,162 @@ class Web3Manager:
         )
 
     def is_connected(self):
-        """Check if Web3 is connected to the blockchain"""
-        return self.w3.is_connected()
+        """Check if Web3 is connected to the blockchain, using the heartbeat's cached state"""
+        connected = self.heartbeat.connected()
+        if connected or (connected is False and config.RPC_FAST_FAIL):
+            return connected
+        # No recent heartbeat, or the node was down and fast-fail is off: probe it now
+        return self.heartbeat.beat()
+
+    def latest_block(self) -> int:
+        """Latest block number, re-read from the node at most every READ_CACHE_BLOCK_REFRESH_SECONDS"""
+        if not self.read_cache.block_is_fresh():
+            self.read_cache.note_block(self.w3.eth.block_number)
+        return self.read_cache.latest_block
+
+    def cached_call(self, function_call, max_staleness=0):
+        """
+        Run a view call through the block-aware read cache.
+
+        The result is read at the latest block and reused until a new block arrives;
+        `max_staleness` N also accepts a result read up to N blocks ago.
+        """
+        block = self.latest_block()
+        key = call_cache_key(function_call)
+        hit, value = self.read_cache.get(
+            key, self.read_cache.target_block(block, max_staleness)
+        )
+        if hit:
+            return value
+        value = function_call.call(block_identifier=block)
+        self.read_cache.set(key, block, value)
+        return value
+
+    def batch_call(
+        self,
+        calls,
+        block_identifier="latest",
+        allow_failure=False,
+        use_cache=False,
+        max_staleness=0,
+    ):
+        """
+        Execute many contract view calls in JSON-RPC batch requests.
+
+        `calls` is a list of bound contract functions (e.g. `contract.functions.events(1)`).
+        Results are decoded and returned in the same order; with `allow_failure` a
+        reverted or undecodable call yields None instead of raising. With `use_cache`
+        results come from the read cache and only the misses are sent, pinned to the
+        latest block.
+        """
+        if not calls:
+            return []
+        if not use_cache:
+            return self._batch_call_at(calls, block_identifier, allow_failure)
+
+        block = self.latest_block()
+        results, keys, misses = self.read_cache.lookup_many(calls, block, max_staleness)
+        if not misses:
+            return results
+        fetched = self._batch_call_at(
+            [calls[index] for index in misses], block, allow_failure
+        )
+        return self.read_cache.store_many(results, keys, misses, fetched, block)
+
+    def _batch_call_at(self, calls, block_identifier, allow_failure):
+        results = []
+        for chunk in chunked(list(calls), config.RPC_BATCH_SIZE):
+            requests = [encode_call_request(call, block_identifier) for call in chunk]
+            responses = check_batch_response(
+                self.w3.provider.make_batch_request(requests), len(chunk)
+            )
+            results.extend(
+                decode_call_response(self.w3.codec, call, response, allow_failure)
+                for call, response in zip(chunk, responses)
+            )
+        return results
 
     def get_transaction_count(self):
         """Get nonce for oracle account"""
         return self.w3.eth.get_transaction_count(self.oracle_account.address)
 
-    def build_transaction(self, function_call, gas=None, gas_price_gwei=None):
-        """Build a transaction with default parameters"""
-        gas = gas or config.DEFAULT_GAS
-        gas_price_gwei = gas_price_gwei or config.DEFAULT_GAS_PRICE_GWEI
-
-        return function_call.build_transaction(
-            {
-                "from": self.oracle_account.address,
-                "nonce": self.get_transaction_count(),
-                "gas": gas,
-                "gasPrice": self.w3.to_wei(gas_price_gwei, "gwei"),
-            }
-        )
-
-    def sign_and_send_transaction(self, transaction):
-        """Sign and send a transaction"""
-        signed_txn = self.oracle_account.sign_transaction(transaction)
+    @property
+    def chain_id(self) -> int:
+        """Chain ID, fetched once instead of on every transaction build"""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def is_managed_signer(self, address: str) -> bool:
+        """Whether nonces for this address come from the shared nonce manager"""
+        return address in self.signer_pool
+
+    def get_next_nonce(self, address: str) -> int:
+        """Next nonce for an address - oracle nonces are allocated locally, others come from the node"""
+        if self.is_managed_signer(address):
+            return self.nonce_manager.allocate(address)
+        return self.w3.eth.get_transaction_count(address, "pending")
+
+    def _send_signed_transaction(self, signed_txn, transaction):
+        """Send a signed transaction, handing the nonce back to the manager if the node rejects it"""
         # Handle different Web3.py versions - try both raw_transaction and rawTransaction
         raw_tx = getattr(
             signed_txn, "raw_transaction", getattr(signed_txn, "rawTransaction", None)
         )
         if raw_tx is None:
             raise ValueError("Could not access raw transaction data")
-        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-        return tx_hash
+        try:
+            with sticky_route(transaction.get("from")):
+                return self.w3.eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            sender = transaction.get("from")
+            if sender and self.is_managed_signer(sender):
+                self.nonce_manager.release(sender, transaction["nonce"], e)
+            raise
+
+    def _build_transaction_for(
+        self, function_call, sender, gas=None, gas_price_gwei=None
+    ):
+        """Build a transaction for `sender`, returning the nonce if building fails"""
+        gas = gas or config.DEFAULT_GAS
+        gas_price_gwei = gas_price_gwei or config.DEFAULT_GAS_PRICE_GWEI
+
+        nonce = self.get_next_nonce(sender)
+        try:
+            return function_call.build_transaction(
+                {
+                    "from": sender,
+                    "nonce": nonce,
+                    "chainId": self.chain_id,
+                    "gas": gas,
+                    "gasPrice": self.w3.to_wei(gas_price_gwei, "gwei"),
+                }
+            )
+        except Exception as e:
+            if self.is_managed_signer(sender):
+                self.nonce_manager.release(sender, nonce, e)
+            raise
+
+    def build_transaction(
+        self, function_call, gas=None, gas_price_gwei=None, signer=None
+    ):
+        """Build an oracle transaction, from the least-loaded pool signer unless `signer` is given"""
+        signer = signer or self.signer_pool.acquire()
+        return self._build_transaction_for(
+            function_call, signer.address, gas, gas_price_gwei
+        )
+
+    def sign_and_send_transaction(self, transaction):
+        """Sign an oracle transaction with the pool signer it was built for and send it"""
+        signer = self.signer_pool.account_for(transaction["from"])
+        signed_txn = self.signing_executor.sign(signer, transaction)
+        return self._send_signed_transaction(signed_txn, transaction)
+
+    def wait_for_transaction_receipt(self, tx_hash, timeout=120):
+        """Wait for a transaction to be mined and let cached reads catch up to its block"""
+        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        self.read_cache.observe_block(receipt["blockNumber"])
+        return receipt
 
     def get_user_account(self, wallet_address: str, private_key: str):
         """Get a user account object from wallet credentials"""
@@ -202,29 +378,14 @@ class Web3Manager:
         self, function_call, user_account, gas=None, gas_price_gwei=None
     ):
         """Build a transaction for a specific user account"""
-        gas = gas or config.DEFAULT_GAS
-        gas_price_gwei = gas_price_gwei or config.DEFAULT_GAS_PRICE_GWEI
-
-        return function_call.build_transaction(
-            {
-                "from": user_account.address,
-                "nonce": self.w3.eth.get_transaction_count(user_account.address),
-                "gas": gas,
-                "gasPrice": self.w3.to_wei(gas_price_gwei, "gwei"),
-            }
+        return self._build_transaction_for(
+            function_call, user_account.address, gas, gas_price_gwei
         )
 
     def sign_and_send_user_transaction(self, transaction, user_account):
         """Sign and send a transaction with a user account"""
-        signed_txn = user_account.sign_transaction(transaction)
-        # Handle different Web3.py versions - try both raw_transaction and rawTransaction
-        raw_tx = getattr(
-            signed_txn, "raw_transaction", getattr(signed_txn, "rawTransaction", None)
-        )
-        if raw_tx is None:
-            raise ValueError("Could not access raw transaction data")
-        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-        return tx_hash
+        signed_txn = self.signing_executor.sign(user_account, transaction)
+        return self._send_signed_transaction(signed_txn, transaction)
 
     def get_points_balance(self, user_address: str) -> int:
         """Return LoyaltyPoint balance (token units) for a user."""
@@ -257,63 +418,33 @@ class Web3Manager:
             raise RuntimeError("LoyaltySystem contract not initialised")
         return self.loyalty_system.functions.quoteWeiFromPoints(int(point_units)).call()
 
-    def award_loyalty_points(self, to_address: str, wei_amount: int) -> int:
-        """Award loyalty points to a user based on wei amount spent."""
+    def award_loyalty_points(self, to_address: str, wei_amount: int):
+        """Submit an awardPoints transaction and return its hash without waiting for it to be mined."""
         if not hasattr(self, "loyalty_system"):
             raise RuntimeError("LoyaltySystem contract not initialised")
 
-        # Use the oracle account to award points (oracle is authorized to mint points)
-        oracle_account = self.get_user_account_by_index(
-            0
-        )  # Assuming oracle is account 0
-
         function_call = self.loyalty_system.functions.awardPoints(
             self.w3.to_checksum_address(to_address), int(wei_amount)
         )
 
-        # Build and send the transaction from oracle account
-        txn = self.build_user_transaction(function_call, oracle_account, gas=200000)
-        tx_hash = self.sign_and_send_user_transaction(txn, oracle_account)
-
-        # Get the transaction receipt to check if points were awarded
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        # Build and send the transaction from the oracle account (authorized to mint points);
+        # the PointsAwarded event is decoded later by the transaction tracker
+        txn = self.build_transaction(function_call, gas=200000)
+        return self.sign_and_send_transaction(txn)
 
-        # Parse the PointsAwarded event to get the actual points minted
-        points_awarded_event = (
-            self.loyalty_system.events.PointsAwarded().process_receipt(receipt)
-        )
-        if points_awarded_event:
-            return points_awarded_event[0]["args"]["pointsMinted"]
-        return 0
-
-    def redeem_loyalty_points_queue(self, to_address: str, point_redeemed: int) -> int:
-        """Redeem loyalty points to a user based on amount requested."""
+    def redeem_loyalty_points_queue(self, to_address: str, point_redeemed: int):
+        """Submit a redeemPointsQueue transaction and return its hash without waiting for it to be mined."""
         if not hasattr(self, "loyalty_system"):
             raise RuntimeError("LoyaltySystem contract not initialised")
 
-        # Use the oracle account to redeen points
-        oracle_account = self.get_user_account_by_index(
-            0
-        )  # Assuming oracle is account 0
-
         function_call = self.loyalty_system.functions.redeemPointsQueue(
             self.w3.to_checksum_address(to_address), int(point_redeemed)
         )
 
-        # Build and send the transaction from oracle account
-        txn = self.build_user_transaction(function_call, oracle_account, gas=200000)
-        tx_hash = self.sign_and_send_user_transaction(txn, oracle_account)
-
-        # Get the transaction receipt to check if points were redeemed
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-
-        # Parse the PointsRedeemedQueue event to get the actual points burned
-        points_redeem_queue_event = (
-            self.loyalty_system.events.PointsRedeemedQueue().process_receipt(receipt)
-        )
-        if points_redeem_queue_event:
-            return points_redeem_queue_event[0]["args"]["pointsBurned"]
-        return 0
+        # Build and send the transaction from the oracle account;
+        # the PointsRedeemedQueue event is decoded later by the transaction tracker
+        txn = self.build_transaction(function_call, gas=200000)
+        return self.sign_and_send_transaction(txn)
 
     def check_resale_market_approval(self, wallet_address: str) -> bool:
         """Check if user has approved ResaleMarket to transfer their tickets"""
@@ -349,6 +480,13 @@ class Web3Manager:
         """Approve ResaleMarket to transfer user's tickets using wallet credentials"""
         try:
             user_account = self.get_user_account(wallet_address, private_key)
+        except Exception as e:
+            raise Exception(f"Failed to approve ResaleMarket: {str(e)}")
+        return self.approve_resale_market_for_account(user_account)
+
+    def approve_resale_market_for_account(self, user_account):
+        """Approve ResaleMarket to transfer user's tickets with an already derived account"""
+        try:
             resale_market_address = self.market_manager.address
 
             # Build setApprovalForAll transaction
@@ -386,9 +524,16 @@ class Web3Manager:
         return self.approve_resale_market(wallet_address, private_key)
 
     def revoke_resale_market_approval(self, wallet_address: str, private_key: str):
-        """Revoke ResaleMarket approval to transfer user's tickets"""
+        """Revoke ResaleMarket approval to transfer user's tickets using wallet credentials"""
         try:
             user_account = self.get_user_account(wallet_address, private_key)
+        except Exception as e:
+            raise Exception(f"Failed to revoke ResaleMarket approval: {str(e)}")
+        return self.revoke_resale_market_approval_for_account(user_account)
+
+    def revoke_resale_market_approval_for_account(self, user_account):
+        """Revoke ResaleMarket approval to transfer user's tickets with an already derived account"""
+        try:
             resale_market_address = self.market_manager.address
 
             # Build setApprovalForAll transaction with False
@@ -420,5 +565,419 @@ class Web3Manager:
             raise Exception(f"Failed to revoke ResaleMarket approval: {str(e)}")
 
 
-# Create a singleton instance
+class AsyncWeb3Manager:
+    """
+    AsyncWeb3 counterpart of Web3Manager for use inside `async def` routes.
+
+    RPC calls are awaited on an AsyncHTTPProvider so a slow node no longer stalls the
+    event loop. ABIs, the oracle account and the nonce manager are shared with the
+    synchronous manager; pure-CPU helpers (account derivation) are delegated to it.
+    """
+
+    def __init__(self, sync_manager: Web3Manager):
+        self.sync_manager = sync_manager
+
+        # Initialize AsyncWeb3 connection
+        self.rpc_endpoints = sync_manager.rpc_endpoints
+        self.w3 = AsyncWeb3(build_async_http_provider(self.rpc_endpoints))
+
+        self.oracle_account = sync_manager.oracle_account
+        self.oracle_accounts = sync_manager.oracle_accounts
+        self.signer_pool = sync_manager.signer_pool
+        self.nonce_manager = sync_manager.nonce_manager
+        self.read_cache = sync_manager.read_cache
+        self.heartbeat = sync_manager.heartbeat
+        self.signing_executor = sync_manager.signing_executor
+        self._chain_id = None
+
+        self.event_manager = self.w3.eth.contract(
+            address=sync_manager.event_manager.address,
+            abi=sync_manager.event_manager_abi,
+        )
+        self.market_manager = self.w3.eth.contract(
+            address=sync_manager.market_manager.address,
+            abi=sync_manager.resale_market_abi,
+        )
+        self.loyalty_point = self.w3.eth.contract(
+            address=sync_manager.loyalty_point.address,
+            abi=sync_manager.loyalty_point_abi,
+        )
+        self.loyalty_system = self.w3.eth.contract(
+            address=sync_manager.loyalty_system.address,
+            abi=sync_manager.loyalty_system_abi,
+        )
+        self.ticket_nft = self.w3.eth.contract(
+            address=sync_manager.ticket_nft.address,
+            abi=sync_manager.ticket_nft_abi,
+        )
+
+    async def is_connected(self):
+        """Check if Web3 is connected to the blockchain, using the heartbeat's cached state"""
+        connected = self.heartbeat.connected()
+        if connected or (connected is False and config.RPC_FAST_FAIL):
+            return connected
+
+        start = time.monotonic()
+        try:
+            block_number = await self.w3.eth.block_number
+        except Exception as e:
+            self.heartbeat.record_failure(e)
+            return False
+        self.heartbeat.record_success(block_number, (time.monotonic() - start) * 1000)
+        return True
+
+    async def latest_block(self) -> int:
+        """Latest block number, re-read from the node at most every READ_CACHE_BLOCK_REFRESH_SECONDS"""
+        if not self.read_cache.block_is_fresh():
+            self.read_cache.note_block(await self.w3.eth.block_number)
+        return self.read_cache.latest_block
+
+    async def cached_call(self, function_call, max_staleness=0):
+        """Async cached_call - shares the read cache with the sync manager"""
+        block = await self.latest_block()
+        key = call_cache_key(function_call)
+        hit, value = self.read_cache.get(
+            key, self.read_cache.target_block(block, max_staleness)
+        )
+        if hit:
+            return value
+        value = await function_call.call(block_identifier=block)
+        self.read_cache.set(key, block, value)
+        return value
+
+    async def batch_call(
+        self,
+        calls,
+        block_identifier="latest",
+        allow_failure=False,
+        use_cache=False,
+        max_staleness=0,
+    ):
+        """Async batch_call - chunks are sent concurrently and decoded in order"""
+        if not calls:
+            return []
+        if not use_cache:
+            return await self._batch_call_at(calls, block_identifier, allow_failure)
+
+        block = await self.latest_block()
+        results, keys, misses = self.read_cache.lookup_many(calls, block, max_staleness)
+        if not misses:
+            return results
+        fetched = await self._batch_call_at(
+            [calls[index] for index in misses], block, allow_failure
+        )
+        return self.read_cache.store_many(results, keys, misses, fetched, block)
+
+    async def _batch_call_at(self, calls, block_identifier, allow_failure):
+        async def _call_chunk(chunk):
+            requests = [encode_call_request(call, block_identifier) for call in chunk]
+            responses = check_batch_response(
+                await self.w3.provider.make_batch_request(requests), len(chunk)
+            )
+            return [
+                decode_call_response(self.w3.codec, call, response, allow_failure)
+                for call, response in zip(chunk, responses)
+            ]
+
+        chunk_results = await asyncio.gather(
+            *(
+                _call_chunk(chunk)
+                for chunk in chunked(list(calls), config.RPC_BATCH_SIZE)
+            )
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def get_chain_id(self) -> int:
+        """Chain ID, fetched once instead of on every transaction build"""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        return self._chain_id
+
+    def is_managed_signer(self, address: str) -> bool:
+        """Whether nonces for this address come from the shared nonce manager"""
+        return self.sync_manager.is_managed_signer(address)
+
+    async def get_next_nonce(self, address: str) -> int:
+        """Next nonce for an address - oracle nonces are allocated locally, others come from the node"""
+        if self.is_managed_signer(address):
+            return await asyncio.to_thread(self.nonce_manager.allocate, address)
+        return await self.w3.eth.get_transaction_count(address, "pending")
+
+    async def _release_nonce(self, sender, nonce, error):
+        if sender and self.is_managed_signer(sender):
+            await asyncio.to_thread(self.nonce_manager.release, sender, nonce, error)
+
+    async def _send_signed_transaction(self, signed_txn, transaction):
+        """Send a signed transaction, handing the nonce back to the manager if the node rejects it"""
+        raw_tx = getattr(
+            signed_txn, "raw_transaction", getattr(signed_txn, "rawTransaction", None)
+        )
+        if raw_tx is None:
+            raise ValueError("Could not access raw transaction data")
+        try:
+            with sticky_route(transaction.get("from")):
+                return await self.w3.eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            await self._release_nonce(transaction.get("from"), transaction["nonce"], e)
+            raise
+
+    async def _build_transaction_for(
+        self, function_call, sender, gas=None, gas_price_gwei=None
+    ):
+        """Build a transaction for `sender`, returning the nonce if building fails"""
+        gas = gas or config.DEFAULT_GAS
+        gas_price_gwei = gas_price_gwei or config.DEFAULT_GAS_PRICE_GWEI
+
+        nonce = await self.get_next_nonce(sender)
+        try:
+            return await function_call.build_transaction(
+                {
+                    "from": sender,
+                    "nonce": nonce,
+                    "chainId": await self.get_chain_id(),
+                    "gas": gas,
+                    "gasPrice": self.w3.to_wei(gas_price_gwei, "gwei"),
+                }
+            )
+        except Exception as e:
+            await self._release_nonce(sender, nonce, e)
+            raise
+
+    async def acquire_signer(self):
+        """Least-loaded oracle pool signer"""
+        if len(self.signer_pool) == 1:
+            return self.oracle_account
+        return await asyncio.to_thread(self.signer_pool.acquire)
+
+    async def build_transaction(
+        self, function_call, gas=None, gas_price_gwei=None, signer=None
+    ):
+        """Build an oracle transaction, from the least-loaded pool signer unless `signer` is given"""
+        signer = signer or await self.acquire_signer()
+        return await self._build_transaction_for(
+            function_call, signer.address, gas, gas_price_gwei
+        )
+
+    async def sign_and_send_transaction(self, transaction):
+        """Sign an oracle transaction with the pool signer it was built for and send it"""
+        signer = self.signer_pool.account_for(transaction["from"])
+        signed_txn = await self.signing_executor.sign_async(signer, transaction)
+        return await self._send_signed_transaction(signed_txn, transaction)
+
+    async def send_transaction_batch(
+        self, items, gas=None, gas_price_gwei=None, signer=None
+    ):
+        """
+        Send (function_call, value) oracle transactions from one signer back to back.
+
+        The nonces come from a single allocation, the transactions are signed together
+        and submitted in one JSON-RPC batch in nonce order, so nothing waits for an
+        earlier transaction to be accepted. An item may carry its own gas limit as a
+        third element. Returns BatchSendResults: the hash, or the exception, per item.
+
+        A rejected item leaves a gap that the node would hold every later item of the
+        batch behind, and resubmitting those on new nonces would run them twice once
+        anything lands in the gap. The gap is closed instead with a zero-value
+        transfer to the signer itself, so the later items keep their hashes and run.
+        """
+        signer = signer or await self.acquire_signer()
+        gas = gas or config.DEFAULT_GAS
+        gas_price = self.w3.to_wei(
+            gas_price_gwei or config.DEFAULT_GAS_PRICE_GWEI, "gwei"
+        )
+        first_nonce = await asyncio.to_thread(
+            self.nonce_manager.allocate, signer.address, len(items)
+        )
+        try:
+            chain_id = await self.get_chain_id()
+            transactions = [
+                await function_call.build_transaction(
+                    {
+                        "from": signer.address,
+                        "nonce": first_nonce + offset,
+                        "chainId": chain_id,
+                        "gas": item_gas[0] if item_gas else gas,
+                        "gasPrice": gas_price,
+                        "value": value,
+                    }
+                )
+                for offset, (function_call, value, *item_gas) in enumerate(items)
+            ]
+            signed = await asyncio.to_thread(
+                self.signing_executor.sign_many,
+                [(signer, transaction) for transaction in transactions],
+            )
+            with sticky_route(signer.address):
+                responses = await self.w3.provider.make_batch_request(
+                    [
+                        ("eth_sendRawTransaction", [txn.raw_transaction.to_0x_hex()])
+                        for txn in signed
+                    ]
+                )
+            if not isinstance(responses, list):
+                raise ValueError(f"Batch send failed: {responses}")
+        except Exception:
+            # None of the allocated nonces is known to be used
+            await asyncio.to_thread(self.nonce_manager.resync, signer.address)
+            raise
+
+        results = []
+        for response in responses:
+            if response.get("result"):
+                results.append(HexBytes(response["result"]))
+            else:
+                results.append(ValueError(response.get("error", response)))
+
+        accepted = [
+            offset
+            for offset, result in enumerate(results)
+            if not isinstance(result, Exception)
+        ]
+        gaps = [
+            first_nonce + offset
+            for offset, result in enumerate(results)
+            if isinstance(result, Exception) and accepted and offset < accepted[-1]
+        ]
+        stranded = []
+        if gaps and not await self._fill_nonce_gaps(signer, gaps, chain_id, gas_price):
+            stranded = [offset for offset in accepted if first_nonce + offset > gaps[0]]
+        if stranded or (results and isinstance(results[-1], Exception)):
+            # The counter is ahead of what the node has; start again from the chain
+            await asyncio.to_thread(self.nonce_manager.resync, signer.address)
+        return BatchSendResults(results, stranded)
+
+    async def _fill_nonce_gaps(self, signer, nonces, chain_id, gas_price) -> bool:
+        """Send zero-value self-transfers on `nonces`; True if the node took them all"""
+        transactions = [
+            {
+                "from": signer.address,
+                "to": signer.address,
+                "value": 0,
+                "nonce": nonce,
+                "chainId": chain_id,
+                "gas": 21000,
+                "gasPrice": gas_price,
+            }
+            for nonce in nonces
+        ]
+        try:
+            signed = await asyncio.to_thread(
+                self.signing_executor.sign_many,
+                [(signer, transaction) for transaction in transactions],
+            )
+            with sticky_route(signer.address):
+                responses = await self.w3.provider.make_batch_request(
+                    [
+                        ("eth_sendRawTransaction", [txn.raw_transaction.to_0x_hex()])
+                        for txn in signed
+                    ]
+                )
+        except Exception as e:
+            print(f"⚠️  Failed to fill nonce gaps {nonces} of {signer.address}: {e}")
+            return False
+        if not isinstance(responses, list) or not all(
+            response.get("result") for response in responses
+        ):
+            print(
+                f"⚠️  Nonce gaps {nonces} of {signer.address} not filled: {responses}"
+            )
+            return False
+        print(f"🩹 Filled nonce gaps {nonces} of {signer.address}")
+        return True
+
+    async def build_user_transaction(
+        self, function_call, user_account, gas=None, gas_price_gwei=None
+    ):
+        """Build a transaction for a specific user account"""
+        return await self._build_transaction_for(
+            function_call, user_account.address, gas, gas_price_gwei
+        )
+
+    async def sign_and_send_user_transaction(self, transaction, user_account):
+        """Sign and send a transaction with a user account"""
+        signed_txn = await self.signing_executor.sign_async(user_account, transaction)
+        return await self._send_signed_transaction(signed_txn, transaction)
+
+    async def wait_for_transaction_receipt(self, tx_hash, timeout=120):
+        """Wait for a transaction to be mined without blocking the event loop"""
+        receipt = await self.w3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout
+        )
+        self.read_cache.observe_block(receipt["blockNumber"])
+        return receipt
+
+    def get_user_account(self, wallet_address: str, private_key: str):
+        """Get a user account object from wallet credentials"""
+        return self.sync_manager.get_user_account(wallet_address, private_key)
+
+    def get_user_account_by_index(self, account_index: int):
+        """Get a user account by index (0-9) for testing - legacy method"""
+        return self.sync_manager.get_user_account_by_index(account_index)
+
+    async def get_account_balance(self, address):
+        """Get ETH balance of an account"""
+        return await self.w3.eth.get_balance(address)
+
+    async def get_points_balance(self, user_address: str) -> int:
+        """Return LoyaltyPoint balance (token units) for a user."""
+        return await self.loyalty_point.functions.balanceOf(
+            self.w3.to_checksum_address(user_address)
+        ).call()
+
+    async def get_points_allowance(self, owner: str) -> int:
+        """Allowance that 'owner' has granted to the LoyaltySystem."""
+        return await self.loyalty_point.functions.allowance(
+            self.w3.to_checksum_address(owner),
+            self.w3.to_checksum_address(self.loyalty_system.address),
+        ).call()
+
+    async def preview_points_available(self, user_address: str, ticket_wei: int) -> int:
+        """How many points can be redeemed (partial up to 30%) for a given ticket price."""
+        return await self.loyalty_system.functions.previewPointsAvailableForRedemption(
+            self.w3.to_checksum_address(user_address), int(ticket_wei)
+        ).call()
+
+    async def quote_ticket_redemption(self, user_address: str, ticket_wei: int):
+        """
+        (allowance, points, wei discount) that redeemPointsTicket would give right now.
+
+        Mirrors LoyaltySystem: the points are previewPointsAvailableForRedemption and
+        the discount is quoteWeiFromPoints of them, from one batched read at one block.
+        """
+        user = self.w3.to_checksum_address(user_address)
+        allowance, points, points_per_ether = await self.batch_call(
+            [
+                self.loyalty_point.functions.allowance(
+                    user, self.w3.to_checksum_address(self.loyalty_system.address)
+                ),
+                self.loyalty_system.functions.previewPointsAvailableForRedemption(
+                    user, int(ticket_wei)
+                ),
+                self.loyalty_system.functions.pointsPerEther(),
+            ],
+            block_identifier=await self.latest_block(),
+        )
+        discount = points * 10**18 // points_per_ether if points > 0 else 0
+        return allowance, points, discount
+
+    async def quote_wei_from_points(self, point_units: int) -> int:
+        """Convert points -> wei using LoyaltySystem's current rate."""
+        return await self.loyalty_system.functions.quoteWeiFromPoints(
+            int(point_units)
+        ).call()
+
+    async def redeem_loyalty_points_queue(self, to_address: str, point_redeemed: int):
+        """Submit a redeemPointsQueue transaction and return its hash without waiting for it to be mined."""
+        function_call = self.loyalty_system.functions.redeemPointsQueue(
+            self.w3.to_checksum_address(to_address), int(point_redeemed)
+        )
+
+        # Build and send the transaction from the oracle account;
+        # the PointsRedeemedQueue event is decoded later by the transaction tracker
+        txn = await self.build_transaction(function_call, gas=200000)
+        return await self.sign_and_send_transaction(txn)
+
+
+# Create singleton instances
 web3_manager = Web3Manager()
+async_web3_manager = AsyncWeb3Manager(web3_manager)
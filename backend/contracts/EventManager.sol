@@ -95,6 +95,7 @@ contract EventManager {
     address public ticketNFTAddress; // Address of the TicketNFT contract
     address public loyaltySystemAddress; // Address of the LoyaltySystem contract
     address public oracle; // Address of the oracle
+    mapping(address => bool) public isOracle; // Additional oracle signers (signer pool)
     address public owner; // Contract owner
 
     event EventCreated(uint256 eventId, string name, address organiser);
@@ -122,6 +123,7 @@ contract EventManager {
         address user2
     );
     event EventClosed(uint256 eventId);
+    event OracleAuthorisationSet(address oracle, bool authorised);
 
     // Constructor to set the contract owner
     constructor() {
@@ -146,9 +148,12 @@ contract EventManager {
         loyaltySystemAddress = _loyaltySystemAddress;
     }
 
-    // Modifier to restrict access to oracle
+    // Modifier to restrict access to the oracle or an authorised pool signer
     modifier oracleOnly() {
-        require(oracle == msg.sender, "Not the oracle");
+        require(
+            oracle == msg.sender || isOracle[msg.sender],
+            "Not the oracle"
+        );
         _;
     }
 
@@ -616,6 +621,16 @@ contract EventManager {
         oracle = _oracle;
     }
 
+    // Authorise or revoke an additional oracle signer
+    function setOracleAuthorised(
+        address _oracle,
+        bool authorised
+    ) public onlyOwner {
+        require(_oracle != address(0), "Oracle cannot be zero address");
+        isOracle[_oracle] = authorised;
+        emit OracleAuthorisationSet(_oracle, authorised);
+    }
+
     // Transfer ownership to a new owner
     function transferOwnership(address newOwner) public onlyOwner {
         require(newOwner != address(0), "New owner cannot be zero address");
@@ -98,6 +98,17 @@ async function main() {
   await eventManager.setOracle(deployer.address);
   console.log("✓ Oracle address set to:", deployer.address);
 
+  // Authorise additional oracle signers (API signer pool), comma-separated addresses
+  const oraclePool = (process.env.ORACLE_POOL_ADDRESSES || "")
+    .split(",")
+    .map((address) => address.trim())
+    .filter((address) => address.length > 0);
+  for (const poolOracle of oraclePool) {
+    console.log("Authorising pool oracle in EventManager...");
+    await (await eventManager.setOracleAuthorised(poolOracle, true)).wait();
+    console.log("✓ Pool oracle authorised:", poolOracle);
+  }
+
   // Set LoyaltySystem the minter for LoyaltyPoint
   console.log("Granting LoyaltySystem minter rights on LoyaltyPoint...");
   await (await loyaltyPoint.setMinter(loyaltySystemAddress)).wait();
@@ -113,6 +124,13 @@ async function main() {
   await (await loyaltySystem.setSpender(deployer.address, true)).wait();
   console.log("✓ Oracle spender authorised:", deployer.address);
 
+  // Pool oracles also award/redeem loyalty points directly
+  for (const poolOracle of oraclePool) {
+    console.log("Authorising pool oracle as spender in LoyaltySystem...");
+    await (await loyaltySystem.setSpender(poolOracle, true)).wait();
+    console.log("✓ Pool oracle spender authorised:", poolOracle);
+  }
+
   // Set Loyalty System in Event Manager (TODO)
   // console.log("Setting LoyaltySystem in EventManager...");
   // await (await eventManager.setLoyaltySystem(loyaltySystemAddress)).wait();
@@ -415,6 +415,62 @@ describe("EventManager", function () {
       ).to.be.revertedWith("Not the oracle");
     });
 
+    it("Should allow authorised pool oracles alongside the primary oracle", async function () {
+      const poolOracle = otherUser;
+
+      await expect(
+        eventManager.setOracleAuthorised(poolOracle.address, true)
+      )
+        .to.emit(eventManager, "OracleAuthorisationSet")
+        .withArgs(poolOracle.address, true);
+      expect(await eventManager.isOracle(poolOracle.address)).to.equal(true);
+
+      for (let i = 0; i < 2; i++) {
+        await eventManager
+          .connect(organiser)
+          .createEvent(
+            "Test Event",
+            "Test Venue",
+            Math.floor(Date.now() / 1000) + 86400,
+            ethers.parseEther("0.1"),
+            100
+          );
+      }
+
+      // Both the primary oracle and the pool oracle can close events
+      await expect(eventManager.connect(oracle).closeEvent(1)).to.not.be
+        .reverted;
+      await expect(eventManager.connect(poolOracle).closeEvent(2)).to.not.be
+        .reverted;
+    });
+
+    it("Should reject revoked pool oracles", async function () {
+      await eventManager.setOracleAuthorised(otherUser.address, true);
+      await eventManager.setOracleAuthorised(otherUser.address, false);
+
+      await eventManager
+        .connect(organiser)
+        .createEvent(
+          "Test Event",
+          "Test Venue",
+          Math.floor(Date.now() / 1000) + 86400,
+          ethers.parseEther("0.1"),
+          100
+        );
+
+      await expect(
+        eventManager.connect(otherUser).closeEvent(1)
+      ).to.be.revertedWith("Not the oracle");
+    });
+
+    it("Should only allow the owner to authorise pool oracles", async function () {
+      await expect(
+        eventManager
+          .connect(otherUser)
+          .setOracleAuthorised(otherUser.address, true)
+      ).to.be.revertedWith("Not the owner");
+    });
+
     it("Should reject minting when TicketNFT address not set", async function () {
       // Deploy new EventManager without setting TicketNFT address
       const EventManager = await ethers.getContractFactory("EventManager");